@@ -0,0 +1,23 @@
+-- sessions のトークン列を SHA-256 ダイジェスト（bytea）に変更する
+--
+-- 既存の行は平文（またはハッシュ化前の形式）のトークンを保持しており、
+-- ダイジェストへ変換できないため、全セッションを削除して無効化する。
+-- 適用後は全ユーザーの再ログインが必要になる。
+BEGIN;
+
+TRUNCATE TABLE sessions;
+
+-- 旧スキーマの一意制約を、domains.Session と同じ一意インデックスに置き換える
+ALTER TABLE sessions DROP CONSTRAINT IF EXISTS sessions_access_token_key;
+ALTER TABLE sessions DROP CONSTRAINT IF EXISTS sessions_refresh_token_key;
+
+ALTER TABLE sessions
+    ALTER COLUMN access_token TYPE bytea USING access_token::bytea,
+    ALTER COLUMN refresh_token TYPE bytea USING refresh_token::bytea;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_sessions_access_token
+    ON sessions (access_token);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_sessions_refresh_token
+    ON sessions (refresh_token);
+
+COMMIT;
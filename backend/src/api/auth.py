@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import cast
 
 from database import get_session
@@ -10,7 +10,7 @@ from repository.session_repository import SessionRepositoryIf, SessionRepository
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from utils.utils import (
-    ACCESS_TOKEN_EXPIRE_MINUTES,
+    ACCESS_TOKEN_EXPIRES_DELTA,
     create_token,
     hash_token,
     verify_token,
@@ -74,9 +74,8 @@ async def refresh_access_token(
 
     # データベースでセッションを確認
     try:
-        # トークンをハッシュ化して検索
         session_obj = await session_repo.get_session_by_refresh_token(
-            session, hash_token(request.refresh_token)
+            session, request.refresh_token
         )
         if not session_obj or session_obj.revoked_at is not None:
             raise HTTPException(
@@ -98,7 +97,7 @@ async def refresh_access_token(
             )
 
         # 新しいアクセストークンを生成
-        access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        access_token_expires = ACCESS_TOKEN_EXPIRES_DELTA
         new_access_token = create_token(
             data={"sub": username},
             token_type="access",
@@ -2,7 +2,7 @@ from uuid import UUID
 
 from database import get_session
 from dependencies import get_injector
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from injector import Injector
 from schema.channel_schema import ChannelGetResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -47,9 +47,12 @@ async def get_channel(
     session: AsyncSession = Depends(get_session),
     usecase: GetChannelMessagesUseCaseIf = Depends(get_usecase),
     _: None = Depends(check_channel_access),  # チャンネルアクセス権限チェック
-) -> ChannelGetResponse:
+) -> Response:
     """チャンネル情報取得エンドポイント
 
+    レスポンスモデルの再検証と dict 経由の変換を省くため、
+    pydantic-core で直接シリアライズした JSON を返す（スキーマ定義は response_model を使用）
+
     Args:
         channel_id (UUID): チャンネルID
         session (AsyncSession, optional): データベースセッション
@@ -62,7 +65,7 @@ async def get_channel(
         HTTPException: サーバー内部エラーが発生しました
 
     Returns:
-        ChannelGetResponse: チャンネル情報
+        Response: チャンネル情報（ChannelGetResponse の JSON）
     """
 
     try:
@@ -71,7 +74,9 @@ async def get_channel(
             f"チャンネル情報が正常に取得されました: channel_id={channel_id}, message_count={len(response.messages)}"
         )
 
-        return response
+        return Response(
+            content=response.model_dump_json(), media_type="application/json"
+        )
 
     except ChannelNotFoundError as e:
         logger.warning(f"チャンネルが見つかりません: {e}")
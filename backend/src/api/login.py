@@ -87,8 +87,8 @@ async def login(
         "id": user.id,
         "name": user.name,
         "username": user.username,
-        "access_token": session_obj.access_token,
-        "refresh_token": session_obj.refresh_token,
+        "access_token": result_usecase.get("access_token"),
+        "refresh_token": result_usecase.get("refresh_token"),
         "token_type": "bearer",
     }
 
@@ -1,14 +1,16 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, LargeBinary, String
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.schema import CheckConstraint, UniqueConstraint
+from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.schema import CheckConstraint, Index, UniqueConstraint
 from sqlalchemy.sql import func
 
 
 class Base(DeclarativeBase):
-    pass
+    # INSERT/UPDATE 時にサーバー側デフォルト値（created_at 等）を RETURNING で取得し、
+    # flush 後の refresh による再SELECTを不要にする
+    __mapper_args__ = {"eager_defaults": True}
 
 
 # モデル: ユーザー
@@ -51,10 +53,10 @@ class Session(Base):
     # ユーザーID
     # 外部キー: users.id
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    # アクセストークンハッシュ（短期間有効）
-    access_token = Column(String, unique=True, nullable=False)
-    # リフレッシュトークンハッシュ（長期間有効）
-    refresh_token = Column(String, unique=True, nullable=False)
+    # アクセストークンハッシュ（SHA-256ダイジェスト、短期間有効）
+    access_token = Column(LargeBinary(32), unique=True, index=True, nullable=False)
+    # リフレッシュトークンハッシュ（SHA-256ダイジェスト、長期間有効）
+    refresh_token = Column(LargeBinary(32), unique=True, index=True, nullable=False)
     # ユーザーエージェント
     user_agent = Column(String, nullable=True)
     # IPアドレス
@@ -79,6 +81,8 @@ class Friend(Base):
         UniqueConstraint("user_id", "related_user_id"),
         # 自己参照防止
         CheckConstraint("user_id != related_user_id", name="check_no_self_friend"),
+        # 相手側からのフレンド検索用（user_id 側は複合ユニーク制約のインデックスを使用）
+        Index("ix_friends_related_user_id", "related_user_id"),
     )
 
     # ID
@@ -135,10 +139,27 @@ class Channel(Base):
         nullable=False,
     )
 
+    # チャネルに属するメッセージ（作成日時順）
+    # last_message_id も messages を参照するため、結合に使う外部キーを明示する
+    # 暗黙の遅延読み込み（N+1）を防ぐため、クエリ側で読み込み方法を指定しない限り例外とする
+    messages = relationship(
+        "Message",
+        back_populates="channel",
+        foreign_keys="Message.channel_id",
+        order_by="Message.created_at",
+        passive_deletes=True,
+        lazy="raise",
+    )
+
 
 # モデル: メッセージ
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        # チャネル内メッセージの時系列取得用の複合インデックス
+        # （channel_id で絞り込み、created_at の順序をソートなしで返す）
+        Index("ix_messages_channel_created", "channel_id", "created_at", "id"),
+    )
 
     # ID
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -175,6 +196,14 @@ class Message(Base):
         nullable=False,
     )
 
+    # 所属チャネル
+    channel = relationship(
+        "Channel",
+        back_populates="messages",
+        foreign_keys=[channel_id],
+        lazy="raise",
+    )
+
 
 # モデル: ギルド
 class Guild(Base):
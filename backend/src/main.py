@@ -12,6 +12,7 @@ from database import create_tables
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from middleware import auth_session
+from utils.api_utils import PydanticJSONResponse
 from utils.logger_utils import get_logger
 
 # ロガーを取得
@@ -32,7 +33,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("アプリケーションを終了します")
 
 
-app = FastAPI(lifespan=lifespan)
+# レスポンスのJSONエンコードは pydantic-core で行う
+app = FastAPI(lifespan=lifespan, default_response_class=PydanticJSONResponse)
 
 # CORS設定
 origins = ["http://localhost:8000", "http://localhost:5173"]
@@ -2,10 +2,9 @@ import os
 from typing import Any, Awaitable, Callable
 
 from database import get_session
+from dependencies import get_injector
 from fastapi import HTTPException, Request, status
-from repository.session_repository import SessionRepositoryImpl
-from repository.user_repository import UserRepositoryImpl
-from usecase.login import LoginUseCaseImpl
+from usecase.login import LoginUseCaseIf
 from utils.utils import is_test_env
 
 # 認証不要のパスリスト（環境変数から取得、デフォルト値あり）
@@ -15,6 +14,10 @@ EXEMPT_PATHS = os.getenv("EXEMPT_PATHS", "/login,/docs,/openapi.json").split(","
 # これらのパスはJWT検証+DBセッション状態確認を行う
 DB_MUTATION_PATHS = os.getenv("DB_MUTATION_PATHS", "/register").split(",")
 
+# 認証ユースケース（リクエストごとに生成せずDIコンテナのシングルトンを使い回す）
+# 保持する状態はイミュータブルな認証ユーザー情報のキャッシュのみのため、リクエスト間で共有しても安全
+_login_usecase: LoginUseCaseIf = get_injector().get(LoginUseCaseIf)
+
 
 async def auth_session(
     req: Request, call_next: Callable[[Request], Awaitable[Any]]
@@ -30,24 +33,20 @@ async def auth_session(
     """
 
     # テスト環境ではセッション認証をスキップ
-    if await is_test_env():
+    if is_test_env():
         return await call_next(req)
 
     # プリフライトリクエスト（OPTIONS）や認証不要のパスをスキップ
     if req.method == "OPTIONS" or req.url.path in EXEMPT_PATHS:
         return await call_next(req)
 
-    usecase = LoginUseCaseImpl(
-        user_repo=UserRepositoryImpl(), session_repo=SessionRepositoryImpl()
-    )
-
     async for session in get_session():
         # DBを更新するリクエストの場合、JWT検証+DBセッション状態確認
         if req.url.path in DB_MUTATION_PATHS:
-            result_auth = await usecase.auth_session(session, req)
+            result_auth = await _login_usecase.auth_session(session, req)
         else:
             # DBを参照するリクエストの場合、JWT検証のみ
-            result_auth = await usecase.auth_jwt_only(session, req)
+            result_auth = await _login_usecase.auth_jwt_only(session, req)
 
         if not result_auth:
             raise HTTPException(
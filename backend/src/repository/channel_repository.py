@@ -7,6 +7,7 @@ from repository.base_exception import BaseRepositoryError
 from repository.decorators import handle_repository_errors
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from utils.logger_utils import get_logger
 
 # ロガーを取得
@@ -80,6 +81,22 @@ class ChannelRepositoryIf(ABC):
 
         pass
 
+    @abstractmethod
+    async def get_channel_with_messages(
+        self, session: AsyncSession, channel_id: str
+    ) -> Optional[Channel]:
+        """チャンネルIDからチャンネルとメッセージ一覧を取得する
+
+        Args:
+            session (AsyncSession): データベースセッション
+            channel_id (str): チャンネルID
+
+        Returns:
+            Optional[Channel]: メッセージ読み込み済みのチャンネル（存在しない場合はNone）
+        """
+
+        pass
+
     # last_message_idの更新メソッド
     @abstractmethod
     async def update_last_message_id(
@@ -118,9 +135,10 @@ class ChannelRepositoryImpl(ChannelRepositoryIf):
 
         session.add(channel)
         await session.flush()  # commit の代わりに flush を使用（IDを取得するため）
-        await session.refresh(channel)
         logger.info(
-            f"チャンネルが正常に作成されました: channel_id={channel.id}, guild_id={channel.guild_id}"
+            "チャンネルが正常に作成されました: channel_id=%s, guild_id=%s",
+            channel.id,
+            channel.guild_id,
         )
 
         return channel
@@ -139,13 +157,46 @@ class ChannelRepositoryImpl(ChannelRepositoryIf):
             Optional[Channel]: チャンネル（存在しない場合はNone）
         """
 
-        result = await session.execute(select(Channel).where(Channel.id == channel_id))
-        channel = result.scalars().first()
+        result = await session.scalars(select(Channel).where(Channel.id == channel_id))
+        channel = result.first()
+
+        if channel:
+            logger.info("チャンネルが見つかりました: channel_id=%s", channel_id)
+        else:
+            logger.info("チャンネルが見つかりませんでした: channel_id=%s", channel_id)
+
+        return channel
+
+    @handle_repository_errors(ChannelQueryError, "チャンネルとメッセージ一覧の取得")
+    async def get_channel_with_messages(
+        self, session: AsyncSession, channel_id: str
+    ) -> Optional[Channel]:
+        """チャンネルIDからチャンネルとメッセージ一覧を取得する
+
+        Args:
+            session (AsyncSession): データベースセッション
+            channel_id (str): チャンネルID
+
+        Returns:
+            Optional[Channel]: メッセージ読み込み済みのチャンネル（存在しない場合はNone）
+        """
+
+        # チャンネルとメッセージを LEFT OUTER JOIN で1回のクエリにまとめて取得する
+        result = await session.scalars(
+            select(Channel)
+            .options(joinedload(Channel.messages))
+            .where(Channel.id == channel_id)
+        )
+        channel = result.unique().first()
 
         if channel:
-            logger.info(f"チャンネルが見つかりました: channel_id={channel_id}")
+            logger.info(
+                "チャンネルとメッセージ一覧を取得しました: channel_id=%s, message_count=%d",
+                channel_id,
+                len(channel.messages),
+            )
         else:
-            logger.info(f"チャンネルが見つかりませんでした: channel_id={channel_id}")
+            logger.info("チャンネルが見つかりませんでした: channel_id=%s", channel_id)
 
         return channel
 
@@ -177,5 +228,7 @@ class ChannelRepositoryImpl(ChannelRepositoryIf):
             raise ChannelNotFoundError(error_msg)
 
         logger.info(
-            f"チャンネルのlast_message_idが正常に更新されました: channel_id={channel_id}, last_message_id={last_message_id}"
+            "チャンネルのlast_message_idが正常に更新されました: channel_id=%s, last_message_id=%s",
+            channel_id,
+            last_message_id,
         )
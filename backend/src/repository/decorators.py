@@ -7,12 +7,42 @@ from utils.logger_utils import get_logger
 
 logger = get_logger(__name__)
 
+# 例外クラスごとのエラーメッセージ（上から順に isinstance で判定する）
+_ERROR_MESSAGES: tuple[tuple[Type[Exception], str], ...] = (
+    (IntegrityError, "データベース制約違反により [{}] に失敗"),
+    (OperationalError, "データベース接続エラーにより [{}] に失敗"),
+    (SQLAlchemyError, "SQLAlchemyエラーにより [{}] に失敗"),
+    (BaseRepositoryError, "その他リポジトリエラーにより [{}] に失敗"),
+)
+_UNEXPECTED_ERROR_MESSAGE = "予期しないエラーにより [{}] に失敗"
+
+
+def _resolve_error_message(error: Exception, operation_name: str) -> str:
+    """例外の種類に応じたエラーメッセージを返す
+
+    Args:
+        error (Exception): 発生した例外
+        operation_name (str): 操作名
+
+    Returns:
+        str: エラーメッセージ
+    """
+
+    for error_type, template in _ERROR_MESSAGES:
+        if isinstance(error, error_type):
+            return template.format(operation_name)
+
+    return _UNEXPECTED_ERROR_MESSAGE.format(operation_name)
+
 
 def handle_repository_errors(
     error_class: Type[Exception], operation_name: str
 ) -> Callable[..., Any]:
     """リポジトリ操作のエラーハンドリングデコレータ
 
+    正常系では try ブロックに入って元の関数を呼び出すだけで、
+    例外の分類・ロールバック・ログ出力はすべて例外発生時にのみ行う。
+
     Args:
         error_class (Type[Exception]): エラークラス
         operation_name (str): 操作名
@@ -26,39 +56,19 @@ def handle_repository_errors(
             try:
                 return await func(*args, **kwargs)
 
-            except IntegrityError as e:
-                await args[1].rollback()  # args[1] = session
-                error_msg = f"データベース制約違反により [{operation_name}] に失敗"
-                logger.error(f"{error_msg}: {e}")
-                raise error_class(error_msg, e)
-
-            except OperationalError as e:
-                if "rollback" in dir(args[1]):
-                    await args[1].rollback()
-                error_msg = f"データベース接続エラーにより [{operation_name}] に失敗"
-                logger.error(f"{error_msg}: {e}")
-                raise error_class(error_msg, e)
+            except Exception as e:
+                # args[1] = session
+                rollback = getattr(args[1], "rollback", None)
+                if rollback is not None:
+                    await rollback()
 
-            except SQLAlchemyError as e:
-                if "rollback" in dir(args[1]):
-                    await args[1].rollback()
-                error_msg = f"SQLAlchemyエラーにより [{operation_name}] に失敗"
-                logger.error(f"{error_msg}: {e}")
-                raise error_class(error_msg, e)
+                error_msg = _resolve_error_message(e, operation_name)
+                logger.error("%s: %s", error_msg, e)
 
-            except BaseRepositoryError as e:
-                if "rollback" in dir(args[1]):
-                    await args[1].rollback()
-                error_msg = f"その他リポジトリエラーにより [{operation_name}] に失敗"
-                logger.error(f"{error_msg}: {e}")
                 # repositoryから定義したカスタムエラーが来る可能性があるため、そのまま再スロー
-                raise
+                if isinstance(e, BaseRepositoryError):
+                    raise
 
-            except Exception as e:
-                if "rollback" in dir(args[1]):
-                    await args[1].rollback()
-                error_msg = f"予期しないエラーにより [{operation_name}] に失敗"
-                logger.error(f"{error_msg}: {e}")
                 raise error_class(error_msg, e)
 
         return wrapper
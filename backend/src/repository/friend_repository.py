@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 from domains import Channel, Friend, Guild, User
 from injector import singleton
 from repository.base_exception import BaseRepositoryError
 from repository.decorators import handle_repository_errors
-from sqlalchemy import Row, or_, select
+from sqlalchemy import Row, bindparam, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 from utils.logger_utils import get_logger
@@ -12,6 +13,51 @@ from utils.logger_utils import get_logger
 # ロガーを取得
 logger = get_logger(__name__)
 
+# フレンド詳細取得用のエイリアス（自分の @me ギルドと相手の @me ギルド）
+_my_guild = aliased(Guild)
+_friend_guild = aliased(Guild)
+_user_id = bindparam("user_id")
+
+# フレンド詳細取得（形が固定のため、モジュール読み込み時に一度だけ構築してパラメータのみ差し替える）
+_SELECT_FRIENDS_WITH_DETAILS = (
+    select(
+        User.name.label("user_name"),
+        User.username.label("user_username"),
+        User.description.label("user_description"),
+        User.created_at.label("user_created_at"),
+        Channel.id.label("channel_id"),
+    )
+    .select_from(Friend)
+    .join(
+        User,
+        or_(
+            # 自分がuser_idの場合、相手はrelated_user_id
+            (Friend.user_id == _user_id) & (User.id == Friend.related_user_id),
+            # 自分がrelated_user_idの場合、相手はuser_id
+            (Friend.related_user_id == _user_id) & (User.id == Friend.user_id),
+        ),
+    )
+    .join(_my_guild, _my_guild.owner_user_id == _user_id)
+    .join(_friend_guild, _friend_guild.owner_user_id == User.id)
+    .join(
+        Channel,
+        or_(
+            # guild_id_me と guild_id_related の組み合わせ
+            (Channel.guild_id == _my_guild.id)
+            & (Channel.related_guild_id == _friend_guild.id),
+            # guild_id_related と guild_id_me の組み合わせ（逆）
+            (Channel.guild_id == _friend_guild.id)
+            & (Channel.related_guild_id == _my_guild.id),
+        ),
+    )
+    .where(
+        or_(Friend.user_id == _user_id, Friend.related_user_id == _user_id)
+        & (_my_guild.name == "@me")
+        & (_friend_guild.name == "@me")
+    )
+    .order_by(Friend.created_at.desc())
+)
+
 
 class FriendRepositoryError(BaseRepositoryError):
     """フレンドリポジトリ例外クラス"""
@@ -55,7 +101,7 @@ class FriendRepositoryIf(ABC):
     @abstractmethod
     async def get_friends_with_details(
         self, session: AsyncSession, user_id: str
-    ) -> list[Row]:
+    ) -> Sequence[Row]:
         """フレンド情報を関連テーブルと結合して取得する
 
         Args:
@@ -63,7 +109,7 @@ class FriendRepositoryIf(ABC):
             user_id (str): ユーザーID
 
         Returns:
-            list[Row]: フレンド詳細情報のリスト
+            Sequence[Row]: フレンド詳細情報のリスト
         """
 
         pass
@@ -91,14 +137,13 @@ class FriendRepositoryImpl(FriendRepositoryIf):
 
         session.add(friend)
         await session.flush()  # commit の代わりに flush を使用（IDを取得するため）
-        await session.refresh(friend)
 
         return friend
 
     @handle_repository_errors(FriendQueryError, "フレンド取得")
     async def get_friends_with_details(
         self, session: AsyncSession, user_id: str
-    ) -> list[Row]:
+    ) -> Sequence[Row]:
         """フレンド情報を関連テーブルと結合して取得する
 
         Args:
@@ -106,52 +151,10 @@ class FriendRepositoryImpl(FriendRepositoryIf):
             user_id (str): ユーザーID
 
         Returns:
-            list[Row]: フレンド詳細情報のリスト
+            Sequence[Row]: フレンド詳細情報のリスト
         """
 
-        # エイリアスを作成
-        my_guild = aliased(Guild)
-        friend_guild = aliased(Guild)
-
-        # JOINクエリを構築
-        stmt = (
-            select(
-                User.name.label("user_name"),
-                User.username.label("user_username"),
-                User.description.label("user_description"),
-                User.created_at.label("user_created_at"),
-                Channel.id.label("channel_id"),
-            )
-            .select_from(Friend)
-            .join(
-                User,
-                or_(
-                    # 自分がuser_idの場合、相手はrelated_user_id
-                    (Friend.user_id == user_id) & (User.id == Friend.related_user_id),
-                    # 自分がrelated_user_idの場合、相手はuser_id
-                    (Friend.related_user_id == user_id) & (User.id == Friend.user_id),
-                ),
-            )
-            .join(my_guild, my_guild.owner_user_id == user_id)
-            .join(friend_guild, friend_guild.owner_user_id == User.id)
-            .join(
-                Channel,
-                or_(
-                    # guild_id_me と guild_id_related の組み合わせ
-                    (Channel.guild_id == my_guild.id)
-                    & (Channel.related_guild_id == friend_guild.id),
-                    # guild_id_related と guild_id_me の組み合わせ（逆）
-                    (Channel.guild_id == friend_guild.id)
-                    & (Channel.related_guild_id == my_guild.id),
-                ),
-            )
-            .where(
-                or_(Friend.user_id == user_id, Friend.related_user_id == user_id)
-                & (my_guild.name == "@me")
-                & (friend_guild.name == "@me")
-            )
-            .order_by(Friend.created_at.desc())
+        result = await session.execute(
+            _SELECT_FRIENDS_WITH_DETAILS, {"user_id": user_id}
         )
-
-        result = await session.execute(stmt)
-        return list(result.fetchall())
+        return result.all()
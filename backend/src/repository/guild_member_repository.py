@@ -46,6 +46,22 @@ class GuildMemberRepositoryIf(ABC):
 
         pass
 
+    @abstractmethod
+    async def create_guild_members(
+        self, session: AsyncSession, guild_members: list[GuildMember]
+    ) -> list[GuildMember]:
+        """複数のギルドメンバーを一括作成する
+
+        Args:
+            session (AsyncSession): データベースセッション
+            guild_members (list[GuildMember]): 作成するギルドメンバー情報リスト
+
+        Returns:
+            list[GuildMember]: 作成されたギルドメンバー情報リスト
+        """
+
+        pass
+
 
 @singleton
 class GuildMemberRepositoryImpl(GuildMemberRepositoryIf):
@@ -71,6 +87,25 @@ class GuildMemberRepositoryImpl(GuildMemberRepositoryIf):
 
         session.add(guild_member)
         await session.flush()  # commit の代わりに flush を使用（IDを取得するため）
-        await session.refresh(guild_member)
 
         return guild_member
+
+    @handle_repository_errors(GuildMemberCreateError, "ギルドメンバー一括作成")
+    async def create_guild_members(
+        self, session: AsyncSession, guild_members: list[GuildMember]
+    ) -> list[GuildMember]:
+        """複数のギルドメンバーを一括作成する
+
+        Args:
+            session (AsyncSession): データベースセッション
+            guild_members (list[GuildMember]): 作成するギルドメンバー情報リスト
+
+        Returns:
+            list[GuildMember]: 作成されたギルドメンバー情報リスト
+        """
+
+        # 同一テーブルへの INSERT は flush 時に1つの INSERT ... VALUES (...), (...) RETURNING にまとめられる
+        session.add_all(guild_members)
+        await session.flush()
+
+        return guild_members
@@ -1,3 +1,4 @@
+import uuid
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -5,13 +6,20 @@ from domains import Channel, Guild, GuildMember
 from injector import singleton
 from repository.base_exception import BaseRepositoryError
 from repository.decorators import handle_repository_errors
-from sqlalchemy import select
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from utils.logger_utils import get_logger
 
 # ロガーを取得
 logger = get_logger(__name__)
 
+# 複数オーナーのギルド検索（配列パラメータ1つで渡し、件数に依らず同一のプリペアドステートメントを再利用する）
+_SELECT_GUILDS_BY_OWNERS_NAME = select(Guild).where(
+    Guild.owner_user_id == any_(bindparam("user_ids", type_=ARRAY(UUID(as_uuid=True)))),
+    Guild.name == bindparam("name"),
+)
+
 
 class GuildRepositoryError(BaseRepositoryError):
     """ギルドリポジトリ例外クラス"""
@@ -68,6 +76,23 @@ class GuildRepositoryIf(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_guilds_by_user_ids_name(
+        self, session: AsyncSession, user_ids: list[uuid.UUID], name: str
+    ) -> dict[uuid.UUID, Guild]:
+        """複数のオーナーのユーザーIDとギルド名から、ギルドをまとめて取得する
+
+        Args:
+            session (AsyncSession): データベースセッション
+            user_ids (list[uuid.UUID]): ギルドのオーナーのユーザーIDリスト
+            name (str): ギルド名
+
+        Returns:
+            dict[uuid.UUID, Guild]: オーナーのユーザーIDをキーとしたギルド情報
+        """
+
+        pass
+
     @abstractmethod
     async def get_guild_by_member_channel(
         self, session: AsyncSession, member_id: str, channel_id: str
@@ -108,7 +133,6 @@ class GuildRepositoryImpl(GuildRepositoryIf):
 
         session.add(guild)
         await session.flush()  # commit の代わりに flush を使用（IDを取得するため）
-        await session.refresh(guild)
 
         return guild
 
@@ -127,11 +151,32 @@ class GuildRepositoryImpl(GuildRepositoryIf):
             Guild: ギルド情報
         """
 
-        result = await session.execute(
+        result = await session.scalars(
             select(Guild).where(Guild.owner_user_id == user_id, Guild.name == name)
         )
 
-        return result.scalars().first()
+        return result.first()
+
+    @handle_repository_errors(GuildQueryError, "複数ギルド取得")
+    async def get_guilds_by_user_ids_name(
+        self, session: AsyncSession, user_ids: list[uuid.UUID], name: str
+    ) -> dict[uuid.UUID, Guild]:
+        """複数のオーナーのユーザーIDとギルド名から、ギルドをまとめて取得する
+
+        Args:
+            session (AsyncSession): データベースセッション
+            user_ids (list[uuid.UUID]): ギルドのオーナーのユーザーIDリスト
+            name (str): ギルド名
+
+        Returns:
+            dict[uuid.UUID, Guild]: オーナーのユーザーIDをキーとしたギルド情報
+        """
+
+        result = await session.scalars(
+            _SELECT_GUILDS_BY_OWNERS_NAME, {"user_ids": user_ids, "name": name}
+        )
+
+        return {guild.owner_user_id: guild for guild in result}
 
     @handle_repository_errors(GuildQueryError, "ギルド取得")
     async def get_guild_by_member_channel(
@@ -148,13 +193,13 @@ class GuildRepositoryImpl(GuildRepositoryIf):
             Optional[Guild]: ギルド情報
         """
 
-        result = await session.execute(
+        result = await session.scalars(
             select(Guild)
             .join(GuildMember, Guild.id == GuildMember.guild_id)
             .join(Channel, Guild.id == Channel.guild_id)
             .where(GuildMember.user_id == member_id, Channel.id == channel_id)
         )
-        guild = result.scalars().first()
+        guild = result.first()
 
         if guild:
             logger.info(
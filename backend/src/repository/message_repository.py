@@ -1,11 +1,14 @@
+import uuid
 from abc import ABC, abstractmethod
+from typing import Sequence
 
-from domains import Message
+from domains import Channel, Message
 from injector import singleton
 from repository.base_exception import BaseRepositoryError
 from repository.decorators import handle_repository_errors
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from utils.logger_utils import get_logger
 
 # ロガーを取得
@@ -41,6 +44,28 @@ class MessageRepositoryIf(ABC):
     async def create_message(self, session: AsyncSession, message: Message) -> Message:
         """メッセージを作成する
 
+        flush のみを行い、commit は行わない。
+        トランザクションの確定（commit / rollback）は呼び出し側の責務とする。
+
+        Args:
+            session (AsyncSession): データベースセッション
+            message (Message): 作成するメッセージ情報
+
+        Returns:
+            Message: 作成されたメッセージ情報
+        """
+
+        pass
+
+    @abstractmethod
+    async def create_message_with_channel_update(
+        self, session: AsyncSession, message: Message
+    ) -> Message:
+        """メッセージを作成し、チャネルの最終メッセージIDを同時に更新する
+
+        INSERT と UPDATE を1つの文（CTE）で実行する。
+        commit は行わない。トランザクションの確定は呼び出し側の責務とする。
+
         Args:
             session (AsyncSession): データベースセッション
             message (Message): 作成するメッセージ情報
@@ -54,7 +79,7 @@ class MessageRepositoryIf(ABC):
     @abstractmethod
     async def get_message_by_channel_id(
         self, session: AsyncSession, channel_id: str
-    ) -> list[Message]:
+    ) -> Sequence[Message]:
         """チャネルIDからメッセージを取得する
 
         Args:
@@ -62,7 +87,7 @@ class MessageRepositoryIf(ABC):
             channel_id (str): チャネルID
 
         Returns:
-            list[Message]: メッセージ情報のリスト
+            Sequence[Message]: メッセージ情報のリスト
         """
 
         pass
@@ -90,17 +115,68 @@ class MessageRepositoryImpl(MessageRepositoryIf):
 
         session.add(message)
         await session.flush()  # commit の代わりに flush を使用（IDを取得するため）
-        await session.refresh(message)
         logger.info(
-            f"メッセージが正常に作成されました: message_id={message.id}, channel_id={message.channel_id}"
+            "メッセージが正常に作成されました: message_id=%s, channel_id=%s",
+            message.id,
+            message.channel_id,
         )
 
         return message
 
+    @handle_repository_errors(MessageCreateError, "メッセージ作成・チャネル更新")
+    async def create_message_with_channel_update(
+        self, session: AsyncSession, message: Message
+    ) -> Message:
+        """メッセージを作成し、チャネルの最終メッセージIDを同時に更新する
+
+        Args:
+            session (AsyncSession): データベースセッション
+            message (Message): 作成するメッセージ情報
+
+        Returns:
+            Message: 作成されたメッセージ情報
+        """
+
+        # WITH inserted AS (INSERT ... RETURNING *),
+        #      updated AS (UPDATE channels ... FROM inserted)
+        # SELECT * FROM inserted
+        # チャネルが存在しない場合は外部キー制約違反（IntegrityError）となる
+        inserted = (
+            insert(Message)
+            .values(
+                id=message.id or uuid.uuid4(),
+                channel_id=message.channel_id,
+                user_id=message.user_id,
+                type=message.type,
+                content=message.content,
+                referenced_message_id=message.referenced_message_id,
+            )
+            .returning(*Message.__table__.c)
+            .cte("inserted")
+        )
+        updated = (
+            update(Channel)
+            .values(last_message_id=inserted.c.id)
+            .where(Channel.id == inserted.c.channel_id)
+            .returning(Channel.id)
+            .cte("updated")
+        )
+        result = await session.execute(
+            select(aliased(Message, inserted)).add_cte(updated)
+        )
+        message_db = result.scalar_one()
+        logger.info(
+            "メッセージが正常に作成されました: message_id=%s, channel_id=%s",
+            message_db.id,
+            message_db.channel_id,
+        )
+
+        return message_db
+
     @handle_repository_errors(MessageQueryError, "メッセージ取得")
     async def get_message_by_channel_id(
         self, session: AsyncSession, channel_id: str
-    ) -> list[Message]:
+    ) -> Sequence[Message]:
         """チャネルIDからメッセージを取得する
 
         Args:
@@ -108,17 +184,17 @@ class MessageRepositoryImpl(MessageRepositoryIf):
             channel_id (str): チャネルID
 
         Returns:
-            list[Message]: メッセージ情報のリスト
+            Sequence[Message]: メッセージ情報のリスト
         """
 
-        result = await session.execute(
+        result = await session.scalars(
             select(Message)
             .where(Message.channel_id == channel_id)
             .order_by(Message.created_at)
         )
-        messages = list(result.scalars().all())
+        messages = result.all()
         logger.info(
-            f"チャネル {channel_id} のメッセージを {len(messages)} 件取得しました"
+            "チャネル %s のメッセージを %d 件取得しました", channel_id, len(messages)
         )
 
         return messages
@@ -1,16 +1,28 @@
 from abc import ABC, abstractmethod
 
-from domains import Session
+from domains import Session, User
 from injector import singleton
 from repository.base_exception import BaseRepositoryError
 from repository.decorators import handle_repository_errors
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from utils.logger_utils import get_logger
+from utils.utils import hash_token
 
 # ロガーを取得
 logger = get_logger(__name__)
 
+# アクセストークンハッシュから有効なセッションのユーザーを取得するクエリ
+# （セッション状態の確認とユーザー取得を1回の往復で行う）
+_SELECT_ACTIVE_USER_BY_ACCESS_TOKEN = (
+    select(User)
+    .join(Session, Session.user_id == User.id)
+    .where(
+        Session.access_token == bindparam("access_token"),
+        Session.revoked_at.is_(None),
+    )
+)
+
 
 class SessionRepositoryError(BaseRepositoryError):
     """セッションリポジトリ例外クラス"""
@@ -43,9 +55,13 @@ class SessionRepositoryIf(ABC):
     ) -> Session:
         """セッションを作成する
 
+        flush のみを行い、commit は行わない。
+        トランザクションの確定（commit / rollback）は呼び出し側の責務とする。
+        session_data のトークンは平文で渡し、リポジトリ内でハッシュ化して保存する。
+
         Args:
             session (AsyncSession): データベースセッション
-            session_data (Session): セッションデータ
+            session_data (Session): セッションデータ（トークンは平文）
 
         Returns:
             Session: 作成されたセッション
@@ -61,7 +77,7 @@ class SessionRepositoryIf(ABC):
 
         Args:
             session (AsyncSession): データベースセッション
-            token (str): セッショントークン
+            token (str): リフレッシュトークン（平文）
 
         Returns:
             Session | None: 取得されたセッション(見つからない場合はNone)
@@ -70,17 +86,17 @@ class SessionRepositoryIf(ABC):
         pass
 
     @abstractmethod
-    async def get_session_by_access_token(
+    async def get_user_by_access_token(
         self, session: AsyncSession, access_token: str
-    ) -> Session | None:
-        """アクセストークンからセッションを取得する
+    ) -> User | None:
+        """アクセストークンに対応する有効なセッションのユーザーを取得する
 
         Args:
             session (AsyncSession): データベースセッション
-            access_token (str): アクセストークン
+            access_token (str): アクセストークン（平文）
 
         Returns:
-            Session | None: 取得されたセッション(見つからない場合はNone)
+            User | None: 無効化されていないセッションのユーザー（見つからない場合はNone）
         """
 
         pass
@@ -108,9 +124,12 @@ class SessionRepositoryImpl(SessionRepositoryIf):
             Session: 作成されたセッション
         """
 
+        # トークンはハッシュ化（SHA-256ダイジェスト）して保存する
+        session_data.access_token = hash_token(str(session_data.access_token))
+        session_data.refresh_token = hash_token(str(session_data.refresh_token))
+
         session.add(session_data)
-        await session.commit()
-        await session.refresh(session_data)
+        await session.flush()  # commit の代わりに flush を使用（IDを取得するため）
 
         return session_data
 
@@ -122,34 +141,35 @@ class SessionRepositoryImpl(SessionRepositoryIf):
 
         Args:
             session (AsyncSession): データベースセッション
-            token (str): セッショントークン
+            token (str): リフレッシュトークン（平文）
 
         Returns:
             Session | None: 取得されたセッション（見つからない場合はNone）
         """
 
-        result = await session.execute(
-            select(Session).where(Session.refresh_token == token)
+        result = await session.scalars(
+            select(Session).where(Session.refresh_token == hash_token(token))
         )
 
-        return result.scalars().first()
+        return result.first()
 
-    @handle_repository_errors(SessionQueryError, "セッション取得")
-    async def get_session_by_access_token(
+    @handle_repository_errors(SessionQueryError, "セッションユーザー取得")
+    async def get_user_by_access_token(
         self, session: AsyncSession, access_token: str
-    ) -> Session | None:
-        """アクセストークンからセッションを取得する
+    ) -> User | None:
+        """アクセストークンに対応する有効なセッションのユーザーを取得する
 
         Args:
             session (AsyncSession): データベースセッション
-            access_token (str): アクセストークン
+            access_token (str): アクセストークン（平文）
 
         Returns:
-            Session | None: 取得されたセッション（見つからない場合はNone）
+            User | None: 無効化されていないセッションのユーザー（見つからない場合はNone）
         """
 
         result = await session.execute(
-            select(Session).where(Session.access_token == access_token)
+            _SELECT_ACTIVE_USER_BY_ACCESS_TOKEN,
+            {"access_token": hash_token(access_token)},
         )
 
-        return result.scalars().first()
+        return result.scalar_one_or_none()
@@ -1,16 +1,51 @@
+import uuid
 from abc import ABC, abstractmethod
+from typing import Any, Mapping, Sequence
 
-from domains import User
+from domains import Guild, GuildMember, User
 from injector import singleton
 from repository.base_exception import BaseRepositoryError
 from repository.decorators import handle_repository_errors
-from sqlalchemy import select
+from sqlalchemy import String, any_, bindparam, insert, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from utils.logger_utils import get_logger
 
 # ロガーを取得
 logger = get_logger(__name__)
 
+# この件数以上の一括作成では COPY プロトコルを使用する
+BULK_COPY_THRESHOLD = 50
+
+# COPY で書き込むカラム（作成日時・更新日時はサーバー側のデフォルト値を使用）
+_BULK_COPY_COLUMNS = ["id", "name", "username", "email", "password_hash", "description"]
+
+# ユーザー名検索（パラメータのみ差し替えて再利用する）
+_SELECT_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+
+# 複数ユーザー名検索（配列パラメータ1つで渡し、件数に依らず同一のプリペアドステートメントを再利用する）
+_SELECT_USERS_BY_USERNAMES = select(User).where(
+    User.username == any_(bindparam("usernames", type_=ARRAY(String)))
+)
+
+# 複数ユーザー検索で返すカラム（パスワードハッシュは含めない）
+_PUBLIC_USER_COLUMNS = (
+    "id",
+    "name",
+    "username",
+    "email",
+    "description",
+    "created_at",
+    "updated_at",
+)
+
+# 複数ユーザー検索（ORMのハイドレーション・identity map登録を避けるため、Coreのカラムを直接取得する）
+# IN (...) の展開ではなく配列パラメータ1つで渡し、件数に依らず同一のプリペアドステートメントを再利用する
+_SELECT_USERS_BY_IDS = select(
+    *(User.__table__.c[name] for name in _PUBLIC_USER_COLUMNS)
+).where(User.id == any_(bindparam("ids", type_=ARRAY(UUID(as_uuid=True)))))
+
 
 class UserRepositoryError(BaseRepositoryError):
     """ユーザーリポジトリ例外クラス"""
@@ -41,6 +76,8 @@ class UserRepositoryIf(ABC):
     async def create_user(self, session: AsyncSession, user: User) -> User:
         """ユーザーを作成する
 
+        commit は行わない。トランザクションの確定は呼び出し側の責務とする。
+
         Args:
             session (AsyncSession): データベースセッション
             user (User): 作成するユーザー情報
@@ -51,6 +88,38 @@ class UserRepositoryIf(ABC):
 
         pass
 
+    @abstractmethod
+    async def create_user_with_guild(
+        self, session: AsyncSession, user: User
+    ) -> tuple[User, uuid.UUID]:
+        """ユーザーと、そのユーザーの @me ギルド・ギルドメンバーを同時に作成する
+
+        3つの INSERT を1つの文（CTE）で実行する。
+        commit は行わない。トランザクションの確定は呼び出し側の責務とする。
+
+        Args:
+            session (AsyncSession): データベースセッション
+            user (User): 作成するユーザー情報
+
+        Returns:
+            tuple[User, uuid.UUID]: 作成されたユーザー情報とギルドID
+        """
+
+        pass
+
+    @abstractmethod
+    async def create_users_bulk(self, session: AsyncSession, users: list[User]) -> None:
+        """複数のユーザーを一括作成する
+
+        commit は行わない。トランザクションの確定は呼び出し側の責務とする。
+
+        Args:
+            session (AsyncSession): データベースセッション
+            users (list[User]): 作成するユーザー情報リスト
+        """
+
+        pass
+
     @abstractmethod
     async def get_user_by_id(self, session: AsyncSession, user_id: str) -> User | None:
         """IDでユーザーを取得する
@@ -76,18 +145,37 @@ class UserRepositoryIf(ABC):
 
         pass
 
+    @abstractmethod
+    async def get_users_by_usernames(
+        self, session: AsyncSession, usernames: list[str]
+    ) -> dict[str, User]:
+        """複数のユーザー名からユーザーをまとめて取得する
+
+        Args:
+            session (AsyncSession): データベースセッション
+            usernames (list[str]): ユーザー名リスト
+
+        Returns:
+            dict[str, User]: ユーザー名をキーとしたユーザー情報（存在しないユーザー名は含まない）
+        """
+
+        pass
+
     @abstractmethod
     async def get_users_by_id(
         self, session: AsyncSession, user_id_list: list[str]
-    ) -> list[User]:
+    ) -> Sequence[Mapping[str, Any]]:
         """複数のユーザーを取得する
 
+        ORMインスタンスではなく、パスワードハッシュを除くカラムの
+        マッピング（id, name, username, email, description, created_at, updated_at）を返す。
+
         Args:
             session (AsyncSession): データベースセッション
             user_id_list (list[str]): ユーザーIDリスト
 
         Returns:
-            list[User]: ユーザーリスト
+            Sequence[Mapping[str, Any]]: ユーザー情報のマッピングリスト
         """
 
         pass
@@ -113,11 +201,143 @@ class UserRepositoryImpl(UserRepositoryIf):
             User: 作成されたユーザー情報
         """
 
-        session.add(user)
-        await session.flush()  # commit の代わりに flush を使用（IDを取得するため）
-        await session.refresh(user)
+        # INSERT ... RETURNING でサーバー側デフォルト値（created_at等）も同時に取得し、
+        # refresh による再SELECTを省略する（commit は呼び出し側の責務）
+        stmt = (
+            insert(User)
+            .values(
+                name=user.name,
+                username=user.username,
+                email=user.email,
+                password_hash=user.password_hash,
+                description=user.description,
+            )
+            .returning(User)
+        )
+        result = await session.execute(stmt)
+        created_user = result.scalar_one()
 
-        return user
+        return created_user
+
+    @handle_repository_errors(UserCreateError, "ユーザー作成")
+    async def create_user_with_guild(
+        self, session: AsyncSession, user: User
+    ) -> tuple[User, uuid.UUID]:
+        """ユーザーと、そのユーザーの @me ギルド・ギルドメンバーを同時に作成する
+
+        Args:
+            session (AsyncSession): データベースセッション
+            user (User): 作成するユーザー情報
+
+        Returns:
+            tuple[User, uuid.UUID]: 作成されたユーザー情報とギルドID
+        """
+
+        # WITH inserted_user AS (INSERT INTO users ... RETURNING *),
+        #      inserted_guild AS (INSERT INTO guilds ... SELECT ... FROM inserted_user RETURNING ...),
+        #      inserted_member AS (INSERT INTO guild_members ... SELECT ... FROM inserted_guild)
+        # SELECT inserted_user.*, inserted_guild.id FROM inserted_user JOIN inserted_guild
+        # INSERT ... SELECT ではカラムのPythonデフォルト値が適用されないため、IDはここで採番する
+        inserted_user = (
+            insert(User)
+            .values(
+                id=user.id or uuid.uuid4(),
+                name=user.name,
+                username=user.username,
+                email=user.email,
+                password_hash=user.password_hash,
+                description=user.description,
+            )
+            .returning(*User.__table__.c)
+            .cte("inserted_user")
+        )
+        inserted_guild = (
+            insert(Guild)
+            .from_select(
+                ["id", "name", "owner_user_id"],
+                select(
+                    literal(uuid.uuid4(), UUID(as_uuid=True)),
+                    literal("@me"),
+                    inserted_user.c.id,
+                ),
+            )
+            .returning(Guild.id, Guild.owner_user_id)
+            .cte("inserted_guild")
+        )
+        inserted_member = (
+            insert(GuildMember)
+            .from_select(
+                ["id", "guild_id", "user_id", "role"],
+                select(
+                    literal(uuid.uuid4(), UUID(as_uuid=True)),
+                    inserted_guild.c.id,
+                    inserted_guild.c.owner_user_id,
+                    literal("member"),
+                ),
+            )
+            .returning(GuildMember.id)
+            .cte("inserted_member")
+        )
+        created_user_alias = aliased(User, inserted_user)
+        stmt = (
+            select(created_user_alias, inserted_guild.c.id)
+            .join(
+                inserted_guild,
+                inserted_guild.c.owner_user_id == created_user_alias.id,
+            )
+            .add_cte(inserted_member)
+        )
+        result = await session.execute(stmt)
+        created_user, guild_id = result.one()
+
+        return created_user, guild_id
+
+    @handle_repository_errors(UserCreateError, "ユーザー一括作成")
+    async def create_users_bulk(self, session: AsyncSession, users: list[User]) -> None:
+        """複数のユーザーを一括作成する
+
+        件数が BULK_COPY_THRESHOLD 未満の場合は通常の INSERT、
+        それ以上の場合は asyncpg の COPY プロトコルで書き込む。
+
+        Args:
+            session (AsyncSession): データベースセッション
+            users (list[User]): 作成するユーザー情報リスト
+        """
+
+        if len(users) < BULK_COPY_THRESHOLD:
+            session.add_all(users)
+            await session.flush()
+            return
+
+        # COPY ではカラムのPythonデフォルト値が適用されないため、IDはここで採番する
+        for user in users:
+            if user.id is None:
+                user.id = uuid.uuid4()
+
+        # asyncpg アダプタは最初の文の実行時に BEGIN を発行するため、COPY が
+        # セッションの最初の文だと自動コミットになりロールバックできない。
+        # 先に文を1つ実行してトランザクションを確実に開始しておく
+        await session.execute(select(literal(1)))
+
+        # セッションと同じトランザクション上の asyncpg コネクションで COPY を実行
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            User.__tablename__,
+            records=[
+                (
+                    user.id,
+                    user.name,
+                    user.username,
+                    user.email,
+                    user.password_hash,
+                    user.description,
+                )
+                for user in users
+            ],
+            columns=_BULK_COPY_COLUMNS,
+        )
+        logger.info("ユーザーを一括作成しました: count=%d", len(users))
 
     @handle_repository_errors(UserQueryError, "ユーザー取得")
     async def get_user_by_id(self, session: AsyncSession, user_id: str) -> User | None:
@@ -131,9 +351,9 @@ class UserRepositoryImpl(UserRepositoryIf):
             User | None: ユーザー情報またはNone
         """
 
-        result = await session.execute(select(User).where(User.id == user_id))
+        result = await session.scalars(select(User).where(User.id == user_id))
 
-        return result.scalars().first()
+        return result.first()
 
     @handle_repository_errors(UserQueryError, "ユーザー取得")
     async def get_user_by_username(self, session: AsyncSession, username: str) -> User:
@@ -144,30 +364,55 @@ class UserRepositoryImpl(UserRepositoryIf):
             username (str): ユーザー名
         """
 
-        stmt = select(User).where(
-            User.username == username,
+        result = await session.execute(_SELECT_USER_BY_USERNAME, {"username": username})
+
+        return result.scalar_one_or_none()
+
+    @handle_repository_errors(UserQueryError, "複数ユーザー取得")
+    async def get_users_by_usernames(
+        self, session: AsyncSession, usernames: list[str]
+    ) -> dict[str, User]:
+        """複数のユーザー名からユーザーをまとめて取得する
+
+        Args:
+            session (AsyncSession): データベースセッション
+            usernames (list[str]): ユーザー名リスト
+
+        Returns:
+            dict[str, User]: ユーザー名をキーとしたユーザー情報（存在しないユーザー名は含まない）
+        """
+
+        result = await session.scalars(
+            _SELECT_USERS_BY_USERNAMES, {"usernames": usernames}
         )
-        result = await session.execute(stmt)
 
-        return result.scalars().first()
+        return {user.username: user for user in result}
 
     @handle_repository_errors(UserQueryError, "複数ユーザー取得")
     async def get_users_by_id(
         self, session: AsyncSession, user_id_list: list[str]
-    ) -> list[User]:
+    ) -> Sequence[Mapping[str, Any]]:
         """複数のユーザーを取得する
 
+        ORMインスタンスではなく、パスワードハッシュを除くカラムの
+        マッピング（id, name, username, email, description, created_at, updated_at）を返す。
+
         Args:
             session (AsyncSession): データベースセッション
             user_id_list (list[str]): ユーザーIDリスト
 
         Returns:
-            list[User]: ユーザーリスト
+            Sequence[Mapping[str, Any]]: ユーザー情報のマッピングリスト
         """
 
-        stmt = select(User).where(
-            User.id.in_(user_id_list),
-        )
-        result = await session.execute(stmt)
+        # 1件の場合は identity map を優先して参照し、読み込み済みならSQLを発行しない
+        if len(user_id_list) == 1:
+            user = await session.get(User, uuid.UUID(str(user_id_list[0])))
+            if user is None:
+                return []
+
+            return [{name: getattr(user, name) for name in _PUBLIC_USER_COLUMNS}]
+
+        result = await session.execute(_SELECT_USERS_BY_IDS, {"ids": user_id_list})
 
-        return list(result.scalars().all())
+        return result.mappings().all()
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class MessageCreateRequest(BaseModel):
@@ -23,3 +23,7 @@ class MessageResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     model_config = ConfigDict(from_attributes=True)
+
+
+# メッセージ一覧の検証用アダプタ（モジュール読み込み時に一度だけ構築する）
+MESSAGE_LIST_ADAPTER = TypeAdapter(list[MessageResponse])
@@ -1,6 +1,34 @@
+from typing import Mapping
+
+
 class BaseMessageUseCaseError(Exception):
     """ユースケース基底例外クラス"""
 
     def __init__(self, message: str, original_error: Exception | None = None):
         super().__init__(message)
         self.original_error = original_error
+
+
+def resolve_error_message(
+    error: Exception,
+    messages: Mapping[type[Exception], str],
+    default: str = "予期しないエラーが発生しました",
+) -> str:
+    """例外の種類に応じたエラーメッセージを返す
+
+    Args:
+        error (Exception): 発生した例外
+        messages (Mapping[type[Exception], str]): 例外クラスごとのエラーメッセージ
+        default (str): 対応するメッセージがない場合のエラーメッセージ
+
+    Returns:
+        str: エラーメッセージ
+    """
+
+    # 具体的な例外クラス（UserQueryError 等）は基底クラスのメッセージを使用する
+    for error_type in type(error).__mro__:
+        message = messages.get(error_type)
+        if message is not None:
+            return message
+
+    return default
@@ -2,13 +2,6 @@ from abc import ABC, abstractmethod
 
 from domains import Message
 from injector import inject, singleton
-from repository.channel_repository import (
-    ChannelNotFoundError as ChannelRepoNotFoundError,
-)
-from repository.channel_repository import (
-    ChannelRepositoryError,
-    ChannelRepositoryIf,
-)
 from repository.message_repository import (
     MessageRepositoryError,
     MessageRepositoryIf,
@@ -18,6 +11,9 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from usecase.base_exception import BaseMessageUseCaseError
 
+# メッセージのチャネルIDに対する外部キー制約名（PostgreSQLの既定の命名規則）
+MESSAGES_CHANNEL_ID_FKEY = "messages_channel_id_fkey"
+
 
 class CreateMessageUseCaseError(BaseMessageUseCaseError):
     """メッセージ作成ユースケース例外クラス"""
@@ -45,18 +41,14 @@ class CreateMessageUseCaseIf(ABC):
     """
 
     @inject
-    def __init__(
-        self, message_repo: MessageRepositoryIf, channel_repo: ChannelRepositoryIf
-    ) -> None:
+    def __init__(self, message_repo: MessageRepositoryIf) -> None:
         """メッセージ作成ユースケース初期化
 
         Args:
             message_repo (MessageRepositoryIf): メッセージリポジトリのインターフェース
-            channel_repo (ChannelRepositoryIf): チャネルリポジトリのインターフェース
         """
 
         self.message_repo = message_repo
-        self.channel_repo = channel_repo
 
     @abstractmethod
     async def execute(
@@ -109,29 +101,31 @@ class CreateMessageUseCaseImpl(CreateMessageUseCaseIf):
                 referenced_message_id=req.referenced_message_id,
             )
 
-            # メッセージをデータベースに保存（flush のみ、commit はまだ行わない）
-            message_db = await self.message_repo.create_message(session, message)
-
-            # チャネルの最終メッセージIDを更新（commit はまだ行わない）
-            await self.channel_repo.update_last_message_id(
-                session, str(message_db.channel_id), str(message_db.id)
+            # メッセージの保存とチャネルの最終メッセージID更新を1つの文で実行
+            # （commit はまだ行わない）
+            message_db = await self.message_repo.create_message_with_channel_update(
+                session, message
             )
 
-            # 両方の操作が成功した場合に commit
+            # 操作が成功した場合に commit
             await session.commit()
 
-            return MessageResponse.model_validate(message_db)
-
-        except ChannelRepoNotFoundError as e:
-            await session.rollback()
-            raise ChannelNotFoundError(
-                f"指定されたチャンネル（ID: {req.channel_id}）が存在しません", e
+            # DBから返された値のみのため、再検証を省略してレスポンスを構築
+            return MessageResponse.model_construct(
+                id=message_db.id,
+                channel_id=message_db.channel_id,
+                user_id=message_db.user_id,
+                type=message_db.type,
+                content=message_db.content,
+                referenced_message_id=message_db.referenced_message_id,
+                created_at=message_db.created_at,
+                updated_at=message_db.updated_at,
             )
 
         except MessageRepositoryError as e:
             # リポジトリ層のエラーをユースケース層のエラーに変換
             await session.rollback()
-            if isinstance(e.original_error, IntegrityError):
+            if _is_channel_fkey_violation(e.original_error):
                 raise ChannelNotFoundError(
                     f"指定されたチャンネル（ID: {req.channel_id}）が存在しません", e
                 )
@@ -139,14 +133,32 @@ class CreateMessageUseCaseImpl(CreateMessageUseCaseIf):
                 "メッセージの作成中にエラーが発生しました", e
             )
 
-        except ChannelRepositoryError as e:
-            # チャネルの更新に失敗した場合
-            await session.rollback()
-            raise CreateMessageTransactionError(
-                "チャネルの更新中にエラーが発生しました", e
-            )
-
         except Exception as e:
             # その他の予期しないエラー
             await session.rollback()
             raise CreateMessageTransactionError("予期しないエラーが発生しました", e)
+
+
+def _is_channel_fkey_violation(error: Exception | None) -> bool:
+    """チャネルIDの外部キー制約違反かどうかを判定する
+
+    ユーザーIDや参照メッセージIDの制約違反はチャンネル不在として扱わない
+
+    Args:
+        error (Exception | None): リポジトリ層で捕捉された元の例外
+
+    Returns:
+        bool: messages_channel_id_fkey の制約違反であれば True
+    """
+
+    if not isinstance(error, IntegrityError):
+        return False
+
+    # asyncpg はドライバ例外を __cause__ に、psycopg は diag に制約名を保持する
+    driver_error = getattr(error.orig, "__cause__", None)
+    constraint_name = getattr(driver_error, "constraint_name", None)
+    if constraint_name is None:
+        diag = getattr(error.orig, "diag", None)
+        constraint_name = getattr(diag, "constraint_name", None)
+
+    return constraint_name == MESSAGES_CHANNEL_ID_FKEY
@@ -1,12 +1,7 @@
 from abc import ABC, abstractmethod
 
-from domains import Guild, GuildMember, User
+from domains import User
 from injector import inject, singleton
-from repository.guild_member_repository import (
-    GuildMemberRepositoryError,
-    GuildMemberRepositoryIf,
-)
-from repository.guild_repository import GuildRepositoryError, GuildRepositoryIf
 from repository.user_repository import UserRepositoryError, UserRepositoryIf
 from schema.user_schema import UserCreateRequest, UserResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -38,23 +33,14 @@ class CreateUserUseCaseIf(ABC):
     """
 
     @inject
-    def __init__(
-        self,
-        user_repo: UserRepositoryIf,
-        guild_repo: GuildRepositoryIf,
-        guild_member_repo: GuildMemberRepositoryIf,
-    ) -> None:
+    def __init__(self, user_repo: UserRepositoryIf) -> None:
         """ユーザー作成ユースケース初期化
 
         Args:
             user_repo (UserRepositoryIf): ユーザーリポジトリ
-            guild_repo (GuildRepositoryIf): ギルドリポジトリ
-            guild_member_repo (GuildMemberRepositoryIf): ギルドメンバーリポジトリ
         """
 
         self.user_repo: UserRepositoryIf = user_repo
-        self.guild_repo: GuildRepositoryIf = guild_repo
-        self.guild_member_repo: GuildMemberRepositoryIf = guild_member_repo
 
     @abstractmethod
     async def execute(
@@ -103,49 +89,29 @@ class CreateUserUseCaseImpl(CreateUserUseCaseIf):
                 password_hash=password_hash,
                 description=req.description,
             )
-            user_db = await self.user_repo.create_user(session, user)
 
-            guild = Guild(
-                owner_user_id=user_db.id,
+            # トランザクションスコープ内の操作がすべて成功した場合に commit、
+            # 例外発生時は自動的に rollback される
+            async with session.begin():
+                # ユーザー・@me ギルド・ギルドメンバーを1往復で作成する
+                user_db, guild_id = await self.user_repo.create_user_with_guild(
+                    session, user
+                )
+
+            # DBから返された値のみのため、再検証を省略してレスポンスを構築
+            return UserResponse.model_construct(
+                id=user_db.id,
+                name=user_db.name,
+                username=user_db.username,
+                email=user_db.email,
+                description=user_db.description,
+                created_at=user_db.created_at,
+                updated_at=user_db.updated_at,
+                guild_id=guild_id,
             )
-            guild_db = await self.guild_repo.create_guild(session, guild)
-
-            guild_member = GuildMember(
-                user_id=user_db.id,
-                guild_id=guild_db.id,
-            )
-            _ = await self.guild_member_repo.create_guild_member(session, guild_member)
-
-            user_response_data = {
-                "id": user_db.id,
-                "name": user_db.name,
-                "username": user_db.username,
-                "email": user_db.email,
-                "description": user_db.description,
-                "created_at": user_db.created_at.isoformat(),
-                "updated_at": user_db.updated_at.isoformat(),
-                "guild_id": guild_db.id,
-            }
-
-            # すべての操作が成功した場合に commit
-            await session.commit()
-
-            return UserResponse.model_validate(user_response_data)
 
         except UserRepositoryError as e:
-            await session.rollback()
             raise CreateUserTransactionError("ユーザー作成中にエラーが発生しました", e)
 
-        except GuildRepositoryError as e:
-            await session.rollback()
-            raise CreateUserTransactionError("ギルド作成中にエラーが発生しました", e)
-
-        except GuildMemberRepositoryError as e:
-            await session.rollback()
-            raise CreateUserTransactionError(
-                "ギルドメンバー作成中にエラーが発生しました", e
-            )
-
         except Exception as e:
-            await session.rollback()
             raise CreateUserTransactionError("予期しないエラーが発生しました", e)
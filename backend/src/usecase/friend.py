@@ -1,3 +1,4 @@
+import uuid
 from abc import ABC, abstractmethod
 
 from domains import Channel, Friend, GuildMember
@@ -12,14 +13,29 @@ from repository.guild_repository import GuildRepositoryError, GuildRepositoryIf
 from repository.user_repository import UserRepositoryError, UserRepositoryIf
 from schema.friend_schema import FriendCreateRequest, FriendGetResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from usecase.base_exception import BaseMessageUseCaseError
+from usecase.base_exception import BaseMessageUseCaseError, resolve_error_message
+from utils.cache_utils import TTLCache
 from utils.logger_utils import get_logger
 
 CHANNEL_TYPE_TEXT = "text"
 
+# ユーザー名 → ユーザーID のキャッシュ設定
+USER_ID_CACHE_MAXSIZE = 10_000
+USER_ID_CACHE_TTL_SECONDS = 30
+
 # ロガーを取得
 logger = get_logger(__name__)
 
+# リポジトリ例外ごとのエラーメッセージ（モジュール読み込み時に一度だけ構築する）
+_REPOSITORY_ERROR_MESSAGES: dict[type[Exception], str] = {
+    UserRepositoryError: "ユーザー取得中にエラーが発生しました",
+    FriendRepositoryError: "フレンド作成中にエラーが発生しました",
+    GuildRepositoryError: "ギルド取得中にエラーが発生しました",
+    GuildMemberRepositoryError: "ギルドメンバー作成中にエラーが発生しました",
+    ChannelRepositoryError: "チャンネル作成中にエラーが発生しました",
+}
+_REPOSITORY_ERRORS = tuple(_REPOSITORY_ERROR_MESSAGES)
+
 
 class FriendUseCaseError(BaseMessageUseCaseError):
     """フレンドユースケース例外クラス"""
@@ -61,6 +77,11 @@ class FriendUseCaseIf(ABC):
         self.guild_repo: GuildRepositoryIf = guild_repo
         self.guild_member_repo: GuildMemberRepositoryIf = guild_member_repo
         self.channel_repo: ChannelRepositoryIf = channel_repo
+        # フレンド追加で繰り返し参照されるユーザー名のIDを短時間キャッシュする
+        # （ユーザー名は変更されないため、存在するユーザーのIDのみ保持する）
+        self.user_id_cache: TTLCache[str, uuid.UUID] = TTLCache(
+            USER_ID_CACHE_MAXSIZE, USER_ID_CACHE_TTL_SECONDS
+        )
 
     @abstractmethod
     async def create_friend(
@@ -117,89 +138,98 @@ class FriendUseCaseImpl(FriendUseCaseIf):
         """
 
         try:
-            # 自ユーザーの取得
-            username = req.username
-            user = await self.user_repo.get_user_by_username(session, username)
-            if not user:
-                return None
-
-            # 相手ユーザーの取得
-            related_username = req.related_username
-            related_user = await self.user_repo.get_user_by_username(
-                session, related_username
-            )
-            if not related_user:
-                return None
+            # トランザクションスコープ内の操作がすべて成功した場合に commit、
+            # 例外発生時は自動的に rollback される
+            async with session.begin():
+                # 自ユーザーと相手ユーザーの取得（1回のクエリでまとめて取得する）
+                user_ids = await self._get_user_ids(
+                    session, [req.username, req.related_username]
+                )
+                user_id = user_ids.get(req.username)
+                related_user_id = user_ids.get(req.related_username)
+                if not user_id or not related_user_id:
+                    return None
+
+                friend = Friend(
+                    user_id=user_id,
+                    related_user_id=related_user_id,
+                    type=req.type,
+                )
 
-            friend = Friend(
-                user_id=user.id,
-                related_user_id=related_user.id,
-                type=req.type,
-            )
+                friend_db = await self.friend_repo.create_friend(session, friend)
 
-            friend_db = await self.friend_repo.create_friend(session, friend)
+                # フレンド追加後、お互いのギルドにフレンドを追加
+                # （2つのギルドは1回のクエリでまとめて取得する）
+                guilds = await self.guild_repo.get_guilds_by_user_ids_name(
+                    session, [friend_db.user_id, friend_db.related_user_id], "@me"
+                )
+                guild_db_me = guilds[friend_db.user_id]
+                guild_db_related = guilds[friend_db.related_user_id]
+
+                # お互いのギルドメンバーを1回の INSERT でまとめて作成する
+                _ = await self.guild_member_repo.create_guild_members(
+                    session,
+                    [
+                        GuildMember(
+                            user_id=friend_db.related_user_id,
+                            guild_id=guild_db_me.id,
+                        ),
+                        GuildMember(
+                            user_id=friend_db.user_id,
+                            guild_id=guild_db_related.id,
+                        ),
+                    ],
+                )
 
-            # フレンド追加後、お互いのギルドにフレンドを追加
-            guild_db_me = await self.guild_repo.get_guild_by_user_id_name(
-                session, str(friend_db.user_id), "@me"
-            )
-            guild_member_me = GuildMember(
-                user_id=friend_db.related_user_id,
-                guild_id=guild_db_me.id,
-            )
-            _ = await self.guild_member_repo.create_guild_member(
-                session, guild_member_me
-            )
+                # ギルドにフレンドを追加後、それぞれチャネルを作成
+                channel_me = Channel(
+                    guild_id=guild_db_me.id,
+                    related_guild_id=guild_db_related.id,
+                    owner_user_id=friend_db.user_id,
+                )
+                _ = await self.channel_repo.create_channel(session, channel_me)
 
-            guild_db_related = await self.guild_repo.get_guild_by_user_id_name(
-                session, str(friend_db.related_user_id), "@me"
-            )
-            guild_member_related = GuildMember(
-                user_id=friend_db.user_id,
-                guild_id=guild_db_related.id,
-            )
-            _ = await self.guild_member_repo.create_guild_member(
-                session, guild_member_related
-            )
+            return friend_db
 
-            # ギルドにフレンドを追加後、それぞれチャネルを作成
-            channel_me = Channel(
-                guild_id=guild_db_me.id,
-                related_guild_id=guild_db_related.id,
-                owner_user_id=friend_db.user_id,
+        except _REPOSITORY_ERRORS as e:
+            raise FriendTransactionError(
+                resolve_error_message(e, _REPOSITORY_ERROR_MESSAGES), e
             )
-            _ = await self.channel_repo.create_channel(session, channel_me)
 
-            # すべての操作が成功した場合に commit
-            await session.commit()
+        except Exception as e:
+            raise FriendTransactionError("予期しないエラーが発生しました", e)
 
-            return friend_db
+    async def _get_user_ids(
+        self, session: AsyncSession, usernames: list[str]
+    ) -> dict[str, uuid.UUID]:
+        """ユーザー名からユーザーIDを取得する（キャッシュ優先）
 
-        except UserRepositoryError as e:
-            await session.rollback()
-            raise FriendTransactionError("ユーザー取得中にエラーが発生しました", e)
+        キャッシュにないユーザー名のみ、1回のクエリでまとめて取得する。
 
-        except FriendRepositoryError as e:
-            await session.rollback()
-            raise FriendTransactionError("フレンド作成中にエラーが発生しました", e)
+        Args:
+            session (AsyncSession): データベースセッション
+            usernames (list[str]): ユーザー名リスト
 
-        except GuildRepositoryError as e:
-            await session.rollback()
-            raise FriendTransactionError("ギルド取得中にエラーが発生しました", e)
+        Returns:
+            dict[str, uuid.UUID]: ユーザー名をキーとしたユーザーID（存在しないユーザー名は含まない）
+        """
 
-        except GuildMemberRepositoryError as e:
-            await session.rollback()
-            raise FriendTransactionError(
-                "ギルドメンバー作成中にエラーが発生しました", e
-            )
+        user_ids: dict[str, uuid.UUID] = {}
+        missing: list[str] = []
+        for username in usernames:
+            user_id = self.user_id_cache.get(username)
+            if user_id is None:
+                missing.append(username)
+            else:
+                user_ids[username] = user_id
 
-        except ChannelRepositoryError as e:
-            await session.rollback()
-            raise FriendTransactionError("チャンネル作成中にエラーが発生しました", e)
+        if missing:
+            users = await self.user_repo.get_users_by_usernames(session, missing)
+            for username, user in users.items():
+                self.user_id_cache.set(username, user.id)
+                user_ids[username] = user.id
 
-        except Exception as e:
-            await session.rollback()
-            raise FriendTransactionError("予期しないエラーが発生しました", e)
+        return user_ids
 
     async def get_friend_all(
         self, session: AsyncSession, user_id: str
@@ -220,22 +250,17 @@ class FriendUseCaseImpl(FriendUseCaseIf):
                 session, user_id
             )
 
-            # FriendGetResponseのリストを作成
-            friend_res_list = []
-            for row in friend_details:
-                friend_res_list.append(
-                    FriendGetResponse.model_validate(
-                        {
-                            "name": row.user_name,
-                            "username": row.user_username,
-                            "description": row.user_description,
-                            "created_at": row.user_created_at,
-                            "channel_id": row.channel_id,
-                        }
-                    )
+            # FriendGetResponseのリストを作成（DBから返された値のみのため、再検証を省略する）
+            return [
+                FriendGetResponse.model_construct(
+                    name=row.user_name,
+                    username=row.user_username,
+                    description=row.user_description,
+                    created_at=row.user_created_at,
+                    channel_id=row.channel_id,
                 )
-
-            return friend_res_list
+                for row in friend_details
+            ]
 
         except FriendRepositoryError as e:
             raise FriendTransactionError("フレンド取得中にエラーが発生しました", e)
@@ -5,19 +5,20 @@ from repository.channel_repository import (
     ChannelRepositoryError,
     ChannelRepositoryIf,
 )
-from repository.message_repository import (
-    MessageRepositoryError,
-    MessageRepositoryIf,
-)
 from schema.channel_schema import ChannelGetResponse
-from schema.message_schema import MessageResponse
+from schema.message_schema import MESSAGE_LIST_ADAPTER
 from sqlalchemy.ext.asyncio import AsyncSession
-from usecase.base_exception import BaseMessageUseCaseError
+from usecase.base_exception import BaseMessageUseCaseError, resolve_error_message
 from utils.logger_utils import get_logger
 
 # ロガーを取得
 logger = get_logger(__name__)
 
+# リポジトリ例外ごとのエラーメッセージ（モジュール読み込み時に一度だけ構築する）
+_REPOSITORY_ERROR_MESSAGES: dict[type[Exception], str] = {
+    ChannelRepositoryError: "チャンネル取得中にエラーが発生しました",
+}
+
 
 class GetChannelMessagesUseCaseError(BaseMessageUseCaseError):
     """チャンネルメッセージ取得ユースケース例外クラス"""
@@ -45,18 +46,14 @@ class GetChannelMessagesUseCaseIf(ABC):
     """
 
     @inject
-    def __init__(
-        self, channel_repo: ChannelRepositoryIf, message_repo: MessageRepositoryIf
-    ) -> None:
+    def __init__(self, channel_repo: ChannelRepositoryIf) -> None:
         """コンストラクタ
 
         Args:
             channel_repo: チャネルリポジトリのインターフェース
-            message_repo: メッセージリポジトリのインターフェース
         """
 
         self.channel_repo = channel_repo
-        self.message_repo = message_repo
 
     @abstractmethod
     async def execute(
@@ -103,9 +100,11 @@ class GetChannelMessagesUseCaseImpl(GetChannelMessagesUseCaseIf):
             GetChannelMessageTransactionError: チャンネルメッセージ取得に失敗した場合
         """
 
-        # チャネル基本情報を取得
+        # チャネル基本情報とメッセージ一覧を1回のクエリで取得
         try:
-            channel_db = await self.channel_repo.get_channel_by_id(session, channel_id)
+            channel_db = await self.channel_repo.get_channel_with_messages(
+                session, channel_id
+            )
             if channel_db is None:
                 error_msg = (
                     f"指定されたチャンネルが存在しません: channel_id={channel_id}"
@@ -113,51 +112,45 @@ class GetChannelMessagesUseCaseImpl(GetChannelMessagesUseCaseIf):
                 logger.warning(error_msg)
                 raise ChannelNotFoundError(error_msg)
             logger.info(
-                f"チャンネル基本情報を取得しました: channel_id={channel_id}, name={channel_db.name}"
+                "チャンネル基本情報を取得しました: channel_id=%s, name=%s",
+                channel_id,
+                channel_db.name,
             )
 
-            # チャネルに属するメッセージ一覧を取得
-            message_list = await self.message_repo.get_message_by_channel_id(
-                session, channel_id
-            )
+            message_list = channel_db.messages
             logger.info(
-                f"メッセージ一覧を取得しました: channel_id={channel_id}, message_count={len(message_list)}"
+                "メッセージ一覧を取得しました: channel_id=%s, message_count=%d",
+                channel_id,
+                len(message_list),
             )
 
             # データ変換処理
             # メッセージリストをレスポンス形式に変換
-            message_response_data = [
-                MessageResponse.model_validate(message) for message in message_list
-            ]
-
-            # チャネル情報のレスポンスデータを構築
-            channel_response_data = {
-                "id": channel_db.id,
-                "guild_id": channel_db.guild_id,
-                "name": channel_db.name,
-                "messages": message_response_data,
-            }
-            # レスポンススキーマに変換して返却
-            response = ChannelGetResponse.model_validate(channel_response_data)
+            message_response_data = MESSAGE_LIST_ADAPTER.validate_python(
+                message_list, from_attributes=True
+            )
+
+            # レスポンススキーマを構築
+            # （DB由来の値と検証済みのメッセージ一覧のみのため、再検証を省略する）
+            response = ChannelGetResponse.model_construct(
+                id=channel_db.id,
+                guild_id=channel_db.guild_id,
+                name=channel_db.name,
+                messages=message_response_data,
+            )
             logger.info(
-                f"チャンネルメッセージ取得が正常に完了: channel_id={channel_id}, message_count={len(message_response_data)}"
+                "チャンネルメッセージ取得が正常に完了: channel_id=%s, message_count=%d",
+                channel_id,
+                len(message_response_data),
             )
 
             return response
 
-        except ChannelNotFoundError as e:
-            raise ChannelNotFoundError(str(e))
-
-        except ChannelRepositoryError as e:
-            raise GetChannelMessageTransactionError(
-                "チャンネル取得中にエラーが発生しました", e
-            )
+        except ChannelNotFoundError:
+            raise
 
-        except MessageRepositoryError as e:
+        except Exception as e:
+            # リポジトリ例外は種類に応じたメッセージ、その他は予期しないエラーとして扱う
             raise GetChannelMessageTransactionError(
-                "メッセージ取得中にエラーが発生しました", e
+                resolve_error_message(e, _REPOSITORY_ERROR_MESSAGES), e
             )
-
-        except Exception as e:
-            # その他の予期しないエラー
-            raise GetChannelMessageTransactionError("予期しないエラーが発生しました", e)
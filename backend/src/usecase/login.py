@@ -1,5 +1,7 @@
+import uuid
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass
+from datetime import datetime, timezone
 
 from domains import Session, User
 from fastapi import Request
@@ -9,20 +11,68 @@ from repository.session_repository import SessionRepositoryError, SessionReposit
 from repository.user_repository import UserRepositoryError, UserRepositoryIf
 from sqlalchemy.ext.asyncio import AsyncSession
 from usecase.base_exception import BaseMessageUseCaseError
+from utils.cache_utils import TTLCache
 from utils.logger_utils import get_logger
 from utils.utils import (
-    ACCESS_TOKEN_EXPIRE_MINUTES,
-    REFRESH_TOKEN_EXPIRE_DAYS,
+    ACCESS_TOKEN_EXPIRES_DELTA,
+    REFRESH_TOKEN_EXPIRES_DELTA,
     create_token,
-    hash_token,
     verify_password,
     verify_token,
 )
 
+# 認証ユーザーのキャッシュ設定
+AUTH_USER_CACHE_MAXSIZE = 4096
+AUTH_USER_CACHE_TTL_SECONDS = 30
+
 # ロガーを取得
 logger = get_logger(__name__)
 
 
+def _extract_token(req: Request) -> str:
+    """CookieまたはAuthorizationヘッダーからトークンを取得する（Cookie優先）
+
+    Args:
+        req (Request): HTTPリクエスト
+
+    Returns:
+        str: トークン（存在しない場合は空文字）
+    """
+
+    token = req.cookies.get("session_token")
+    if token:
+        return token
+
+    # "Bearer " で始まる場合のみ接頭辞を除去する（それ以外はコピーせずそのまま返す）
+    return (req.headers.get("Authorization") or "").removeprefix("Bearer ")
+
+
+@dataclass(frozen=True, slots=True)
+class AuthUser:
+    """認証済みユーザー情報
+
+    リクエストをまたいでキャッシュ・共有するため、ORMインスタンスではなく
+    イミュータブルなスナップショットとして保持する（パスワードハッシュは含めない）
+    """
+
+    id: uuid.UUID
+    username: str
+    name: str
+
+    @classmethod
+    def from_user(cls, user: User) -> "AuthUser":
+        """ORMのユーザーから認証済みユーザー情報を生成する
+
+        Args:
+            user (User): ユーザー
+
+        Returns:
+            AuthUser: 認証済みユーザー情報
+        """
+
+        return cls(id=user.id, username=user.username, name=user.name)
+
+
 class LoginUseCaseError(BaseMessageUseCaseError):
     """ログインユースケース例外クラス"""
 
@@ -55,6 +105,10 @@ class LoginUseCaseIf(ABC):
 
         self.user_repo: UserRepositoryIf = user_repo
         self.session_repo: SessionRepositoryIf = session_repo
+        # ユーザー名 → 認証ユーザー情報のキャッシュ（リクエストをまたいで使い回す）
+        self.user_cache: TTLCache[str, AuthUser] = TTLCache(
+            AUTH_USER_CACHE_MAXSIZE, AUTH_USER_CACHE_TTL_SECONDS
+        )
 
     @abstractmethod
     async def create_session(
@@ -74,7 +128,9 @@ class LoginUseCaseIf(ABC):
         pass
 
     @abstractmethod
-    async def auth_session(self, session: AsyncSession, req: Request) -> User | None:
+    async def auth_session(
+        self, session: AsyncSession, req: Request
+    ) -> AuthUser | None:
         """セッションを認証する（JWT検証+DBセッション状態確認）
 
         Args:
@@ -82,13 +138,15 @@ class LoginUseCaseIf(ABC):
             req (Request): HTTPリクエスト
 
         Returns:
-            User | None: ユーザー情報
+            AuthUser | None: 認証済みユーザー情報
         """
 
         pass
 
     @abstractmethod
-    async def auth_jwt_only(self, session: AsyncSession, req: Request) -> User | None:
+    async def auth_jwt_only(
+        self, session: AsyncSession, req: Request
+    ) -> AuthUser | None:
         """JWT検証のみを行う（DB参照リクエスト用）
 
         Args:
@@ -96,7 +154,7 @@ class LoginUseCaseIf(ABC):
             req (Request): HTTPリクエスト
 
         Returns:
-            User | None: ユーザー情報
+            AuthUser | None: 認証済みユーザー情報
         """
 
         pass
@@ -138,54 +196,74 @@ class LoginUseCaseImpl(LoginUseCaseIf):
                 }
 
             # アクセストークンとリフレッシュトークンの生成
-            access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-            refresh_token_expires = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-
             access_token = create_token(
                 data={"sub": user.username},
                 token_type="access",
-                expires_delta=access_token_expires,
+                expires_delta=ACCESS_TOKEN_EXPIRES_DELTA,
             )
             refresh_token = create_token(
                 data={"sub": user.username},
                 token_type="refresh",
-                expires_delta=refresh_token_expires,
+                expires_delta=REFRESH_TOKEN_EXPIRES_DELTA,
             )
 
-            # 有効期限の計算
-            access_expires_at = datetime.now(timezone.utc) + access_token_expires
-            refresh_expires_at = datetime.now(timezone.utc) + refresh_token_expires
+            # 有効期限の計算（現在時刻は1回だけ取得して両方に使う）
+            now = datetime.now(timezone.utc)
+            access_expires_at = now + ACCESS_TOKEN_EXPIRES_DELTA
+            refresh_expires_at = now + REFRESH_TOKEN_EXPIRES_DELTA
+
+            # User-Agent とクライアントIPは ASGI scope から直接取得する
+            # （Headers の大文字小文字を区別しない走査と Address の生成を省く）
+            user_agent = next(
+                (
+                    value.decode("latin-1")
+                    for key, value in req.scope["headers"]
+                    if key == b"user-agent"
+                ),
+                None,
+            )
+            client = req.scope.get("client")
 
-            # トークンをハッシュ化してDBに保存
+            # トークンはリポジトリでハッシュ化されてDBに保存される
             session_db = Session(
                 user_id=user.id,
-                access_token=hash_token(access_token),
-                refresh_token=hash_token(refresh_token),
+                access_token=access_token,
+                refresh_token=refresh_token,
                 access_token_expires_at=access_expires_at,
                 refresh_token_expires_at=refresh_expires_at,
-                user_agent=req.headers.get("User-Agent"),
-                ip_address=req.client.host if req.client is not None else None,
+                user_agent=user_agent,
+                ip_address=client[0] if client else None,
             )
 
             created_session: Session | None = await self.session_repo.create_session(
                 session, session_db
             )
 
+            # セッション作成が成功した場合に commit
+            await session.commit()
+
             return {
                 "session": created_session,
                 "user": user,
+                "access_token": access_token,
+                "refresh_token": refresh_token,
             }
 
         except UserRepositoryError as e:
+            await session.rollback()
             raise LoginTransactionError("ユーザー取得中にエラーが発生しました", e)
 
         except SessionRepositoryError as e:
+            await session.rollback()
             raise LoginTransactionError("セッション作成中にエラーが発生しました", e)
 
         except Exception as e:
+            await session.rollback()
             raise LoginTransactionError("予期しないエラーが発生しました", e)
 
-    async def auth_session(self, session: AsyncSession, req: Request) -> User | None:
+    async def auth_session(
+        self, session: AsyncSession, req: Request
+    ) -> AuthUser | None:
         """セッションを認証する（JWT検証+DBセッション状態確認）
 
         Args:
@@ -193,14 +271,12 @@ class LoginUseCaseImpl(LoginUseCaseIf):
             req (Request): HTTPリクエスト
 
         Returns:
-            User | None: ユーザー情報
+            AuthUser | None: 認証済みユーザー情報
         """
 
         try:
             # CookieまたはAuthorizationヘッダーからトークンを取得
-            token = req.cookies.get("session_token") or req.headers.get(
-                "Authorization", ""
-            ).replace("Bearer ", "")
+            token = _extract_token(req)
 
             if not token:
                 return None
@@ -210,21 +286,16 @@ class LoginUseCaseImpl(LoginUseCaseIf):
             if not payload:
                 return None
 
-            username = payload.get("sub")
-            if not username:
+            if not payload.get("sub"):
                 return None
 
-            # DB上のセッション状態を確認（無効化されていないか確認）
-            # トークンをハッシュ化して検索
-            session_db = await self.session_repo.get_session_by_access_token(
-                session, hash_token(token)
-            )
-            if not session_db or session_db.revoked_at is not None:
-                # セッションが存在しないか、無効化されている場合
+            # DB上のセッション状態の確認とユーザー取得を1回のクエリで行う
+            # （セッションが存在しないか、無効化されている場合はNone）
+            user = await self.session_repo.get_user_by_access_token(session, token)
+            if user is None:
                 return None
 
-            # JWTが有効で、かつセッションも有効な場合のみ、ユーザー情報を取得
-            return await self.user_repo.get_user_by_username(session, username)
+            return AuthUser.from_user(user)
 
         except SessionRepositoryError as e:
             raise LoginTransactionError("セッション取得中にエラーが発生しました", e)
@@ -232,7 +303,9 @@ class LoginUseCaseImpl(LoginUseCaseIf):
         except Exception as e:
             raise LoginTransactionError("予期しないエラーが発生しました", e)
 
-    async def auth_jwt_only(self, session: AsyncSession, req: Request) -> User | None:
+    async def auth_jwt_only(
+        self, session: AsyncSession, req: Request
+    ) -> AuthUser | None:
         """JWT検証のみを行う（DB参照リクエスト用）
 
         Args:
@@ -240,14 +313,12 @@ class LoginUseCaseImpl(LoginUseCaseIf):
             req (Request): HTTPリクエスト
 
         Returns:
-            User | None: ユーザー情報
+            AuthUser | None: 認証済みユーザー情報
         """
 
         try:
             # CookieまたはAuthorizationヘッダーからトークンを取得
-            token = req.cookies.get("session_token") or req.headers.get(
-                "Authorization", ""
-            ).replace("Bearer ", "")
+            token = _extract_token(req)
 
             if not token:
                 return None
@@ -262,7 +333,32 @@ class LoginUseCaseImpl(LoginUseCaseIf):
                 return None
 
             # JWTが有効な場合、ユーザー情報を取得して返す
-            return await self.user_repo.get_user_by_username(session, username)
+            return await self._get_user(session, username)
 
         except Exception as e:
             raise LoginTransactionError("JWT検証中にエラーが発生しました", e)
+
+    async def _get_user(self, session: AsyncSession, username: str) -> AuthUser | None:
+        """認証ユーザー情報を取得する（キャッシュ優先）
+
+        Args:
+            session (AsyncSession): データベースセッション
+            username (str): ユーザー名
+
+        Returns:
+            AuthUser | None: 認証済みユーザー情報
+        """
+
+        auth_user = self.user_cache.get(username)
+        if auth_user is not None:
+            return auth_user
+
+        user = await self.user_repo.get_user_by_username(session, username)
+        # 見つからなかった場合は、後続の作成に備えてキャッシュしない
+        if user is None:
+            return None
+
+        auth_user = AuthUser.from_user(user)
+        self.user_cache.set(username, auth_user)
+
+        return auth_user
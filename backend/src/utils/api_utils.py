@@ -1,11 +1,26 @@
+from typing import Any
+
 from dependencies import get_injector
-from fastapi import Depends
-from injector import Injector
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
 from usecase.channel_access_checker import ChannelAccessCheckerUseCaseIf
 
+# チャンネルアクセスチェッカー（シングルトンのため、リクエストごとにDIコンテナから解決せず使い回す）
+_channel_access_checker: ChannelAccessCheckerUseCaseIf = get_injector().get(
+    ChannelAccessCheckerUseCaseIf
+)
+
+
+class PydanticJSONResponse(JSONResponse):
+    """pydantic-core（Rust実装）のJSONエンコーダで本文を生成するレスポンス
+
+    標準の JSONResponse と同じくコンパクトな UTF-8 の JSON を出力する。
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
 
-def get_channel_access_checker(
-    injector: Injector = Depends(get_injector),
-) -> ChannelAccessCheckerUseCaseIf:
+def get_channel_access_checker() -> ChannelAccessCheckerUseCaseIf:
     """チャンネルアクセスチェッカーのUseCaseを取得する"""
-    return injector.get(ChannelAccessCheckerUseCaseIf)
+    return _channel_access_checker
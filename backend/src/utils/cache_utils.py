@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """有効期限付きのLRUキャッシュ
+
+    プロセス内で共有する読み取り専用値のキャッシュとして使用する。
+    get / set の途中で await しないため、単一イベントループ上ではロック不要。
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """コンストラクタ
+
+        Args:
+            maxsize (int): 保持する最大件数（超過時は最も古く参照されたものから削除）
+            ttl (float): 有効期限（秒）
+        """
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """キャッシュから値を取得する
+
+        Args:
+            key (K): キー
+
+        Returns:
+            V | None: 有効期限内の値（存在しない・期限切れの場合はNone）
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """キャッシュに値を格納する
+
+        Args:
+            key (K): キー
+            value (V): 値
+        """
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """キャッシュから値を削除する
+
+        Args:
+            key (K): キー
+        """
+
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """キャッシュをすべて削除する"""
+
+        self._entries.clear()
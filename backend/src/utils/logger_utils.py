@@ -10,6 +10,9 @@ import os
 from pathlib import Path
 from typing import Dict, Optional
 
+# appロガーを使用するモジュールのパッケージ名
+_APP_LOGGER_PACKAGES = frozenset({"api", "usecase", "repository"})
+
 
 class LoggerManager:
     """ログマネージャークラス
@@ -118,22 +121,24 @@ class LoggerManager:
         Returns:
             設定済みのロガーインスタンス
         """
+        # 取得済みのロガーは1回の辞書参照で返す
+        logger = cls._loggers.get(name)
+        if logger is not None:
+            return logger
+
+        # ログ設定は最初のロガー取得時に初期化する（インポート時には読み込まない）
         if not cls._initialized:
             cls.setup_logging()
 
-        if name not in cls._loggers:
-            # appロガーを使用するか、標準ロガーを使用するかを判定
-            if (
-                name.startswith("api.")
-                or name.startswith("usecase.")
-                or name.startswith("repository.")
-            ):
-                logger = logging.getLogger("app")
-            else:
-                logger = logging.getLogger(name)
-            cls._loggers[name] = logger
+        # appロガーを使用するか、標準ロガーを使用するかを判定
+        package, sep, _ = name.partition(".")
+        if sep and package in _APP_LOGGER_PACKAGES:
+            logger = logging.getLogger("app")
+        else:
+            logger = logging.getLogger(name)
+        cls._loggers[name] = logger
 
-        return cls._loggers[name]
+        return logger
 
     @classmethod
     def reset_logging(cls) -> None:
@@ -179,7 +184,3 @@ def setup_logging(
         >>> setup_logging()  # デフォルト設定ファイル
     """
     LoggerManager.setup_logging(config_path, env_key)
-
-
-# アプリケーション起動時に自動的にセットアップ
-setup_logging()
@@ -1,12 +1,19 @@
+import asyncio
 import base64
 import hashlib
+import hmac
 import os
-from datetime import datetime, timedelta, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from types import MappingProxyType
 from typing import Optional, Union
 
 import jwt
 from dotenv import load_dotenv
 
+from utils.cache_utils import TTLCache
+
 # .envファイルの内容を読み込見込む
 load_dotenv()
 
@@ -16,6 +23,49 @@ ALGORITHM = os.environ["ALGORITHM"]
 # トークン有効期限の設定（環境変数から取得、デフォルト値あり）
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+ACCESS_TOKEN_EXPIRES_DELTA = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+REFRESH_TOKEN_EXPIRES_DELTA = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+# JWT の exp クレームは Unix 時刻（整数秒）のため、秒数でも保持しておく
+_ACCESS_TOKEN_EXPIRES_SECONDS = int(ACCESS_TOKEN_EXPIRES_DELTA.total_seconds())
+_REFRESH_TOKEN_EXPIRES_SECONDS = int(REFRESH_TOKEN_EXPIRES_DELTA.total_seconds())
+
+# 検証済みJWTのキャッシュ設定
+VERIFIED_TOKEN_CACHE_MAXSIZE = int(os.getenv("VERIFIED_TOKEN_CACHE_MAXSIZE", "8192"))
+VERIFIED_TOKEN_CACHE_TTL_SECONDS = int(
+    os.getenv("VERIFIED_TOKEN_CACHE_TTL_SECONDS", "60")
+)
+
+# パスワードハッシュの設定（反復回数を変更すると既存のハッシュは検証できなくなる）
+PASSWORD_HASH_ITERATIONS = int(os.getenv("PASSWORD_HASH_ITERATIONS", "100000"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+
+# 検証済みJWT → ペイロード のキャッシュ（同一クライアントからの連続リクエストで署名検証を省く）
+# リクエスト間で共有されるため、ペイロードは読み取り専用のビューとして保持する
+_verified_token_cache: TTLCache[str, MappingProxyType] = TTLCache(
+    VERIFIED_TOKEN_CACHE_MAXSIZE, VERIFIED_TOKEN_CACHE_TTL_SECONDS
+)
+
+# パスワードハッシュ計算用のスレッドプール
+# （pbkdf2_hmac は計算中に GIL を解放するため、スレッドでもイベントループを止めずに並列化できる）
+_password_hash_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+
+
+def _pbkdf2(password: str, salt: bytes) -> bytes:
+    """PBKDF2-HMAC-SHA256 でパスワードのハッシュを計算する
+
+    Args:
+        password (str): パスワード
+        salt (bytes): ソルト
+
+    Returns:
+        bytes: ハッシュ値
+    """
+
+    return hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), salt, PASSWORD_HASH_ITERATIONS
+    )
 
 
 async def hash_password(password: str, salt: Optional[bytes] = None) -> str:
@@ -24,7 +74,10 @@ async def hash_password(password: str, salt: Optional[bytes] = None) -> str:
     if salt is None:
         salt = os.urandom(16)
     salt_b64 = base64.b64encode(salt).decode("utf-8")
-    hash_bytes = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, 100_000)
+    # ハッシュ計算は CPU 負荷が高いため、イベントループを止めないようスレッドプールで実行
+    hash_bytes = await asyncio.get_running_loop().run_in_executor(
+        _password_hash_executor, _pbkdf2, password, salt
+    )
     hash_b64 = base64.b64encode(hash_bytes).decode("utf-8")
 
     return f"{salt_b64}${hash_b64}"
@@ -35,27 +88,29 @@ async def verify_password(stored_password: str, provided_password: str) -> bool:
         salt_b64, hash_b64 = stored_password.split("$")
         salt = base64.b64decode(salt_b64)
         expected_hash = base64.b64decode(hash_b64)
-        new_hash = hashlib.pbkdf2_hmac(
-            "sha256", provided_password.encode(), salt, 100_000
+        # ログイン集中時にイベントループを止めないよう、ハッシュ計算はスレッドプールで実行
+        new_hash = await asyncio.get_running_loop().run_in_executor(
+            _password_hash_executor, _pbkdf2, provided_password, salt
         )
 
-        return new_hash == expected_hash
+        # 比較時間からハッシュの一致箇所を推測されないよう、定数時間で比較する
+        return hmac.compare_digest(new_hash, expected_hash)
 
     except Exception:
         return False
 
 
-def hash_token(token: str) -> str:
+def hash_token(token: str) -> bytes:
     """トークンをSHA-256でハッシュ化する
 
     Args:
         token (str): ハッシュ化するトークン
 
     Returns:
-        str: ハッシュ化されたトークン（16進数文字列）
+        bytes: ハッシュ化されたトークン（32バイトのダイジェスト）
     """
 
-    return hashlib.sha256(token.encode()).hexdigest()
+    return hashlib.sha256(token.encode()).digest()
 
 
 def create_token(
@@ -74,17 +129,15 @@ def create_token(
         str: JWTトークン
     """
     to_encode = data.copy()
+    # exp は Unix 時刻で十分なため、datetime を経由せず整数秒で計算する
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
         if token_type == "access":
-            expire = datetime.now(timezone.utc) + timedelta(
-                minutes=ACCESS_TOKEN_EXPIRE_MINUTES
-            )
+            expire = now + _ACCESS_TOKEN_EXPIRES_SECONDS
         else:  # refresh
-            expire = datetime.now(timezone.utc) + timedelta(
-                days=REFRESH_TOKEN_EXPIRE_DAYS
-            )
+            expire = now + _REFRESH_TOKEN_EXPIRES_SECONDS
     to_encode.update({"exp": expire, "type": token_type})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
@@ -100,19 +153,33 @@ def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
     Returns:
         Optional[dict]: トークンが有効な場合はペイロード、無効な場合はNone
     """
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        # トークンタイプを確認
-        if payload.get("type") != token_type:
+    # 検証済みのトークンはキャッシュから返す（有効期限はキャッシュ側でも確認する）
+    payload = _verified_token_cache.get(token)
+    if payload is not None and payload["exp"] <= time.time():
+        _verified_token_cache.pop(token)
+        payload = None
+
+    if payload is None:
+        try:
+            payload = MappingProxyType(
+                jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            )
+        except jwt.ExpiredSignatureError:
             return None
-        return payload
-    except jwt.ExpiredSignatureError:
-        return None
-    except jwt.InvalidTokenError:
+        except jwt.InvalidTokenError:
+            return None
+        # 有効期限を持つトークンのみキャッシュする
+        if "exp" in payload:
+            _verified_token_cache.set(token, payload)
+
+    # トークンタイプを確認
+    if payload.get("type") != token_type:
         return None
+    # 呼び出し側で変更されてもキャッシュに影響しないよう、コピーを返す
+    return dict(payload)
 
 
-async def is_test_env() -> bool:
+def is_test_env() -> bool:
     """テスト環境かどうかを判定する
 
     Returns:
@@ -0,0 +1,109 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# テストファイルのルートディレクトリからの相対パスでsrcフォルダを指定
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from utils.cache_utils import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_get_returns_stored_value(self):
+        """
+        Given: 値を格納したキャッシュ
+        When: 同じキーと存在しないキーでgetを呼び出す
+        Then: 格納した値と、存在しないキーではNoneが返されること
+        """
+
+        # Given
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+
+        # When & Then
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("missing"))
+
+    def test_lru_eviction_at_maxsize(self):
+        """
+        Given: 最大件数まで格納し、古い方のキーを参照したキャッシュ
+        When: 新しいキーを追加する
+        Then: 最も古く参照されたキーが削除されること
+        """
+
+        # Given
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        # When
+        cache.set("c", 3)
+
+        # Then
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_ttl_expiry(self):
+        """
+        Given: 値を格納したキャッシュ
+        When: TTLを経過してからgetを呼び出す
+        Then: Noneが返されること
+        """
+
+        # Given
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        with patch("utils.cache_utils.time") as mock_time:
+            mock_time.monotonic.return_value = 1000.0
+            cache.set("a", 1)
+
+            # When & Then: TTL内では取得でき、経過後は取得できない
+            mock_time.monotonic.return_value = 1059.0
+            self.assertEqual(cache.get("a"), 1)
+            mock_time.monotonic.return_value = 1060.0
+            self.assertIsNone(cache.get("a"))
+
+    def test_pop(self):
+        """
+        Given: 値を格納したキャッシュ
+        When: popを呼び出す
+        Then: 該当キーのみ削除され、存在しないキーのpopでは例外が発生しないこと
+        """
+
+        # Given
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # When
+        cache.pop("a")
+        cache.pop("missing")
+
+        # Then
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+
+    def test_clear(self):
+        """
+        Given: 複数の値を格納したキャッシュ
+        When: clearを呼び出す
+        Then: すべての値が削除されること
+        """
+
+        # Given
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # When
+        cache.clear()
+
+        # Then
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+import asyncio
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+from fastapi import HTTPException
+from injector import Injector
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# テストファイルのルートディレクトリからの相対パスでsrcフォルダを指定
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from dependencies import configure
+from domains import Channel, Guild
+from repository.channel_repository import ChannelQueryError
+from repository.guild_repository import GuildQueryError
+from usecase.channel_access_checker import ChannelAccessCheckerUseCaseIf
+
+
+class TestChannelAccessCheckerUseCaseImpl(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # テスト用DIコンテナからユースケースを取得
+        injector = Injector([configure])
+        self.use_case = injector.get(ChannelAccessCheckerUseCaseIf)
+        self.mock_session = Mock(spec=AsyncSession)
+
+        # リポジトリをモックに置き換え
+        self.mock_channel_repository = AsyncMock()
+        self.mock_guild_repository = AsyncMock()
+        self.use_case.channel_repo = self.mock_channel_repository
+        self.use_case.guild_repo = self.mock_guild_repository
+
+        # ミドルウェアで認証済みユーザーが設定されたリクエスト
+        self.user_id = uuid.uuid4()
+        self.channel_id = str(uuid.uuid4())
+        self.request = Mock()
+        self.request.state.user = Mock(id=self.user_id)
+
+    def create_mock_channel(self, deleted_at=None):
+        """モックのChannelオブジェクトを作成"""
+        channel = Mock(spec=Channel)
+        channel.id = uuid.UUID(self.channel_id)
+        channel.deleted_at = deleted_at
+        return channel
+
+    async def test_execute_success(self):
+        """
+        Given: 存在するチャネルと、そのチャネルが属するギルドのメンバー
+        When: executeメソッドを呼び出す
+        Then: 例外が発生せず、同じセッションで順に確認されること
+        """
+
+        # Given
+        self.mock_channel_repository.get_channel_by_id.return_value = (
+            self.create_mock_channel()
+        )
+        self.mock_guild_repository.get_guild_by_member_channel.return_value = Mock(
+            spec=Guild
+        )
+
+        # When
+        await self.use_case.execute(self.request, self.channel_id, self.mock_session)
+
+        # Then
+        self.mock_channel_repository.get_channel_by_id.assert_awaited_once_with(
+            self.mock_session, self.channel_id
+        )
+        self.mock_guild_repository.get_guild_by_member_channel.assert_awaited_once_with(
+            self.mock_session, self.user_id, self.channel_id
+        )
+
+    async def test_execute_unauthenticated(self):
+        """
+        Given: ユーザー情報が設定されていないリクエスト
+        When: executeメソッドを呼び出す
+        Then: 401エラーが発生すること
+        """
+
+        # Given
+        self.request.state.user = None
+
+        # When & Then
+        with self.assertRaises(HTTPException) as context:
+            await self.use_case.execute(
+                self.request, self.channel_id, self.mock_session
+            )
+
+        self.assertEqual(context.exception.status_code, 401)
+        self.mock_channel_repository.get_channel_by_id.assert_not_called()
+
+    async def test_execute_channel_not_found(self):
+        """
+        Given: 存在しないチャネルID
+        When: executeメソッドを呼び出す
+        Then: 404エラーが発生し、ギルドメンバー確認は行われないこと
+        """
+
+        # Given
+        self.mock_channel_repository.get_channel_by_id.return_value = None
+
+        # When & Then
+        with self.assertRaises(HTTPException) as context:
+            await self.use_case.execute(
+                self.request, self.channel_id, self.mock_session
+            )
+
+        self.assertEqual(context.exception.status_code, 404)
+        self.mock_guild_repository.get_guild_by_member_channel.assert_not_called()
+
+    async def test_execute_deleted_channel(self):
+        """
+        Given: 削除済みのチャネル
+        When: executeメソッドを呼び出す
+        Then: 403エラーが発生すること
+        """
+
+        # Given
+        self.mock_channel_repository.get_channel_by_id.return_value = (
+            self.create_mock_channel(deleted_at=datetime.now())
+        )
+
+        # When & Then
+        with self.assertRaises(HTTPException) as context:
+            await self.use_case.execute(
+                self.request, self.channel_id, self.mock_session
+            )
+
+        self.assertEqual(context.exception.status_code, 403)
+
+    async def test_execute_not_guild_member(self):
+        """
+        Given: 存在するチャネルと、そのギルドに所属していないユーザー
+        When: executeメソッドを呼び出す
+        Then: 403エラーが発生すること
+        """
+
+        # Given
+        self.mock_channel_repository.get_channel_by_id.return_value = (
+            self.create_mock_channel()
+        )
+        self.mock_guild_repository.get_guild_by_member_channel.return_value = None
+
+        # When & Then
+        with self.assertRaises(HTTPException) as context:
+            await self.use_case.execute(
+                self.request, self.channel_id, self.mock_session
+            )
+
+        self.assertEqual(context.exception.status_code, 403)
+
+    async def test_execute_channel_repository_error(self):
+        """
+        Given: チャネル取得時にリポジトリ例外が発生する場合
+        When: executeメソッドを呼び出す
+        Then: 500エラーが発生すること
+        """
+
+        # Given
+        self.mock_channel_repository.get_channel_by_id.side_effect = ChannelQueryError(
+            "SQLAlchemyエラーにより [チャネル取得] に失敗"
+        )
+
+        # When & Then
+        with self.assertRaises(HTTPException) as context:
+            await self.use_case.execute(
+                self.request, self.channel_id, self.mock_session
+            )
+
+        self.assertEqual(context.exception.status_code, 500)
+
+    async def test_execute_guild_repository_error(self):
+        """
+        Given: ギルドメンバー確認時にリポジトリ例外が発生する場合
+        When: executeメソッドを呼び出す
+        Then: 500エラーが発生すること
+        """
+
+        # Given
+        self.mock_channel_repository.get_channel_by_id.return_value = (
+            self.create_mock_channel()
+        )
+        self.mock_guild_repository.get_guild_by_member_channel.side_effect = (
+            GuildQueryError("SQLAlchemyエラーにより [ギルド取得] に失敗")
+        )
+
+        # When & Then
+        with self.assertRaises(HTTPException) as context:
+            await self.use_case.execute(
+                self.request, self.channel_id, self.mock_session
+            )
+
+        self.assertEqual(context.exception.status_code, 500)
+
+    async def test_execute_cancelled(self):
+        """
+        Given: チャネル取得中にリクエストがキャンセルされた場合
+        When: executeメソッドを呼び出す
+        Then: 500エラーに変換されず、キャンセルがそのまま伝播すること
+        """
+
+        # Given
+        self.mock_channel_repository.get_channel_by_id.side_effect = (
+            asyncio.CancelledError()
+        )
+
+        # When & Then
+        with self.assertRaises(asyncio.CancelledError):
+            await self.use_case.execute(
+                self.request, self.channel_id, self.mock_session
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
+import asyncio
 import os
 import sys
 import unittest
 import uuid
+from datetime import datetime, timedelta, timezone
 from typing import AsyncGenerator
 
 from dotenv import load_dotenv
@@ -20,37 +22,24 @@ from usecase.friend import CHANNEL_TYPE_TEXT
 
 
 class TestChannelAPI(unittest.IsolatedAsyncioTestCase):
-    async def asyncSetUp(self):
-        # テスト環境であることを示す環境変数を設定
-        os.environ["TESTING"] = "true"
-
+    @classmethod
+    def setUpClass(cls):
         load_dotenv()
         DATABASE_URL = os.environ["DATABASE_URL_TEST"]
-        self.engine = create_async_engine(DATABASE_URL, echo=True, future=True)
-        self.AsyncSessionLocal = async_sessionmaker(
-            bind=self.engine,
+        # エンジンはクラス内で共有する（SQLのログ出力は行わない）
+        cls.engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+        cls.AsyncSessionLocal = async_sessionmaker(
+            bind=cls.engine,
             expire_on_commit=False,
             autoflush=False,
         )
 
-        # テーブル作成
-        async with self.engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-
-        # テーブルクリーンアップ処理を実行
-        async with self.engine.begin() as conn:
-            # 外部キー制約のため、子テーブルから削除
-            await conn.execute(text("DELETE FROM channels"))
-            await conn.execute(text("DELETE FROM messages"))
-            await conn.execute(text("DELETE FROM guild_members"))
-            await conn.execute(text("DELETE FROM guilds"))
-            await conn.execute(text("DELETE FROM friends"))
-            await conn.execute(text("DELETE FROM sessions"))
-            await conn.execute(text("DELETE FROM users"))
+        # テーブル作成はクラスで1回のみ行う
+        asyncio.run(cls._create_tables())
 
         # テスト用のデータベースセッション依存関数をオーバーライド
         async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
-            async with self.AsyncSessionLocal() as session:
+            async with cls.AsyncSessionLocal() as session:
                 yield session
 
         # テスト用のチャンネルアクセスチェック関数をオーバーライド（認証をスキップ）
@@ -59,15 +48,45 @@ class TestChannelAPI(unittest.IsolatedAsyncioTestCase):
             pass
 
         app.dependency_overrides[get_session] = override_get_session
-
         # チャンネルアクセスチェックをモック
         app.dependency_overrides[check_channel_access] = override_check_channel_access
 
-        # 非同期でAsyncClientを初期化
-        self.client = AsyncClient(
+        # AsyncClient もクラス内で共有する
+        # （ASGITransport は接続を保持しないため、テストごとのイベントループをまたいで使用できる）
+        cls.client = AsyncClient(
             transport=ASGITransport(app=app), base_url="http://testserver"
         )
 
+    @classmethod
+    def tearDownClass(cls):
+        # 依存関数のオーバーライドを削除
+        app.dependency_overrides.clear()
+        # クライアントを破棄
+        asyncio.run(cls.client.aclose())
+
+    @classmethod
+    async def _create_tables(cls):
+        async with cls.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        # 別のイベントループで作成した接続を各テストで使わないよう破棄する
+        await cls.engine.dispose()
+
+    async def asyncSetUp(self):
+        # テスト環境であることを示す環境変数を設定
+        os.environ["TESTING"] = "true"
+
+        # テーブルクリーンアップ処理を実行（1回の TRUNCATE で全テーブルを空にする）
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "TRUNCATE messages, channels, guild_members, guilds, friends,"
+                    " sessions, users CASCADE"
+                )
+            )
+
+        # 前のテストでログイン時に設定された Cookie を引き継がないよう破棄
+        self.client.cookies.clear()
+
         # テスト用データを事前に作成
         await self._create_test_data()
 
@@ -84,8 +103,6 @@ class TestChannelAPI(unittest.IsolatedAsyncioTestCase):
                 password_hash="hashed_password",
                 description="Test description",
             )
-            session.add(test_user)
-            await session.commit()
 
             # テスト用ギルド作成
             self.test_guild_id = uuid.uuid4()
@@ -94,16 +111,12 @@ class TestChannelAPI(unittest.IsolatedAsyncioTestCase):
                 name="Test Guild",
                 owner_user_id=self.test_user_id,
             )
-            session.add(test_guild)
-            await session.commit()
 
             # テスト用ギルドメンバー作成（アクセス権限のため）
             test_guild_member = GuildMember(
                 guild_id=self.test_guild_id,
                 user_id=self.test_user_id,
             )
-            session.add(test_guild_member)
-            await session.commit()
 
             # メッセージありのチャネル作成
             self.test_channel_with_messages_id = uuid.uuid4()
@@ -114,7 +127,6 @@ class TestChannelAPI(unittest.IsolatedAsyncioTestCase):
                 name="general",
                 owner_user_id=self.test_user_id,
             )
-            session.add(test_channel_with_messages)
 
             # メッセージなしのチャネル作成
             self.test_channel_empty_id = uuid.uuid4()
@@ -125,10 +137,10 @@ class TestChannelAPI(unittest.IsolatedAsyncioTestCase):
                 name="empty-channel",
                 owner_user_id=self.test_user_id,
             )
-            session.add(test_channel_empty)
-            await session.commit()
 
             # テスト用メッセージ作成（メッセージありチャネル用）
+            # 同一トランザクション内では now() が同じ値になるため、作成日時を明示して順序を固定する
+            base_time = datetime.now(timezone.utc)
             self.test_message1_id = uuid.uuid4()
             test_message1 = Message(
                 id=self.test_message1_id,
@@ -136,8 +148,8 @@ class TestChannelAPI(unittest.IsolatedAsyncioTestCase):
                 user_id=self.test_user_id,
                 type="default",
                 content="Hello, world!",
+                created_at=base_time,
             )
-            session.add(test_message1)
 
             test_message2 = Message(
                 id=uuid.uuid4(),
@@ -145,8 +157,8 @@ class TestChannelAPI(unittest.IsolatedAsyncioTestCase):
                 user_id=self.test_user_id,
                 type="default",
                 content="How are you?",
+                created_at=base_time + timedelta(seconds=1),
             )
-            session.add(test_message2)
 
             # 返信メッセージ
             test_message3 = Message(
@@ -156,9 +168,25 @@ class TestChannelAPI(unittest.IsolatedAsyncioTestCase):
                 type="default",
                 content="I'm fine, thank you!",
                 referenced_message_id=self.test_message1_id,
+                created_at=base_time + timedelta(seconds=2),
             )
-            session.add(test_message3)
 
+            # 関連（relationship）のないテーブル間の挿入順は保証されないため、
+            # 外部キーの参照先から順に flush し、コミットは1回にまとめる
+            session.add(test_user)
+            await session.flush()
+            session.add(test_guild)
+            await session.flush()
+            session.add_all(
+                [
+                    test_guild_member,
+                    test_channel_with_messages,
+                    test_channel_empty,
+                    test_message1,
+                    test_message2,
+                    test_message3,
+                ]
+            )
             await session.commit()
 
     async def asyncTearDown(self):
@@ -166,11 +194,7 @@ class TestChannelAPI(unittest.IsolatedAsyncioTestCase):
         if "TESTING" in os.environ:
             del os.environ["TESTING"]
 
-        # 依存関数のオーバーライドを削除
-        app.dependency_overrides.clear()
-        # クライアントを非同期に破棄
-        await self.client.aclose()
-        # エンジンを非同期に破棄
+        # テストごとのイベントループに紐づく接続を破棄（エンジン自体はクラスで共有）
         await self.engine.dispose()
 
     async def test_get_channel_success_with_messages(self):
@@ -188,6 +212,7 @@ class TestChannelAPI(unittest.IsolatedAsyncioTestCase):
 
         # Then: 200でチャネル情報とメッセージ一覧が返る
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/json")
         res_json = response.json()
 
         self.assertEqual(res_json["id"], channel_id)
@@ -1,12 +1,15 @@
+import asyncio
 import os
 import sys
 import unittest
 import uuid
+from datetime import datetime, timedelta, timezone
 
 from dotenv import load_dotenv
 from injector import Injector
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 # テストファイルのルートディレクトリからの相対パスでsrcフォルダを指定
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
@@ -26,97 +29,120 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
     def setUpClass(cls):
         load_dotenv()
         DATABASE_URL = os.environ["DATABASE_URL_TEST"]
-        cls.engine = create_async_engine(DATABASE_URL, echo=True, future=True)
-        cls.AsyncSessionLocal = async_sessionmaker(
-            bind=cls.engine,
-            expire_on_commit=False,
-            autoflush=False,
-        )
+        cls.engine = create_async_engine(DATABASE_URL, echo=False, future=True)
 
-    async def asyncSetUp(self):
-        # テーブル作成
-        async with self.engine.begin() as conn:
+        # テーブル作成とクリーンアップはクラスで1回のみ行う
+        asyncio.run(cls._prepare_tables())
+
+    @classmethod
+    async def _prepare_tables(cls):
+        async with cls.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                text(
+                    "TRUNCATE messages, channels, guild_members, guilds, friends,"
+                    " sessions, users CASCADE"
+                )
+            )
+
+        # 各テストで共通して使う所有者ユーザーはクラスで1回だけ作成する
+        # （各テストの変更はロールバックされるため、このユーザーはテスト間で残り続ける）
+        owner = User(
+            name="Owner",
+            username="owner",
+            email="owner@example.com",
+            password_hash="hashed_password",
+            description="Test description",
+        )
+        async with AsyncSession(cls.engine, expire_on_commit=False) as session:
+            session.add(owner)
+            await session.commit()
+        cls.owner_id = owner.id
 
-        # テーブルクリーンアップ処理を実行
-        async with self.engine.begin() as conn:
-            # 外部キー制約のため、子テーブルから削除
-            await conn.execute(text("DELETE FROM channels"))
-            await conn.execute(text("DELETE FROM messages"))
-            await conn.execute(text("DELETE FROM guild_members"))
-            await conn.execute(text("DELETE FROM guilds"))
-            await conn.execute(text("DELETE FROM friends"))
-            await conn.execute(text("DELETE FROM sessions"))
-            await conn.execute(text("DELETE FROM users"))
+        # 別のイベントループで作成した接続を各テストで使わないよう破棄する
+        await cls.engine.dispose()
+
+    async def asyncSetUp(self):
+        # テストごとに外部トランザクションを開始し、終了時にロールバックしてデータを元に戻す
+        self.connection = await self.engine.connect()
+        self.transaction = await self.connection.begin()
+        # セッション内の commit / rollback は外部トランザクション内の SAVEPOINT に対して行われる
+        self.AsyncSessionLocal = async_sessionmaker(
+            bind=self.connection,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
 
         # テスト用DIコンテナからリポジトリを取得
         injector = Injector([configure])
         self.repository = injector.get(ChannelRepositoryIf)
 
     async def asyncTearDown(self):
-        # エンジンを非同期に破棄
+        # テスト中の変更をすべて破棄
+        await self.transaction.rollback()
+        await self.connection.close()
+        # テストごとのイベントループに紐づく接続を破棄（エンジン自体はクラスで共有）
         await self.engine.dispose()
 
-    async def create_test_user(
+    async def _seed(self, *objects: object) -> None:
+        """テスト用データを1つのセッション・1回のコミットでまとめて登録する
+
+        サーバー側デフォルト値（created_at 等）は eager_defaults により
+        INSERT 時に取得されるため、コミット後の refresh は不要。
+        """
+        async with self.AsyncSessionLocal() as session:
+            session.add_all(objects)
+            await session.commit()
+
+    def build_test_user(
         self, name: str = "Test User", username: str = "testuser"
     ) -> User:
-        """テスト用ユーザーを作成"""
-        user = User(
+        """テスト用ユーザーを生成（登録は _seed で行う）"""
+        return User(
+            id=uuid.uuid4(),
             name=name,
             username=username,
             email=f"{username}@example.com",
             password_hash="hashed_password",
             description="Test description",
         )
-        async with self.AsyncSessionLocal() as session:
-            session.add(user)
-            await session.commit()
-            await session.refresh(user)
-            return user
 
-    async def create_test_guild(
+    def build_test_guild(
         self, owner_user_id: uuid.UUID, name: str = "Test Guild"
     ) -> Guild:
-        """テスト用ギルドを作成"""
-        guild = Guild(
+        """テスト用ギルドを生成（登録は _seed で行う）"""
+        return Guild(
+            id=uuid.uuid4(),
             name=name,
             owner_user_id=owner_user_id,
         )
-        async with self.AsyncSessionLocal() as session:
-            session.add(guild)
-            await session.commit()
-            await session.refresh(guild)
-            return guild
 
-    async def create_test_guild_member(
+    def build_test_guild_member(
         self, guild_id: uuid.UUID, user_id: uuid.UUID
     ) -> GuildMember:
-        """テスト用ギルドメンバーを作成"""
-        guild_member = GuildMember(
+        """テスト用ギルドメンバーを生成（登録は _seed で行う）"""
+        return GuildMember(
             guild_id=guild_id,
             user_id=user_id,
         )
-        async with self.AsyncSessionLocal() as session:
-            session.add(guild_member)
-            await session.commit()
-            await session.refresh(guild_member)
-            return guild_member
 
-    async def create_test_message(
-        self, channel_id: uuid.UUID, user_id: uuid.UUID, content: str = "Test message"
+    def build_test_message(
+        self,
+        channel_id: uuid.UUID,
+        user_id: uuid.UUID,
+        content: str = "Test message",
+        created_at: datetime | None = None,
     ) -> Message:
-        """テスト用メッセージを作成"""
-        message = Message(
+        """テスト用メッセージを生成（登録は _seed で行う）"""
+        return Message(
+            id=uuid.uuid4(),
             channel_id=channel_id,
             user_id=user_id,
             type="default",
             content=content,
+            created_at=created_at,
         )
-        async with self.AsyncSessionLocal() as session:
-            session.add(message)
-            await session.commit()
-            await session.refresh(message)
-            return message
 
     async def test_create_channel_success(self):
         """
@@ -125,13 +151,11 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
         Then: チャネルが正常に作成されること
         """
 
-        # Given: テスト用ユーザーを作成
-        owner = await self.create_test_user("Owner", "owner")
-
+        # Given: クラス共通の所有者ユーザーのチャネル情報
         channel = Channel(
             type=CHANNEL_TYPE_TEXT,
             name="general",
-            owner_user_id=uuid.UUID(str(owner.id)),
+            owner_user_id=self.owner_id,
         )
 
         # When: チャネルを作成
@@ -143,7 +167,7 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(result.id)
         self.assertEqual(result.type, CHANNEL_TYPE_TEXT)
         self.assertEqual(result.name, "general")
-        self.assertEqual(result.owner_user_id, uuid.UUID(str(owner.id)))
+        self.assertEqual(result.owner_user_id, self.owner_id)
         self.assertIsNotNone(result.created_at)
         self.assertIsNotNone(result.updated_at)
 
@@ -154,14 +178,11 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
         Then: 2つ目のチャネルも正常に作成されること（同じ名前でも異なるIDで作成可能）
         """
 
-        # Given: テスト用ユーザーを作成
-        owner = await self.create_test_user("Owner", "owner")
-
-        # 最初のチャネルを作成
+        # Given: クラス共通の所有者ユーザーで最初のチャネルを作成
         first_channel = Channel(
             type=CHANNEL_TYPE_TEXT,
             name="general",
-            owner_user_id=uuid.UUID(str(owner.id)),
+            owner_user_id=self.owner_id,
         )
         async with self.AsyncSessionLocal() as session:
             first_result = await self.repository.create_channel(session, first_channel)
@@ -171,7 +192,7 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
         second_channel = Channel(
             type=CHANNEL_TYPE_TEXT,
             name="general",  # 同じ名前
-            owner_user_id=uuid.UUID(str(owner.id)),
+            owner_user_id=self.owner_id,
         )
         async with self.AsyncSessionLocal() as session:
             second_result = await self.repository.create_channel(
@@ -221,12 +242,11 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
         Then: 対応するチャネルが取得されること
         """
 
-        # Given: テスト用ユーザーとチャネルを作成
-        owner = await self.create_test_user("Owner", "owner")
+        # Given: クラス共通の所有者ユーザーのチャネルを作成
         channel = Channel(
             type=CHANNEL_TYPE_TEXT,
             name="test-channel",
-            owner_user_id=uuid.UUID(str(owner.id)),
+            owner_user_id=self.owner_id,
         )
 
         async with self.AsyncSessionLocal() as session:
@@ -245,7 +265,7 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(result.id, created_channel.id)
             self.assertEqual(result.type, CHANNEL_TYPE_TEXT)
             self.assertEqual(result.name, "test-channel")
-            self.assertEqual(result.owner_user_id, uuid.UUID(str(owner.id)))
+            self.assertEqual(result.owner_user_id, self.owner_id)
 
     async def test_get_channel_by_id_nonexistent_channel(self):
         """
@@ -266,6 +286,95 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
         # Then: Noneが返される
         self.assertIsNone(result)
 
+    async def test_get_channel_by_id_messages_not_lazy_loaded(self):
+        """
+        Given: 存在するチャネルID
+        When: get_channel_by_idで取得したチャネルのmessagesにアクセスする
+        Then: 暗黙の遅延読み込みは行われず、例外が発生すること
+        """
+
+        # Given
+        channel = Channel(
+            type=CHANNEL_TYPE_TEXT,
+            name="test-channel",
+            owner_user_id=self.owner_id,
+        )
+
+        async with self.AsyncSessionLocal() as session:
+            created_channel = await self.repository.create_channel(session, channel)
+            await session.commit()  # テスト用に明示的にcommit
+
+        # When / Then
+        async with self.AsyncSessionLocal() as session:
+            result = await self.repository.get_channel_by_id(
+                session, str(created_channel.id)
+            )
+
+            with self.assertRaises(InvalidRequestError):
+                _ = result.messages  # type: ignore
+
+    async def test_get_channel_with_messages_success(self):
+        """
+        Given: メッセージが投稿済みのチャネル
+        When: get_channel_with_messagesメソッドを呼び出す
+        Then: チャネルと作成日時順のメッセージ一覧が取得されること
+        """
+
+        # Given: クラス共通の所有者ユーザーのチャネル・メッセージを作成
+        channel = Channel(
+            type=CHANNEL_TYPE_TEXT,
+            name="test-channel",
+            owner_user_id=self.owner_id,
+        )
+
+        async with self.AsyncSessionLocal() as session:
+            created_channel = await self.repository.create_channel(session, channel)
+            await session.commit()  # テスト用に明示的にcommit
+
+        # テスト全体が1つのトランザクション内で実行され now() が同じ値になるため、作成日時を明示する
+        base_time = datetime.now(timezone.utc)
+        first = self.build_test_message(
+            uuid.UUID(str(created_channel.id)),
+            self.owner_id,
+            "first",
+            base_time,
+        )
+        second = self.build_test_message(
+            uuid.UUID(str(created_channel.id)),
+            self.owner_id,
+            "second",
+            base_time + timedelta(seconds=1),
+        )
+        await self._seed(first, second)
+
+        # When: チャネルIDでチャネルとメッセージ一覧を取得
+        async with self.AsyncSessionLocal() as session:
+            result = await self.repository.get_channel_with_messages(
+                session, str(created_channel.id)
+            )
+
+        # Then: チャネルとメッセージ一覧が取得される
+        self.assertIsNotNone(result)
+        if result is not None:
+            self.assertEqual(result.id, created_channel.id)
+            self.assertEqual([m.id for m in result.messages], [first.id, second.id])
+
+    async def test_get_channel_with_messages_nonexistent_channel(self):
+        """
+        Given: 存在しないチャネルID
+        When: get_channel_with_messagesメソッドを呼び出す
+        Then: Noneが返されること
+        """
+
+        # When
+        async with self.AsyncSessionLocal() as session:
+            result = await self.repository.get_channel_with_messages(
+                session, str(uuid.uuid4())
+            )
+
+        # Then
+        self.assertIsNone(result)
+
     async def test_update_last_message_id_success(self):
         """
         Given: 存在するチャネルIDと有効なメッセージID
@@ -273,12 +382,11 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
         Then: チャネルのlast_message_idが正常に更新されること
         """
 
-        # Given: テスト用ユーザーとチャネルを作成
-        owner = await self.create_test_user("Owner", "owner")
+        # Given: クラス共通の所有者ユーザーのチャネルを作成
         channel = Channel(
             type=CHANNEL_TYPE_TEXT,
             name="test-channel",
-            owner_user_id=uuid.UUID(str(owner.id)),
+            owner_user_id=self.owner_id,
         )
 
         async with self.AsyncSessionLocal() as session:
@@ -286,9 +394,10 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
             await session.commit()  # テスト用に明示的にcommit
 
         # 実際のメッセージを作成
-        message = await self.create_test_message(
-            uuid.UUID(str(created_channel.id)), uuid.UUID(str(owner.id))
+        message = self.build_test_message(
+            uuid.UUID(str(created_channel.id)), self.owner_id
         )
+        await self._seed(message)
 
         # When: last_message_idを更新
         async with self.AsyncSessionLocal() as session:
@@ -315,11 +424,10 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
         """
 
         # Given: 存在するチャネルと実際のメッセージIDを作成
-        owner = await self.create_test_user("Owner", "owner")
         channel = Channel(
             type="text",
             name="temp-channel",
-            owner_user_id=uuid.UUID(str(owner.id)),
+            owner_user_id=self.owner_id,
         )
 
         async with self.AsyncSessionLocal() as session:
@@ -327,9 +435,10 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
             await session.commit()
 
         # 実際のメッセージを作成
-        message = await self.create_test_message(
-            uuid.UUID(str(temp_channel.id)), uuid.UUID(str(owner.id))
+        message = self.build_test_message(
+            uuid.UUID(str(temp_channel.id)), self.owner_id
         )
+        await self._seed(message)
 
         # 存在しないチャネルIDを生成
         nonexistent_channel_id = str(uuid.uuid4())
@@ -348,12 +457,11 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
         Then: 最後に更新されたメッセージIDが設定されていること
         """
 
-        # Given: テスト用ユーザーとチャネルを作成
-        owner = await self.create_test_user("Owner", "owner")
+        # Given: クラス共通の所有者ユーザーのチャネルを作成
         channel = Channel(
             type=CHANNEL_TYPE_TEXT,
             name="test-channel",
-            owner_user_id=uuid.UUID(str(owner.id)),
+            owner_user_id=self.owner_id,
         )
 
         async with self.AsyncSessionLocal() as session:
@@ -361,21 +469,22 @@ class TestChannelRepository(unittest.IsolatedAsyncioTestCase):
             await session.commit()  # テスト用に明示的にcommit
 
         # 複数のメッセージを作成
-        first_message = await self.create_test_message(
+        first_message = self.build_test_message(
             uuid.UUID(str(created_channel.id)),
-            uuid.UUID(str(owner.id)),
+            self.owner_id,
             "First message",
         )
-        second_message = await self.create_test_message(
+        second_message = self.build_test_message(
             uuid.UUID(str(created_channel.id)),
-            uuid.UUID(str(owner.id)),
+            self.owner_id,
             "Second message",
         )
-        final_message = await self.create_test_message(
+        final_message = self.build_test_message(
             uuid.UUID(str(created_channel.id)),
-            uuid.UUID(str(owner.id)),
+            self.owner_id,
             "Final message",
         )
+        await self._seed(first_message, second_message, final_message)
 
         # When: 複数回更新
         async with self.AsyncSessionLocal() as session:
@@ -14,7 +14,13 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 from dependencies import configure
 from domains import Message
 from schema.message_schema import MessageCreateRequest, MessageResponse
-from usecase.create_message import CreateMessageTransactionError, CreateMessageUseCaseIf
+from repository.message_repository import MessageCreateError
+from sqlalchemy.exc import IntegrityError
+from usecase.create_message import (
+    ChannelNotFoundError,
+    CreateMessageTransactionError,
+    CreateMessageUseCaseIf,
+)
 
 
 class TestCreateMessageUseCaseImpl(unittest.IsolatedAsyncioTestCase):
@@ -75,15 +81,12 @@ class TestCreateMessageUseCaseImpl(unittest.IsolatedAsyncioTestCase):
             referenced_message_id=referenced_message_id,
         )
 
-    @patch("usecase.create_message.ChannelRepositoryIf")
     @patch("usecase.create_message.MessageRepositoryIf")
-    async def test_execute_success(
-        self, mock_message_repository_class, mock_channel_repository_class
-    ):
+    async def test_execute_success(self, mock_message_repository_class):
         """
         Given: 有効なメッセージ作成リクエスト
         When: executeメソッドを呼び出す
-        Then: メッセージが正常に作成され、チャネルの最終メッセージIDが更新されること
+        Then: メッセージが正常に作成され、チャネルの最終メッセージIDが同時に更新されること
         """
 
         # Given
@@ -108,16 +111,13 @@ class TestCreateMessageUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # モックの設定
         mock_message_repo = AsyncMock()
-        mock_message_repo.create_message.return_value = expected_message
+        mock_message_repo.create_message_with_channel_update.return_value = (
+            expected_message
+        )
         mock_message_repository_class.return_value = mock_message_repo
 
-        mock_channel_repo = AsyncMock()
-        mock_channel_repo.update_last_message_id.return_value = None
-        mock_channel_repository_class.return_value = mock_channel_repo
-
         # リポジトリをモックに置き換え
         self.use_case.message_repo = mock_message_repo
-        self.use_case.channel_repo = mock_channel_repo
 
         # When
         result = await self.use_case.execute(self.mock_session, request)
@@ -130,24 +130,24 @@ class TestCreateMessageUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.user_id, user_id)
         self.assertEqual(result.type, "default")
         self.assertEqual(result.content, "Test message")
-
-        # メッセージリポジトリが呼び出されること
-        mock_message_repo.create_message.assert_called_once()
-
-        # チャネルの最終メッセージIDが更新されること
-        mock_channel_repo.update_last_message_id.assert_called_once_with(
-            self.mock_session, str(channel_id), str(message_id)
+        # 検証を省略して構築したレスポンスが、検証した場合と一致すること
+        self.assertEqual(
+            result.model_dump(),
+            MessageResponse.model_validate(expected_message).model_dump(),
         )
 
-    @patch("usecase.create_message.ChannelRepositoryIf")
+        # メッセージ作成とチャネル更新が1回の呼び出しで行われること
+        mock_message_repo.create_message_with_channel_update.assert_called_once()
+        self.mock_session.commit.assert_awaited_once()
+
     @patch("usecase.create_message.MessageRepositoryIf")
     async def test_execute_message_repository_error(
-        self, mock_message_repository_class, mock_channel_repository_class
+        self, mock_message_repository_class
     ):
         """
         Given: メッセージリポジトリでエラーが発生する状況
         When: executeメソッドを呼び出す
-        Then: エラーが適切に伝播されること
+        Then: エラーが適切に伝播され、ロールバックされること
         """
 
         # Given
@@ -160,15 +160,13 @@ class TestCreateMessageUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # モックの設定 - メッセージ作成でエラーを発生させる
         mock_message_repo = AsyncMock()
-        mock_message_repo.create_message.side_effect = Exception("Database error")
+        mock_message_repo.create_message_with_channel_update.side_effect = Exception(
+            "Database error"
+        )
         mock_message_repository_class.return_value = mock_message_repo
 
-        mock_channel_repo = AsyncMock()
-        mock_channel_repository_class.return_value = mock_channel_repo
-
         # リポジトリをモックに置き換え
         self.use_case.message_repo = mock_message_repo
-        self.use_case.channel_repo = mock_channel_repo
 
         # When & Then
         with self.assertRaises(CreateMessageTransactionError) as context:
@@ -177,61 +175,78 @@ class TestCreateMessageUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(str(context.exception), "予期しないエラーが発生しました")
 
         # メッセージリポジトリが呼び出されること
-        mock_message_repo.create_message.assert_called_once()
-
-        # エラー後にチャネル更新が呼び出されないこと
-        mock_channel_repo.update_last_message_id.assert_not_called()
+        mock_message_repo.create_message_with_channel_update.assert_called_once()
+        self.mock_session.commit.assert_not_awaited()
+        self.mock_session.rollback.assert_awaited_once()
+
+    def create_fkey_violation(self, constraint_name):
+        """指定した制約名の外部キー制約違反（asyncpg 経由の IntegrityError）を作成"""
+        driver_error = Exception("foreign key violation")
+        driver_error.constraint_name = constraint_name
+        dbapi_error = Exception("foreign key violation")
+        dbapi_error.__cause__ = driver_error
+        return IntegrityError("INSERT", {}, dbapi_error)
 
-    @patch("usecase.create_message.ChannelRepositoryIf")
     @patch("usecase.create_message.MessageRepositoryIf")
-    async def test_execute_channel_repository_error(
-        self, mock_message_repository_class, mock_channel_repository_class
-    ):
+    async def test_execute_channel_not_found(self, mock_message_repository_class):
         """
-        Given: チャネルリポジトリでエラーが発生する状況
+        Given: 存在しないチャネルへのメッセージ作成（外部キー制約違反）
         When: executeメソッドを呼び出す
-        Then: エラーが適切に伝播されること
+        Then: ChannelNotFoundErrorが発生すること
         """
 
         # Given
-        message_id = uuid.uuid4()
-        channel_id = uuid.uuid4()
-        user_id = uuid.uuid4()
+        request = self.create_mock_message_request()
 
-        request = self.create_mock_message_request(
-            channel_id=channel_id, user_id=user_id
+        # モックの設定 - 外部キー制約違反を発生させる
+        mock_message_repo = AsyncMock()
+        mock_message_repo.create_message_with_channel_update.side_effect = (
+            MessageCreateError(
+                "データベース制約違反により [メッセージ作成・チャネル更新] に失敗",
+                self.create_fkey_violation("messages_channel_id_fkey"),
+            )
         )
+        mock_message_repository_class.return_value = mock_message_repo
 
-        expected_message = self.create_mock_message(
-            message_id=message_id, channel_id=channel_id, user_id=user_id
-        )
+        # リポジトリをモックに置き換え
+        self.use_case.message_repo = mock_message_repo
 
-        # モックの設定 - チャネル更新でエラーを発生させる
-        mock_message_repo = AsyncMock()
-        mock_message_repo.create_message.return_value = expected_message
-        mock_message_repository_class.return_value = mock_message_repo
+        # When & Then
+        with self.assertRaises(ChannelNotFoundError):
+            await self.use_case.execute(self.mock_session, request)
+
+        self.mock_session.rollback.assert_awaited_once()
+
+    @patch("usecase.create_message.MessageRepositoryIf")
+    async def test_execute_other_integrity_error(self, mock_message_repository_class):
+        """
+        Given: チャネルID以外の外部キー制約違反（存在しない参照メッセージID）
+        When: executeメソッドを呼び出す
+        Then: ChannelNotFoundErrorではなくCreateMessageTransactionErrorが発生すること
+        """
 
-        mock_channel_repo = AsyncMock()
-        mock_channel_repo.update_last_message_id.side_effect = Exception(
-            "Channel update error"
+        # Given
+        request = self.create_mock_message_request(referenced_message_id=uuid.uuid4())
+
+        # モックの設定 - 参照メッセージIDの外部キー制約違反を発生させる
+        mock_message_repo = AsyncMock()
+        mock_message_repo.create_message_with_channel_update.side_effect = (
+            MessageCreateError(
+                "データベース制約違反により [メッセージ作成・チャネル更新] に失敗",
+                self.create_fkey_violation("messages_referenced_message_id_fkey"),
+            )
         )
-        mock_channel_repository_class.return_value = mock_channel_repo
+        mock_message_repository_class.return_value = mock_message_repo
 
         # リポジトリをモックに置き換え
         self.use_case.message_repo = mock_message_repo
-        self.use_case.channel_repo = mock_channel_repo
 
         # When & Then
         with self.assertRaises(CreateMessageTransactionError) as context:
             await self.use_case.execute(self.mock_session, request)
 
-        self.assertEqual(str(context.exception), "予期しないエラーが発生しました")
-
-        # メッセージリポジトリが呼び出されること
-        mock_message_repo.create_message.assert_called_once()
-
-        # チャネル更新が呼び出されること
-        mock_channel_repo.update_last_message_id.assert_called_once()
+        self.assertNotIsInstance(context.exception, ChannelNotFoundError)
+        self.mock_session.rollback.assert_awaited_once()
 
 
 if __name__ == "__main__":
@@ -13,7 +13,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
 from dependencies import configure
-from domains import Guild, GuildMember, User
+from domains import User
+from repository.user_repository import UserCreateError
 from schema.user_schema import UserCreateRequest, UserResponse
 from usecase.create_user import CreateUserTransactionError, CreateUserUseCaseIf
 from utils.utils import hash_password
@@ -25,17 +26,12 @@ class TestCreateUserUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         injector = Injector([configure])
         self.use_case = injector.get(CreateUserUseCaseIf)
         self.mock_session = Mock(spec=AsyncSession)
+        # session.begin() をトランザクションスコープとして使用できるように設定
+        self.mock_session.begin.return_value = AsyncMock()
 
     # リポジトリのみモックをパッチ
-    @patch("usecase.create_user.GuildMemberRepositoryIf")
-    @patch("usecase.create_user.GuildRepositoryIf")
     @patch("usecase.create_user.UserRepositoryIf")
-    async def test_execute_success(
-        self,
-        mock_user_repository_class,
-        mock_guild_repository_class,
-        mock_guild_member_repository_class,
-    ):
+    async def test_execute_success(self, mock_user_repository_class):
         """
         Given: 有効なユーザー作成リクエスト
         When: executeメソッドを呼び出す
@@ -43,9 +39,8 @@ class TestCreateUserUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         """
 
         # Given
-        test_user_id = str(uuid.uuid4())
-        test_guild_id = str(uuid.uuid4())
-        test_guild_member_id = str(uuid.uuid4())
+        test_user_id = uuid.uuid4()
+        test_guild_id = uuid.uuid4()
 
         request = UserCreateRequest(
             name="Test User",
@@ -66,54 +61,49 @@ class TestCreateUserUseCaseImpl(unittest.IsolatedAsyncioTestCase):
             updated_at=datetime.now(),
         )
 
-        expected_guild = Guild(
-            id=test_guild_id,
-            owner_user_id=test_user_id,
-        )
-
-        expected_guild_member = GuildMember(
-            id=test_guild_member_id,
-            user_id=test_user_id,
-            guild_id=test_guild_id,
-        )
-
         # モックの設定
         mock_user_repository = AsyncMock()
-        mock_user_repository.create_user.return_value = expected_user
-        mock_user_repository_class.return_value = mock_user_repository
-
-        mock_guild_repository = AsyncMock()
-        mock_guild_repository.create_guild.return_value = expected_guild
-        mock_guild_repository_class.return_value = mock_guild_repository
-
-        mock_guild_member_repository = AsyncMock()
-        mock_guild_member_repository.create_guild_member.return_value = (
-            expected_guild_member
+        mock_user_repository.create_user_with_guild.return_value = (
+            expected_user,
+            test_guild_id,
         )
-        mock_guild_member_repository_class.return_value = mock_guild_member_repository
+        mock_user_repository_class.return_value = mock_user_repository
 
         # リポジトリをモックに置き換え
         self.use_case.user_repo = mock_user_repository
-        self.use_case.guild_repo = mock_guild_repository
-        self.use_case.guild_member_repo = mock_guild_member_repository
 
         # When
         result = await self.use_case.execute(self.mock_session, request)
 
         # Then
         self.assertIsInstance(result, UserResponse)
-        self.assertEqual(result.id, uuid.UUID(test_user_id))
+        self.assertEqual(result.id, test_user_id)
         self.assertEqual(result.name, expected_user.name)
         self.assertEqual(result.username, expected_user.username)
         self.assertEqual(result.email, expected_user.email)
         self.assertEqual(result.description, expected_user.description)
-        self.assertEqual(result.guild_id, uuid.UUID(test_guild_id))
+        self.assertEqual(result.guild_id, test_guild_id)
+        # 検証を省略して構築したレスポンスが、検証した場合と一致すること
+        self.assertEqual(
+            result.model_dump(),
+            UserResponse.model_validate(
+                {
+                    "id": expected_user.id,
+                    "name": expected_user.name,
+                    "username": expected_user.username,
+                    "email": expected_user.email,
+                    "description": expected_user.description,
+                    "created_at": expected_user.created_at,
+                    "updated_at": expected_user.updated_at,
+                    "guild_id": test_guild_id,
+                }
+            ).model_dump(),
+        )
 
-        mock_user_repository.create_user.assert_called_once()
-        mock_guild_repository.create_guild.assert_called_once()
+        mock_user_repository.create_user_with_guild.assert_called_once()
 
-        # create_userに渡されたUserオブジェクトの検証
-        call_args = mock_user_repository.create_user.call_args[0]
+        # create_user_with_guildに渡されたUserオブジェクトの検証
+        call_args = mock_user_repository.create_user_with_guild.call_args[0]
         # sessionの次の引数を取得
         created_user = call_args[1]
         # created_userからパスワードを取得
@@ -135,15 +125,8 @@ class TestCreateUserUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         self.assertNotEqual(created_user.password_hash, expected_user.password_hash)
         self.assertEqual(created_user.password_hash, recreated_hash)
 
-    @patch("usecase.create_user.GuildMemberRepositoryIf")
-    @patch("usecase.create_user.GuildRepositoryIf")
     @patch("usecase.create_user.UserRepositoryIf")
-    async def test_execute_with_empty_description(
-        self,
-        mock_user_repository_class,
-        mock_guild_repository_class,
-        mock_guild_member_repository_class,
-    ):
+    async def test_execute_with_empty_description(self, mock_user_repository_class):
         """
         Given: 説明が空のユーザー作成リクエスト
         When: executeメソッドを呼び出す
@@ -151,9 +134,8 @@ class TestCreateUserUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         """
 
         # Given
-        test_user_id = str(uuid.uuid4())
-        test_guild_id = str(uuid.uuid4())
-        test_guild_member_id = str(uuid.uuid4())
+        test_user_id = uuid.uuid4()
+        test_guild_id = uuid.uuid4()
 
         request = UserCreateRequest(
             name="Test User",
@@ -174,54 +156,33 @@ class TestCreateUserUseCaseImpl(unittest.IsolatedAsyncioTestCase):
             updated_at=datetime.now(),
         )
 
-        expected_guild = Guild(
-            id=test_guild_id,
-            owner_user_id=test_user_id,
-        )
-
-        expected_guild_member = GuildMember(
-            id=test_guild_member_id,
-            user_id=test_user_id,
-            guild_id=test_guild_id,
-        )
-
         # モックの設定
         mock_user_repository = AsyncMock()
-        mock_user_repository.create_user.return_value = expected_user
-        mock_user_repository_class.return_value = mock_user_repository
-
-        mock_guild_repository = AsyncMock()
-        mock_guild_repository.create_guild.return_value = expected_guild
-        mock_guild_repository_class.return_value = mock_guild_repository
-
-        mock_guild_member_repository = AsyncMock()
-        mock_guild_member_repository.create_guild_member.return_value = (
-            expected_guild_member
+        mock_user_repository.create_user_with_guild.return_value = (
+            expected_user,
+            test_guild_id,
         )
-        mock_guild_member_repository_class.return_value = mock_guild_member_repository
+        mock_user_repository_class.return_value = mock_user_repository
 
         # リポジトリをモックに置き換え
         self.use_case.user_repo = mock_user_repository
-        self.use_case.guild_repo = mock_guild_repository
-        self.use_case.guild_member_repo = mock_guild_member_repository
 
         # When
         result = await self.use_case.execute(self.mock_session, request)
 
         # Then
         self.assertIsInstance(result, UserResponse)
-        self.assertEqual(result.id, uuid.UUID(test_user_id))
+        self.assertEqual(result.id, test_user_id)
         self.assertEqual(result.name, expected_user.name)
         self.assertEqual(result.username, expected_user.username)
         self.assertEqual(result.email, expected_user.email)
         self.assertEqual(result.description, expected_user.description)
-        self.assertEqual(result.guild_id, uuid.UUID(test_guild_id))
+        self.assertEqual(result.guild_id, test_guild_id)
 
-        mock_user_repository.create_user.assert_called_once()
-        mock_guild_repository.create_guild.assert_called_once()
+        mock_user_repository.create_user_with_guild.assert_called_once()
 
-        # create_userに渡されたUserオブジェクトの検証
-        call_args = mock_user_repository.create_user.call_args[0]
+        # create_user_with_guildに渡されたUserオブジェクトの検証
+        call_args = mock_user_repository.create_user_with_guild.call_args[0]
         # sessionの次の引数を取得
         created_user = call_args[1]
         # created_userからパスワードを取得
@@ -242,15 +203,8 @@ class TestCreateUserUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         self.assertNotEqual(created_user.password_hash, expected_user.password_hash)
         self.assertEqual(created_user.password_hash, recreated_hash)
 
-    @patch("usecase.create_user.GuildMemberRepositoryIf")
-    @patch("usecase.create_user.GuildRepositoryIf")
     @patch("usecase.create_user.UserRepositoryIf")
-    async def test_execute_repository_error(
-        self,
-        mock_user_repository_class,
-        mock_guild_repository_class,
-        mock_guild_member_repository_class,
-    ):
+    async def test_execute_repository_error(self, mock_user_repository_class):
         """
         Given: リポジトリでエラーが発生する場合
         When: executeメソッドを呼び出す
@@ -268,38 +222,56 @@ class TestCreateUserUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # モックの設定
         mock_user_repository = AsyncMock()
-        mock_user_repository.create_user.side_effect = Exception("データベースエラー")
+        mock_user_repository.create_user_with_guild.side_effect = Exception(
+            "データベースエラー"
+        )
         mock_user_repository_class.return_value = mock_user_repository
 
-        mock_guild_repository = AsyncMock()
-        mock_guild_repository_class.return_value = mock_guild_repository
+        # リポジトリをモックに置き換え
+        self.use_case.user_repo = mock_user_repository
+
+        # When & Then
+        with self.assertRaises(CreateUserTransactionError) as context:
+            await self.use_case.execute(self.mock_session, request)
 
-        mock_guild_member_repository = AsyncMock()
-        mock_guild_member_repository_class.return_value = mock_guild_member_repository
+        self.assertEqual(str(context.exception), "予期しないエラーが発生しました")
+        mock_user_repository.create_user_with_guild.assert_called_once()
+
+    @patch("usecase.create_user.UserRepositoryIf")
+    async def test_execute_user_repository_error(self, mock_user_repository_class):
+        """
+        Given: ユーザー・ギルドの作成でリポジトリ例外が発生する場合
+        When: executeメソッドを呼び出す
+        Then: ユーザー作成エラーとしてCreateUserTransactionErrorが発生すること
+        """
+
+        # Given
+        request = UserCreateRequest(
+            name="Test User",
+            username="testuser",
+            email="test@example.com",
+            password="hashed_password",
+            description="Test description",
+        )
+
+        # モックの設定
+        mock_user_repository = AsyncMock()
+        mock_user_repository.create_user_with_guild.side_effect = UserCreateError(
+            "データベース制約違反により [ユーザー作成] に失敗"
+        )
+        mock_user_repository_class.return_value = mock_user_repository
 
         # リポジトリをモックに置き換え
         self.use_case.user_repo = mock_user_repository
-        self.use_case.guild_repo = mock_guild_repository
-        self.use_case.guild_member_repo = mock_guild_member_repository
 
         # When & Then
         with self.assertRaises(CreateUserTransactionError) as context:
             await self.use_case.execute(self.mock_session, request)
 
-        self.assertEqual(str(context.exception), "予期しないエラーが発生しました")
-        mock_user_repository.create_user.assert_called_once()
-        # ユーザー作成でエラーが発生するため、ギルド作成は呼ばれない
-        mock_guild_repository.create_guild.assert_not_called()
+        self.assertEqual(str(context.exception), "ユーザー作成中にエラーが発生しました")
 
-    @patch("usecase.create_user.GuildMemberRepositoryIf")
-    @patch("usecase.create_user.GuildRepositoryIf")
     @patch("usecase.create_user.UserRepositoryIf")
-    async def test_password_hashing_integration(
-        self,
-        mock_user_repository_class,
-        mock_guild_repository_class,
-        mock_guild_member_repository_class,
-    ):
+    async def test_password_hashing_integration(self, mock_user_repository_class):
         """
         Given: 同じパスワードを持つ複数のリクエスト
         When: executeメソッドを複数回呼び出す
@@ -307,9 +279,8 @@ class TestCreateUserUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         """
 
         # Given
-        test_user_id = str(uuid.uuid4())
-        test_guild_id = str(uuid.uuid4())
-        test_guild_member_id = str(uuid.uuid4())
+        test_user_id = uuid.uuid4()
+        test_guild_id = uuid.uuid4()
 
         request1 = UserCreateRequest(
             name="Test User1",
@@ -329,37 +300,23 @@ class TestCreateUserUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # モックの設定
         mock_user_repository = AsyncMock()
-        mock_user_repository.create_user.return_value = User(
-            id=test_user_id,
-            name="Test User",
-            username="testuser",
-            email="test@example.com",
-            password_hash="hashed_password",
-            description="Test description",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+        mock_user_repository.create_user_with_guild.return_value = (
+            User(
+                id=test_user_id,
+                name="Test User",
+                username="testuser",
+                email="test@example.com",
+                password_hash="hashed_password",
+                description="Test description",
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+            ),
+            test_guild_id,
         )
         mock_user_repository_class.return_value = mock_user_repository
 
-        mock_guild_repository = AsyncMock()
-        mock_guild_repository.create_guild.return_value = Guild(
-            id=test_guild_id,
-            owner_user_id=test_user_id,
-        )
-        mock_guild_repository_class.return_value = mock_guild_repository
-
-        mock_guild_member_repository = AsyncMock()
-        mock_guild_member_repository.create_guild_member.return_value = GuildMember(
-            id=test_guild_member_id,
-            user_id=test_user_id,
-            guild_id=test_guild_id,
-        )
-        mock_guild_member_repository_class.return_value = mock_guild_member_repository
-
         # リポジトリをモックに置き換え
         self.use_case.user_repo = mock_user_repository
-        self.use_case.guild_repo = mock_guild_repository
-        self.use_case.guild_member_repo = mock_guild_member_repository
 
         # When
         await self.use_case.execute(self.mock_session, request1)
@@ -367,13 +324,12 @@ class TestCreateUserUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # Then
         # 2回呼び出されることを確認
-        self.assertEqual(mock_user_repository.create_user.call_count, 2)
-        self.assertEqual(mock_guild_repository.create_guild.call_count, 2)
-        self.assertEqual(mock_guild_member_repository.create_guild_member.call_count, 2)
+        self.assertEqual(mock_user_repository.create_user_with_guild.call_count, 2)
 
         # 両方の呼び出しで渡されたUserオブジェクトのパスワードハッシュを取得
-        first_call = mock_user_repository.create_user.call_args_list[0][0][1]
-        second_call = mock_user_repository.create_user.call_args_list[1][0][1]
+        call_args_list = mock_user_repository.create_user_with_guild.call_args_list
+        first_call = call_args_list[0][0][1]
+        second_call = call_args_list[1][0][1]
 
         # 同じパスワードでも異なるハッシュ値が生成されることを確認（ソルト使用）
         self.assertNotEqual(first_call.password_hash, second_call.password_hash)
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 import unittest
@@ -12,51 +13,74 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
 from database import get_session
+from dependencies import get_injector
 from domains import Base
 from main import app
+from usecase.friend import FriendUseCaseIf
 
 
 class TestFriendAPI(unittest.IsolatedAsyncioTestCase):
-    async def asyncSetUp(self):
-        # テスト環境であることを示す環境変数を設定
-        os.environ["TESTING"] = "true"
-
+    @classmethod
+    def setUpClass(cls):
         load_dotenv()
         DATABASE_URL = os.environ["DATABASE_URL_TEST"]
-        self.engine = create_async_engine(DATABASE_URL, echo=True, future=True)
-        self.AsyncSessionLocal = async_sessionmaker(
-            bind=self.engine,
+        # エンジンはクラス内で共有する（SQLのログ出力は行わない）
+        cls.engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+        cls.AsyncSessionLocal = async_sessionmaker(
+            bind=cls.engine,
             expire_on_commit=False,
             autoflush=False,
         )
 
-        # テーブル作成
-        async with self.engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-
-        # テーブルクリーンアップ処理を実行
-        async with self.engine.begin() as conn:
-            # 外部キー制約のため、子テーブルから削除
-            await conn.execute(text("DELETE FROM channels"))
-            await conn.execute(text("DELETE FROM messages"))
-            await conn.execute(text("DELETE FROM guild_members"))
-            await conn.execute(text("DELETE FROM guilds"))
-            await conn.execute(text("DELETE FROM friends"))
-            await conn.execute(text("DELETE FROM sessions"))
-            await conn.execute(text("DELETE FROM users"))
+        # テーブル作成はクラスで1回のみ行う
+        asyncio.run(cls._create_tables())
 
         # テスト用のデータベースセッション依存関数をオーバーライド
         async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
-            async with self.AsyncSessionLocal() as session:
+            async with cls.AsyncSessionLocal() as session:
                 yield session
 
         app.dependency_overrides[get_session] = override_get_session
 
-        # 非同期でAsyncClientを初期化
-        self.client = AsyncClient(
+        # AsyncClient もクラス内で共有する
+        # （ASGITransport は接続を保持しないため、テストごとのイベントループをまたいで使用できる）
+        cls.client = AsyncClient(
             transport=ASGITransport(app=app), base_url="http://testserver"
         )
 
+    @classmethod
+    def tearDownClass(cls):
+        # 依存関数のオーバーライドを削除
+        app.dependency_overrides.clear()
+        # クライアントを破棄
+        asyncio.run(cls.client.aclose())
+
+    @classmethod
+    async def _create_tables(cls):
+        async with cls.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        # 別のイベントループで作成した接続を各テストで使わないよう破棄する
+        await cls.engine.dispose()
+
+    async def asyncSetUp(self):
+        # テスト環境であることを示す環境変数を設定
+        os.environ["TESTING"] = "true"
+
+        # テーブルクリーンアップ処理を実行（1回の TRUNCATE で全テーブルを空にする）
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "TRUNCATE messages, channels, guild_members, guilds, friends,"
+                    " sessions, users CASCADE"
+                )
+            )
+
+        # ユーザーを削除したため、ユーザー名 → ユーザーID のキャッシュも破棄
+        get_injector().get(FriendUseCaseIf).user_id_cache.clear()
+
+        # 前のテストでログイン時に設定された Cookie を引き継がないよう破棄
+        self.client.cookies.clear()
+
     async def _create_test_user(self, name: str, username: str, email: str) -> dict:
         """テスト用ユーザーを作成し、レスポンスを返す"""
         user_data = {
@@ -86,11 +110,7 @@ class TestFriendAPI(unittest.IsolatedAsyncioTestCase):
         if "TESTING" in os.environ:
             del os.environ["TESTING"]
 
-        # 依存関数のオーバーライドを削除
-        app.dependency_overrides.clear()
-        # クライアントを非同期に破棄
-        await self.client.aclose()
-        # エンジンを非同期に破棄
+        # テストごとのイベントループに紐づく接続を破棄（エンジン自体はクラスで共有）
         await self.engine.dispose()
 
     async def test_create_friend_success(self):
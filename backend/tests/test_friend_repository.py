@@ -21,7 +21,7 @@ class TestFriendRepository(unittest.IsolatedAsyncioTestCase):
     def setUpClass(cls):
         load_dotenv()
         DATABASE_URL = os.environ["DATABASE_URL_TEST"]
-        cls.engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+        cls.engine = create_async_engine(DATABASE_URL, echo=False, future=True)
         cls.AsyncSessionLocal = async_sessionmaker(
             bind=cls.engine,
             expire_on_commit=False,
@@ -33,16 +33,14 @@ class TestFriendRepository(unittest.IsolatedAsyncioTestCase):
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
-        # テーブルクリーンアップ処理を実行
+        # テーブルクリーンアップ処理を実行（1回の TRUNCATE で全テーブルを空にする）
         async with self.engine.begin() as conn:
-            # 外部キー制約のため、子テーブルから削除
-            await conn.execute(text("DELETE FROM channels"))
-            await conn.execute(text("DELETE FROM messages"))
-            await conn.execute(text("DELETE FROM guild_members"))
-            await conn.execute(text("DELETE FROM guilds"))
-            await conn.execute(text("DELETE FROM friends"))
-            await conn.execute(text("DELETE FROM sessions"))
-            await conn.execute(text("DELETE FROM users"))
+            await conn.execute(
+                text(
+                    "TRUNCATE messages, channels, guild_members, guilds, friends,"
+                    " sessions, users CASCADE"
+                )
+            )
 
         # テスト用DIコンテナからリポジトリを取得
         injector = Injector([configure])
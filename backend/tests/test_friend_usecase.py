@@ -2,6 +2,7 @@ import os
 import sys
 import unittest
 import uuid
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock, patch
 
 from injector import Injector
@@ -12,7 +13,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
 from dependencies import configure
 from domains import Friend, User
-from schema.friend_schema import FriendCreateRequest
+from repository.guild_repository import GuildQueryError
+from schema.friend_schema import FriendCreateRequest, FriendGetResponse
 from usecase.friend import FriendTransactionError, FriendUseCaseIf
 
 
@@ -22,6 +24,8 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         injector = Injector([configure])
         self.use_case = injector.get(FriendUseCaseIf)
         self.mock_session = Mock(spec=AsyncSession)
+        # session.begin() をトランザクションスコープとして使用できるように設定
+        self.mock_session.begin.return_value = AsyncMock()
 
     def create_mock_user(
         self, user_id=None, username="testuser", email="test@example.com"
@@ -107,10 +111,10 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # モックの設定
         mock_user_repo = AsyncMock()
-        mock_user_repo.get_user_by_username.side_effect = [
-            expected_user,
-            expected_related_user,
-        ]
+        mock_user_repo.get_users_by_usernames.return_value = {
+            "testuser": expected_user,
+            "relateduser": expected_related_user,
+        }
         mock_user_repository_class.return_value = mock_user_repo
 
         mock_friend_repo = AsyncMock()
@@ -123,10 +127,10 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         mock_guild_repo = AsyncMock()
         mock_guild_me = Mock(id=uuid.uuid4())
         mock_guild_related = Mock(id=uuid.uuid4())
-        mock_guild_repo.get_guild_by_user_id_name.side_effect = [
-            mock_guild_me,
-            mock_guild_related,
-        ]
+        mock_guild_repo.get_guilds_by_user_ids_name.return_value = {
+            user_id: mock_guild_me,
+            related_user_id: mock_guild_related,
+        }
         mock_guild_repo.create_guild.return_value = Mock(id=uuid.uuid4())
         mock_guild_repository_class.return_value = mock_guild_repo
 
@@ -150,17 +154,16 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(result.related_user_id, related_user_id)
             self.assertEqual(result.type, "friend")
 
-        # get_user_by_usernameが2回呼ばれることを確認（自ユーザーと相手ユーザー）
-        self.assertEqual(mock_user_repo.get_user_by_username.call_count, 2)
-        mock_user_repo.get_user_by_username.assert_any_call(
-            self.mock_session, "testuser"
-        )
-        mock_user_repo.get_user_by_username.assert_any_call(
-            self.mock_session, "relateduser"
+        # 自ユーザーと相手ユーザーが1回の呼び出しでまとめて取得されることを確認
+        mock_user_repo.get_users_by_usernames.assert_called_once_with(
+            self.mock_session, ["testuser", "relateduser"]
         )
 
         # create_friendが1回呼ばれることを確認
         mock_friend_repo.create_friend.assert_called_once()
+        # 一連の操作が session.begin() のトランザクションスコープ内で行われること
+        self.mock_session.begin.assert_called_once()
+        self.mock_session.commit.assert_not_called()
 
         # create_friendに渡されたFriendオブジェクトの検証
         call_args = mock_friend_repo.create_friend.call_args[0]
@@ -169,6 +172,18 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(created_friend.related_user_id, related_user_id)
         self.assertEqual(created_friend.type, "friend")
 
+        # 2つの @me ギルドが1回の呼び出しでまとめて取得されること
+        mock_guild_repo.get_guilds_by_user_ids_name.assert_called_once_with(
+            self.mock_session, [user_id, related_user_id], "@me"
+        )
+        # お互いのギルドに相手ユーザーがメンバーとして1回でまとめて追加されること
+        mock_guild_member_repo.create_guild_members.assert_called_once()
+        created_members = mock_guild_member_repo.create_guild_members.call_args[0][1]
+        self.assertEqual(
+            [(m.guild_id, m.user_id) for m in created_members],
+            [(mock_guild_me.id, related_user_id), (mock_guild_related.id, user_id)],
+        )
+
     @patch("usecase.friend.GuildMemberRepositoryIf")
     @patch("usecase.friend.GuildRepositoryIf")
     @patch("usecase.friend.ChannelRepositoryIf")
@@ -193,9 +208,9 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # モックの設定
         mock_user_repo = AsyncMock()
-        mock_user_repo.get_user_by_username.return_value = (
-            None  # ユーザーが見つからない
-        )
+        mock_user_repo.get_users_by_usernames.return_value = {
+            "relateduser": self.create_mock_user(username="relateduser")
+        }  # 自ユーザーが見つからない
         mock_user_repository_class.return_value = mock_user_repo
 
         mock_friend_repo = AsyncMock()
@@ -221,8 +236,8 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # Then
         self.assertIsNone(result)
-        mock_user_repo.get_user_by_username.assert_called_once_with(
-            self.mock_session, "nonexistuser"
+        mock_user_repo.get_users_by_usernames.assert_called_once_with(
+            self.mock_session, ["nonexistuser", "relateduser"]
         )
         mock_friend_repo.create_friend.assert_not_called()
 
@@ -252,8 +267,8 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # モックの設定
         mock_user_repo = AsyncMock()
-        # 最初の呼び出しでは自ユーザーを返し、2回目の呼び出しでは相手ユーザーがNone
-        mock_user_repo.get_user_by_username.side_effect = [expected_user, None]
+        # 自ユーザーのみ返し、相手ユーザーは含まれない
+        mock_user_repo.get_users_by_usernames.return_value = {"testuser": expected_user}
         mock_user_repository_class.return_value = mock_user_repo
 
         mock_friend_repo = AsyncMock()
@@ -279,15 +294,99 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # Then
         self.assertIsNone(result)
-        self.assertEqual(mock_user_repo.get_user_by_username.call_count, 2)
-        mock_user_repo.get_user_by_username.assert_any_call(
-            self.mock_session, "testuser"
-        )
-        mock_user_repo.get_user_by_username.assert_any_call(
-            self.mock_session, "nonexistuser"
+        mock_user_repo.get_users_by_usernames.assert_called_once_with(
+            self.mock_session, ["testuser", "nonexistuser"]
         )
         mock_friend_repo.create_friend.assert_not_called()
 
+    async def test_create_friend_guild_repository_error(self):
+        """
+        Given: ギルド取得でリポジトリ例外（GuildQueryError）が発生する場合
+        When: create_friendメソッドを呼び出す
+        Then: ギルド取得エラーのメッセージでFriendTransactionErrorが発生すること
+        """
+
+        # Given
+        user_id = uuid.uuid4()
+        related_user_id = uuid.uuid4()
+        request = self.create_mock_friend_request()
+
+        mock_user_repo = AsyncMock()
+        mock_user_repo.get_users_by_usernames.return_value = {
+            "testuser": self.create_mock_user(user_id=user_id, username="testuser"),
+            "relateduser": self.create_mock_user(
+                user_id=related_user_id, username="relateduser"
+            ),
+        }
+        mock_friend_repo = AsyncMock()
+        mock_friend_repo.create_friend.return_value = self.create_mock_friend(
+            user_id=user_id, related_user_id=related_user_id
+        )
+        mock_guild_repo = AsyncMock()
+        mock_guild_repo.get_guilds_by_user_ids_name.side_effect = GuildQueryError(
+            "SQLAlchemyエラーにより [複数ギルド取得] に失敗"
+        )
+
+        self.use_case.user_repo = mock_user_repo
+        self.use_case.friend_repo = mock_friend_repo
+        self.use_case.channel_repo = AsyncMock()
+        self.use_case.guild_repo = mock_guild_repo
+        self.use_case.guild_member_repo = AsyncMock()
+
+        # When / Then
+        with self.assertRaises(FriendTransactionError) as context:
+            await self.use_case.create_friend(self.mock_session, request)
+
+        self.assertEqual(str(context.exception), "ギルド取得中にエラーが発生しました")
+        self.use_case.guild_member_repo.create_guild_members.assert_not_called()
+
+    async def test_create_friend_uses_user_id_cache(self):
+        """
+        Given: 直前のフレンド作成で自ユーザーと相手ユーザーを取得済み
+        When: 同じユーザー名でcreate_friendメソッドを再度呼び出す
+        Then: ユーザー取得はキャッシュから行われ、リポジトリは再度呼ばれないこと
+        """
+
+        # Given
+        user_id = uuid.uuid4()
+        related_user_id = uuid.uuid4()
+        request = self.create_mock_friend_request()
+
+        mock_user_repo = AsyncMock()
+        mock_user_repo.get_users_by_usernames.return_value = {
+            "testuser": self.create_mock_user(user_id=user_id, username="testuser"),
+            "relateduser": self.create_mock_user(
+                user_id=related_user_id, username="relateduser"
+            ),
+        }
+        mock_friend_repo = AsyncMock()
+        mock_friend_repo.create_friend.return_value = self.create_mock_friend(
+            user_id=user_id, related_user_id=related_user_id
+        )
+        mock_guild_repo = AsyncMock()
+        mock_guild_repo.get_guilds_by_user_ids_name.return_value = {
+            user_id: Mock(id=uuid.uuid4()),
+            related_user_id: Mock(id=uuid.uuid4()),
+        }
+
+        self.use_case.user_repo = mock_user_repo
+        self.use_case.friend_repo = mock_friend_repo
+        self.use_case.channel_repo = AsyncMock()
+        self.use_case.guild_repo = mock_guild_repo
+        self.use_case.guild_member_repo = AsyncMock()
+
+        await self.use_case.create_friend(self.mock_session, request)
+
+        # When
+        result = await self.use_case.create_friend(self.mock_session, request)
+
+        # Then
+        self.assertIsNotNone(result)
+        mock_user_repo.get_users_by_usernames.assert_called_once()
+        created_friend = mock_friend_repo.create_friend.call_args[0][1]
+        self.assertEqual(created_friend.user_id, user_id)
+        self.assertEqual(created_friend.related_user_id, related_user_id)
+
     @patch("usecase.friend.FriendRepositoryIf")
     async def test_get_friend_all_success(
         self,
@@ -311,14 +410,14 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         row1.user_name = "Test Friend 1"
         row1.user_username = "friend1"
         row1.user_description = "Friend 1 description"
-        row1.user_created_at = "2024-01-01T00:00:00Z"
+        row1.user_created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
         row1.channel_id = channel1_id
 
         row2 = Mock()
         row2.user_name = "Test Friend 2"
         row2.user_username = "friend2"
         row2.user_description = "Friend 2 description"
-        row2.user_created_at = "2024-01-02T00:00:00Z"
+        row2.user_created_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
         row2.channel_id = channel2_id
 
         friend_details = [row1, row2]
@@ -347,6 +446,20 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(result[1].username, "friend2")
             self.assertEqual(result[1].description, "Friend 2 description")
             self.assertEqual(result[1].channel_id, channel2_id)
+            # 検証を省略して構築したレスポンスが、検証した場合と一致すること
+            for response, row in zip(result, friend_details):
+                self.assertEqual(
+                    response.model_dump(),
+                    FriendGetResponse.model_validate(
+                        {
+                            "name": row.user_name,
+                            "username": row.user_username,
+                            "description": row.user_description,
+                            "created_at": row.user_created_at,
+                            "channel_id": row.channel_id,
+                        }
+                    ).model_dump(),
+                )
 
         mock_friend_repo.get_friends_with_details.assert_called_once_with(
             self.mock_session, user_id
@@ -416,10 +529,10 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # モックの設定
         mock_user_repo = AsyncMock()
-        mock_user_repo.get_user_by_username.side_effect = [
-            expected_user,
-            expected_related_user,
-        ]
+        mock_user_repo.get_users_by_usernames.return_value = {
+            "testuser": expected_user,
+            "relateduser": expected_related_user,
+        }
         mock_user_repository_class.return_value = mock_user_repo
 
         mock_friend_repo = AsyncMock()
@@ -432,10 +545,10 @@ class TestFriendUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         mock_guild_repo = AsyncMock()
         mock_guild_me = Mock(id=uuid.uuid4())
         mock_guild_related = Mock(id=uuid.uuid4())
-        mock_guild_repo.get_guild_by_user_id_name.side_effect = [
-            mock_guild_me,
-            mock_guild_related,
-        ]
+        mock_guild_repo.get_guilds_by_user_ids_name.return_value = {
+            user_id: mock_guild_me,
+            related_user_id: mock_guild_related,
+        }
         mock_guild_repo.create_guild.return_value = Mock(id=uuid.uuid4())
         mock_guild_repository_class.return_value = mock_guild_repo
 
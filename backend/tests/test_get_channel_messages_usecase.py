@@ -15,7 +15,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 from dependencies import configure
 from domains import Channel
 from schema.channel_schema import ChannelGetResponse
+from repository.channel_repository import ChannelQueryError
 from usecase.get_channel_messages import (
+    ChannelNotFoundError,
     GetChannelMessagesUseCaseIf,
     GetChannelMessageTransactionError,
 )
@@ -28,24 +30,26 @@ class TestChannelUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         self.use_case = injector.get(GetChannelMessagesUseCaseIf)
         self.mock_session = Mock(spec=AsyncSession)
 
-    def create_mock_channel(self, channel_id=None, guild_id=None, name="test-channel"):
-        """モックのChannelオブジェクトを作成"""
+    def create_mock_channel(
+        self, channel_id=None, guild_id=None, name="test-channel", messages=None
+    ):
+        """モックのChannelオブジェクトを作成（メッセージ一覧読み込み済み）"""
         if channel_id is None:
             channel_id = uuid.uuid4()
         if guild_id is None:
             guild_id = uuid.uuid4()
 
-        channel = Channel(
-            id=channel_id,
-            guild_id=guild_id,
-            type=CHANNEL_TYPE_TEXT,
-            name=name,
-            owner_user_id=uuid.uuid4(),
-            last_message_id=None,
-            deleted_at=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
+        channel = Mock(spec=Channel)
+        channel.id = channel_id
+        channel.guild_id = guild_id
+        channel.type = CHANNEL_TYPE_TEXT
+        channel.name = name
+        channel.owner_user_id = uuid.uuid4()
+        channel.last_message_id = None
+        channel.deleted_at = None
+        channel.created_at = datetime.now()
+        channel.updated_at = datetime.now()
+        channel.messages = messages if messages is not None else []
         return channel
 
     def create_mock_message(
@@ -78,10 +82,7 @@ class TestChannelUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         return message
 
     @patch("usecase.get_channel_messages.ChannelRepositoryIf")
-    @patch("usecase.get_channel_messages.MessageRepositoryIf")
-    async def test_execute_success_with_messages(
-        self, mock_message_repository_class, mock_channel_repository_class
-    ):
+    async def test_execute_success_with_messages(self, mock_channel_repository_class):
         """
         Given: 有効なチャネルIDとメッセージが存在する
         When: executeメソッドを呼び出す
@@ -93,12 +94,6 @@ class TestChannelUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         test_guild_id = uuid.uuid4()
         test_user_id = uuid.uuid4()
 
-        expected_channel = self.create_mock_channel(
-            channel_id=uuid.UUID(test_channel_id),
-            guild_id=test_guild_id,
-            name="general",
-        )
-
         expected_messages = [
             self.create_mock_message(
                 channel_id=uuid.UUID(test_channel_id),
@@ -112,17 +107,19 @@ class TestChannelUseCaseImpl(unittest.IsolatedAsyncioTestCase):
             ),
         ]
 
+        expected_channel = self.create_mock_channel(
+            channel_id=uuid.UUID(test_channel_id),
+            guild_id=test_guild_id,
+            name="general",
+            messages=expected_messages,
+        )
+
         # モックの設定
         mock_channel_repo = AsyncMock()
-        mock_channel_repo.get_channel_by_id.return_value = expected_channel
+        mock_channel_repo.get_channel_with_messages.return_value = expected_channel
         mock_channel_repository_class.return_value = mock_channel_repo
 
-        mock_message_repo = AsyncMock()
-        mock_message_repo.get_message_by_channel_id.return_value = expected_messages
-        mock_message_repository_class.return_value = mock_message_repo
-
         self.use_case.channel_repo = mock_channel_repo
-        self.use_case.message_repo = mock_message_repo
 
         # When
         result = await self.use_case.execute(self.mock_session, test_channel_id)
@@ -137,17 +134,13 @@ class TestChannelUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.messages[1].content, "How are you?")
 
         # モックメソッドの呼び出し確認
-        mock_channel_repo.get_channel_by_id.assert_called_once_with(
-            self.mock_session, test_channel_id
-        )
-        mock_message_repo.get_message_by_channel_id.assert_called_once_with(
+        mock_channel_repo.get_channel_with_messages.assert_called_once_with(
             self.mock_session, test_channel_id
         )
 
     @patch("usecase.get_channel_messages.ChannelRepositoryIf")
-    @patch("usecase.get_channel_messages.MessageRepositoryIf")
     async def test_execute_success_with_empty_messages(
-        self, mock_message_repository_class, mock_channel_repository_class
+        self, mock_channel_repository_class
     ):
         """
         Given: 有効なチャネルIDだがメッセージが存在しない
@@ -163,21 +156,15 @@ class TestChannelUseCaseImpl(unittest.IsolatedAsyncioTestCase):
             channel_id=uuid.UUID(test_channel_id),
             guild_id=test_guild_id,
             name="empty-channel",
+            messages=[],  # 空のメッセージリスト
         )
 
-        expected_messages = []  # 空のメッセージリスト
-
         # モックの設定
         mock_channel_repo = AsyncMock()
-        mock_channel_repo.get_channel_by_id.return_value = expected_channel
+        mock_channel_repo.get_channel_with_messages.return_value = expected_channel
         mock_channel_repository_class.return_value = mock_channel_repo
 
-        mock_message_repo = AsyncMock()
-        mock_message_repo.get_message_by_channel_id.return_value = expected_messages
-        mock_message_repository_class.return_value = mock_message_repo
-
         self.use_case.channel_repo = mock_channel_repo
-        self.use_case.message_repo = mock_message_repo
 
         # When
         result = await self.use_case.execute(self.mock_session, test_channel_id)
@@ -190,22 +177,16 @@ class TestChannelUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(result.messages), 0)
 
         # モックメソッドの呼び出し確認
-        mock_channel_repo.get_channel_by_id.assert_called_once_with(
-            self.mock_session, test_channel_id
-        )
-        mock_message_repo.get_message_by_channel_id.assert_called_once_with(
+        mock_channel_repo.get_channel_with_messages.assert_called_once_with(
             self.mock_session, test_channel_id
         )
 
     @patch("usecase.get_channel_messages.ChannelRepositoryIf")
-    @patch("usecase.get_channel_messages.MessageRepositoryIf")
-    async def test_execute_channel_not_found(
-        self, mock_message_repository_class, mock_channel_repository_class
-    ):
+    async def test_execute_channel_not_found(self, mock_channel_repository_class):
         """
         Given: 存在しないチャネルID
         When: executeメソッドを呼び出す
-        Then: チャネルリポジトリから例外が発生すること
+        Then: ChannelNotFoundErrorが発生すること
         """
 
         # Given
@@ -213,76 +194,80 @@ class TestChannelUseCaseImpl(unittest.IsolatedAsyncioTestCase):
 
         # モックの設定
         mock_channel_repo = AsyncMock()
-        mock_channel_repo.get_channel_by_id.side_effect = Exception("Channel not found")
+        mock_channel_repo.get_channel_with_messages.return_value = None
         mock_channel_repository_class.return_value = mock_channel_repo
 
-        mock_message_repo = AsyncMock()
-        mock_message_repository_class.return_value = mock_message_repo
-
         self.use_case.channel_repo = mock_channel_repo
-        self.use_case.message_repo = mock_message_repo
 
         # When & Then
-        with self.assertRaises(GetChannelMessageTransactionError) as context:
+        with self.assertRaises(ChannelNotFoundError):
             await self.use_case.execute(self.mock_session, test_channel_id)
 
-        self.assertEqual(str(context.exception), "予期しないエラーが発生しました")
-
         # モックメソッドの呼び出し確認
-        mock_channel_repo.get_channel_by_id.assert_called_once_with(
+        mock_channel_repo.get_channel_with_messages.assert_called_once_with(
             self.mock_session, test_channel_id
         )
-        # チャネル取得でエラーが発生した場合、メッセージ取得は呼ばれない
-        mock_message_repo.get_message_by_channel_id.assert_not_called()
 
     @patch("usecase.get_channel_messages.ChannelRepositoryIf")
-    @patch("usecase.get_channel_messages.MessageRepositoryIf")
-    async def test_execute_message_repository_error(
-        self, mock_message_repository_class, mock_channel_repository_class
+    async def test_execute_channel_repository_error(
+        self, mock_channel_repository_class
     ):
         """
-        Given: 有効なチャネルIDだがメッセージ取得でエラーが発生
+        Given: 有効なチャネルIDだがチャネル・メッセージ取得でエラーが発生
         When: executeメソッドを呼び出す
-        Then: メッセージリポジトリから例外が発生すること
+        Then: GetChannelMessageTransactionErrorが発生すること
         """
 
         # Given
         test_channel_id = str(uuid.uuid4())
-        test_guild_id = uuid.uuid4()
-
-        expected_channel = self.create_mock_channel(
-            channel_id=uuid.UUID(test_channel_id),
-            guild_id=test_guild_id,
-            name="error-channel",
-        )
 
         # モックの設定
         mock_channel_repo = AsyncMock()
-        mock_channel_repo.get_channel_by_id.return_value = expected_channel
-        mock_channel_repository_class.return_value = mock_channel_repo
-
-        mock_message_repo = AsyncMock()
-        mock_message_repo.get_message_by_channel_id.side_effect = Exception(
+        mock_channel_repo.get_channel_with_messages.side_effect = ChannelQueryError(
             "Database connection error"
         )
-        mock_message_repository_class.return_value = mock_message_repo
+        mock_channel_repository_class.return_value = mock_channel_repo
 
         self.use_case.channel_repo = mock_channel_repo
-        self.use_case.message_repo = mock_message_repo
 
         # When & Then
         with self.assertRaises(GetChannelMessageTransactionError) as context:
             await self.use_case.execute(self.mock_session, test_channel_id)
 
-        self.assertEqual(str(context.exception), "予期しないエラーが発生しました")
+        self.assertEqual(
+            str(context.exception), "チャンネル取得中にエラーが発生しました"
+        )
 
         # モックメソッドの呼び出し確認
-        mock_channel_repo.get_channel_by_id.assert_called_once_with(
+        mock_channel_repo.get_channel_with_messages.assert_called_once_with(
             self.mock_session, test_channel_id
         )
-        mock_message_repo.get_message_by_channel_id.assert_called_once_with(
-            self.mock_session, test_channel_id
+
+    @patch("usecase.get_channel_messages.ChannelRepositoryIf")
+    async def test_execute_unexpected_error(self, mock_channel_repository_class):
+        """
+        Given: 有効なチャネルIDだが予期しない例外が発生
+        When: executeメソッドを呼び出す
+        Then: GetChannelMessageTransactionErrorが発生すること
+        """
+
+        # Given
+        test_channel_id = str(uuid.uuid4())
+
+        # モックの設定
+        mock_channel_repo = AsyncMock()
+        mock_channel_repo.get_channel_with_messages.side_effect = Exception(
+            "Channel not found"
         )
+        mock_channel_repository_class.return_value = mock_channel_repo
+
+        self.use_case.channel_repo = mock_channel_repo
+
+        # When & Then
+        with self.assertRaises(GetChannelMessageTransactionError) as context:
+            await self.use_case.execute(self.mock_session, test_channel_id)
+
+        self.assertEqual(str(context.exception), "予期しないエラーが発生しました")
 
 
 if __name__ == "__main__":
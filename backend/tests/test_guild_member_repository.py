@@ -21,7 +21,7 @@ class TestGuildMemberRepository(unittest.IsolatedAsyncioTestCase):
     def setUpClass(cls):
         load_dotenv()
         DATABASE_URL = os.environ["DATABASE_URL_TEST"]
-        cls.engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+        cls.engine = create_async_engine(DATABASE_URL, echo=False, future=True)
         cls.AsyncSessionLocal = async_sessionmaker(
             bind=cls.engine,
             expire_on_commit=False,
@@ -33,16 +33,14 @@ class TestGuildMemberRepository(unittest.IsolatedAsyncioTestCase):
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
-        # テーブルクリーンアップ処理を実行
+        # テーブルクリーンアップ処理を実行（1回の TRUNCATE で全テーブルを空にする）
         async with self.engine.begin() as conn:
-            # 外部キー制約のため、子テーブルから削除
-            await conn.execute(text("DELETE FROM channels"))
-            await conn.execute(text("DELETE FROM messages"))
-            await conn.execute(text("DELETE FROM guild_members"))
-            await conn.execute(text("DELETE FROM guilds"))
-            await conn.execute(text("DELETE FROM friends"))
-            await conn.execute(text("DELETE FROM sessions"))
-            await conn.execute(text("DELETE FROM users"))
+            await conn.execute(
+                text(
+                    "TRUNCATE messages, channels, guild_members, guilds, friends,"
+                    " sessions, users CASCADE"
+                )
+            )
 
         # テスト用DIコンテナからリポジトリを取得
         injector = Injector([configure])
@@ -145,6 +143,39 @@ class TestGuildMemberRepository(unittest.IsolatedAsyncioTestCase):
                     session, duplicate_guild_member
                 )
 
+    async def test_create_guild_members_success(self):
+        """
+        Given: 2つのギルドにそれぞれ追加する有効なギルドメンバー情報
+        When: create_guild_membersメソッドを呼び出す
+        Then: 2件のギルドメンバーがまとめて作成されること
+        """
+
+        # Given
+        owner = await self.create_test_user("Owner", "owner")
+        user = await self.create_test_user("Member", "member")
+        guild_owner = await self.create_test_guild(owner.id, "@me")
+        guild_user = await self.create_test_guild(user.id, "@me")
+
+        guild_members = [
+            GuildMember(guild_id=guild_owner.id, user_id=user.id),
+            GuildMember(guild_id=guild_user.id, user_id=owner.id),
+        ]
+
+        # When
+        async with self.AsyncSessionLocal() as session:
+            result = await self.repository.create_guild_members(session, guild_members)
+            await session.commit()  # テスト用に明示的にcommit
+
+        # Then
+        self.assertEqual(len(result), 2)
+        for member in result:
+            self.assertIsNotNone(member.id)
+            self.assertEqual(member.role, "member")
+        self.assertEqual(
+            [(m.guild_id, m.user_id) for m in result],
+            [(guild_owner.id, user.id), (guild_user.id, owner.id)],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,7 +21,7 @@ class TestGuildRepository(unittest.IsolatedAsyncioTestCase):
     def setUpClass(cls):
         load_dotenv()
         DATABASE_URL = os.environ["DATABASE_URL_TEST"]
-        cls.engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+        cls.engine = create_async_engine(DATABASE_URL, echo=False, future=True)
         cls.AsyncSessionLocal = async_sessionmaker(
             bind=cls.engine,
             expire_on_commit=False,
@@ -33,16 +33,14 @@ class TestGuildRepository(unittest.IsolatedAsyncioTestCase):
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
-        # テーブルクリーンアップ処理を実行
+        # テーブルクリーンアップ処理を実行（1回の TRUNCATE で全テーブルを空にする）
         async with self.engine.begin() as conn:
-            # 外部キー制約のため、子テーブルから削除
-            await conn.execute(text("DELETE FROM channels"))
-            await conn.execute(text("DELETE FROM messages"))
-            await conn.execute(text("DELETE FROM guild_members"))
-            await conn.execute(text("DELETE FROM guilds"))
-            await conn.execute(text("DELETE FROM friends"))
-            await conn.execute(text("DELETE FROM sessions"))
-            await conn.execute(text("DELETE FROM users"))
+            await conn.execute(
+                text(
+                    "TRUNCATE messages, channels, guild_members, guilds, friends,"
+                    " sessions, users CASCADE"
+                )
+            )
 
         # テスト用DIコンテナからリポジトリを取得
         injector = Injector([configure])
@@ -160,6 +158,46 @@ class TestGuildRepository(unittest.IsolatedAsyncioTestCase):
         # Then: Noneが返される
         self.assertIsNone(result)
 
+    async def test_get_guilds_by_user_ids_name(self):
+        """
+        Given: 2人のユーザーがそれぞれ @me ギルドと別名のギルドを所有
+        When: get_guilds_by_user_ids_nameメソッドで2人のユーザーIDと "@me" を指定
+        Then: 各ユーザーの @me ギルドのみがユーザーIDをキーとして返されること
+        """
+
+        # Given
+        user = await self.create_test_user()
+        other_user = User(
+            name="Other User",
+            username="otheruser",
+            email="other@example.com",
+            password_hash="hashed_password",
+        )
+        async with self.AsyncSessionLocal() as session:
+            session.add(other_user)
+            await session.flush()
+            guild_me = Guild(name="@me", owner_user_id=user.id)
+            guild_other = Guild(name="@me", owner_user_id=other_user.id)
+            session.add_all(
+                [
+                    guild_me,
+                    guild_other,
+                    Guild(name="Test Guild", owner_user_id=user.id),
+                ]
+            )
+            await session.commit()  # テスト用に明示的にcommit
+
+        # When
+        async with self.AsyncSessionLocal() as session:
+            result = await self.repository.get_guilds_by_user_ids_name(
+                session, [user.id, other_user.id, uuid.uuid4()], "@me"
+            )
+
+        # Then
+        self.assertEqual(set(result), {user.id, other_user.id})
+        self.assertEqual(result[user.id].id, guild_me.id)
+        self.assertEqual(result[other_user.id].id, guild_other.id)
+
 
 if __name__ == "__main__":
     unittest.main()
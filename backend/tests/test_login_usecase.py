@@ -13,7 +13,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
 from dependencies import configure
 from domains import Session, User
-from usecase.login import LoginUseCaseIf
+from usecase.login import AuthUser, LoginUseCaseIf
 
 
 class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
@@ -41,6 +41,10 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         )
         request.client = Mock()
         request.client.host = client_host
+        request.scope = {
+            "headers": [(b"user-agent", user_agent.encode())] if user_agent else [],
+            "client": (client_host, 50000) if client_host else None,
+        }
         request.cookies = Mock()
         request.cookies.get = Mock(
             side_effect=lambda key: cookies.get(key) if cookies else None
@@ -119,6 +123,12 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         mock_verify_password.assert_called_once_with("hashed_password", "testpass")
         # assert_called_once: 引数に関係なく1回呼ばれたかどうかを確認
         mock_session_repo.create_session.assert_called_once()
+        # リクエストのUser-AgentとクライアントIPがセッションに設定されること
+        session_data = mock_session_repo.create_session.call_args[0][1]
+        self.assertEqual(session_data.user_agent, "TestAgent")
+        self.assertEqual(session_data.ip_address, "127.0.0.1")
+        # セッション作成後にユースケース側で commit されること
+        self.mock_session.commit.assert_awaited_once()
 
     @patch("usecase.login.UserRepositoryIf")
     @patch("usecase.login.SessionRepositoryIf")
@@ -253,6 +263,7 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         request.headers = Mock()
         request.headers.get = Mock(return_value="TestAgent")
         request.client = None  # clientがNone
+        request.scope = {"headers": [(b"user-agent", b"TestAgent")], "client": None}
 
         # モックの設定
         mock_user_repo = AsyncMock()
@@ -278,14 +289,15 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(result["session"])
         self.assertEqual(result["session"].ip_address, None)
         self.assertEqual(result["user"], expected_user)
+        session_data = mock_session_repo.create_session.call_args[0][1]
+        self.assertEqual(session_data.user_agent, "TestAgent")
+        self.assertIsNone(session_data.ip_address)
 
     @patch("usecase.login.SessionRepositoryIf")
     @patch("usecase.login.UserRepositoryIf")
     @patch("usecase.login.verify_token")
-    @patch("usecase.login.hash_token")
     async def test_auth_session_success_with_cookie(
         self,
-        mock_hash_token,
         mock_verify_token,
         mock_user_repository_class,
         mock_session_repository_class,
@@ -303,26 +315,17 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
             email="test@example.com",
             password_hash="hashed_password",
         )
-        expected_session = Session(
-            id=1,
-            user_id=1,
-            access_token="valid_jwt_token",
-            refresh_token="test_refresh_token",
-            revoked_at=None,
-        )
 
         request = self.create_mock_request(cookies={"session_token": "valid_jwt_token"})
 
         # モックの設定
-        mock_hash_token.return_value = "hashed_token"
         mock_verify_token.return_value = {"sub": "testuser", "exp": 1635782400}
 
         mock_user_repo = AsyncMock()
-        mock_user_repo.get_user_by_username.return_value = expected_user
         mock_user_repository_class.return_value = mock_user_repo
 
         mock_session_repo = AsyncMock()
-        mock_session_repo.get_session_by_access_token.return_value = expected_session
+        mock_session_repo.get_user_by_access_token.return_value = expected_user
         mock_session_repository_class.return_value = mock_session_repo
 
         self.use_case.user_repo = mock_user_repo
@@ -332,25 +335,21 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         result = await self.use_case.auth_session(self.mock_session, request)
 
         # Then
-        self.assertEqual(result, expected_user)
+        self.assertEqual(result, AuthUser.from_user(expected_user))
         mock_verify_token.assert_called_once_with(
             "valid_jwt_token", token_type="access"
         )
-        mock_hash_token.assert_called_once_with("valid_jwt_token")
-        mock_session_repo.get_session_by_access_token.assert_called_once_with(
-            self.mock_session, "hashed_token"
-        )
-        mock_user_repo.get_user_by_username.assert_called_once_with(
-            self.mock_session, "testuser"
+        mock_session_repo.get_user_by_access_token.assert_called_once_with(
+            self.mock_session, "valid_jwt_token"
         )
+        # ユーザーはセッションと結合して取得するため、ユーザー名での検索は行わない
+        mock_user_repo.get_user_by_username.assert_not_called()
 
     @patch("usecase.login.SessionRepositoryIf")
     @patch("usecase.login.UserRepositoryIf")
     @patch("usecase.login.verify_token")
-    @patch("usecase.login.hash_token")
     async def test_auth_session_success_with_authorization_header(
         self,
-        mock_hash_token,
         mock_verify_token,
         mock_user_repository_class,
         mock_session_repository_class,
@@ -368,28 +367,19 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
             email="test@example.com",
             password_hash="hashed_password",
         )
-        expected_session = Session(
-            id=1,
-            user_id=1,
-            access_token="valid_jwt_token",
-            refresh_token="test_refresh_token",
-            revoked_at=None,
-        )
 
         request = self.create_mock_request(
             headers={"Authorization": "Bearer valid_jwt_token"}
         )
 
         # モックの設定
-        mock_hash_token.return_value = "hashed_token"
         mock_verify_token.return_value = {"sub": "testuser", "exp": 1635782400}
 
         mock_user_repo = AsyncMock()
-        mock_user_repo.get_user_by_username.return_value = expected_user
         mock_user_repository_class.return_value = mock_user_repo
 
         mock_session_repo = AsyncMock()
-        mock_session_repo.get_session_by_access_token.return_value = expected_session
+        mock_session_repo.get_user_by_access_token.return_value = expected_user
         mock_session_repository_class.return_value = mock_session_repo
 
         self.use_case.user_repo = mock_user_repo
@@ -399,25 +389,21 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         result = await self.use_case.auth_session(self.mock_session, request)
 
         # Then
-        self.assertEqual(result, expected_user)
+        self.assertEqual(result, AuthUser.from_user(expected_user))
         mock_verify_token.assert_called_once_with(
             "valid_jwt_token", token_type="access"
         )
-        mock_hash_token.assert_called_once_with("valid_jwt_token")
-        mock_session_repo.get_session_by_access_token.assert_called_once_with(
-            self.mock_session, "hashed_token"
-        )
-        mock_user_repo.get_user_by_username.assert_called_once_with(
-            self.mock_session, "testuser"
+        mock_session_repo.get_user_by_access_token.assert_called_once_with(
+            self.mock_session, "valid_jwt_token"
         )
+        # ユーザーはセッションと結合して取得するため、ユーザー名での検索は行わない
+        mock_user_repo.get_user_by_username.assert_not_called()
 
     @patch("usecase.login.SessionRepositoryIf")
     @patch("usecase.login.UserRepositoryIf")
     @patch("usecase.login.verify_token")
-    @patch("usecase.login.hash_token")
     async def test_auth_session_cookie_priority_over_header(
         self,
-        mock_hash_token,
         mock_verify_token,
         mock_user_repository_class,
         mock_session_repository_class,
@@ -435,13 +421,6 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
             email="test@example.com",
             password_hash="hashed_password",
         )
-        expected_session = Session(
-            id=1,
-            user_id=1,
-            access_token="cookie_jwt_token",
-            refresh_token="test_refresh_token",
-            revoked_at=None,
-        )
 
         request = self.create_mock_request(
             cookies={"session_token": "cookie_jwt_token"},
@@ -449,15 +428,13 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         )
 
         # モックの設定
-        mock_hash_token.return_value = "hashed_cookie_token"
         mock_verify_token.return_value = {"sub": "testuser", "exp": 1635782400}
 
         mock_user_repo = AsyncMock()
-        mock_user_repo.get_user_by_username.return_value = expected_user
         mock_user_repository_class.return_value = mock_user_repo
 
         mock_session_repo = AsyncMock()
-        mock_session_repo.get_session_by_access_token.return_value = expected_session
+        mock_session_repo.get_user_by_access_token.return_value = expected_user
         mock_session_repository_class.return_value = mock_session_repo
 
         self.use_case.user_repo = mock_user_repo
@@ -467,18 +444,16 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         result = await self.use_case.auth_session(self.mock_session, request)
 
         # Then
-        self.assertEqual(result, expected_user)
+        self.assertEqual(result, AuthUser.from_user(expected_user))
         # Cookieのトークンが優先されることを確認
         mock_verify_token.assert_called_once_with(
             "cookie_jwt_token", token_type="access"
         )
-        mock_hash_token.assert_called_once_with("cookie_jwt_token")
-        mock_session_repo.get_session_by_access_token.assert_called_once_with(
-            self.mock_session, "hashed_cookie_token"
-        )
-        mock_user_repo.get_user_by_username.assert_called_once_with(
-            self.mock_session, "testuser"
+        mock_session_repo.get_user_by_access_token.assert_called_once_with(
+            self.mock_session, "cookie_jwt_token"
         )
+        # ユーザーはセッションと結合して取得するため、ユーザー名での検索は行わない
+        mock_user_repo.get_user_by_username.assert_not_called()
 
     async def test_auth_session_no_token(self):
         """
@@ -572,10 +547,8 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
     @patch("usecase.login.SessionRepositoryIf")
     @patch("usecase.login.UserRepositoryIf")
     @patch("usecase.login.verify_token")
-    @patch("usecase.login.hash_token")
     async def test_auth_session_user_not_found(
         self,
-        mock_hash_token,
         mock_verify_token,
         mock_user_repository_class,
         mock_session_repository_class,
@@ -587,31 +560,22 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         """
 
         # Given
-        expected_session = Session(
-            id=1,
-            user_id=1,
-            access_token="valid_jwt_token",
-            refresh_token="test_refresh_token",
-            revoked_at=None,
-        )
 
         request = self.create_mock_request(cookies={"session_token": "valid_jwt_token"})
 
         # モックの設定
-        mock_hash_token.return_value = "hashed_token"
         mock_verify_token.return_value = {
             "sub": "nonexistent_user",
             "exp": 1635782400,
         }
 
         mock_user_repo = AsyncMock()
-        mock_user_repo.get_user_by_username.return_value = (
-            None  # ユーザーが見つからない
-        )
         mock_user_repository_class.return_value = mock_user_repo
 
         mock_session_repo = AsyncMock()
-        mock_session_repo.get_session_by_access_token.return_value = expected_session
+        mock_session_repo.get_user_by_access_token.return_value = (
+            None  # ユーザーが見つからない
+        )
         mock_session_repository_class.return_value = mock_session_repo
 
         self.use_case.user_repo = mock_user_repo
@@ -625,19 +589,15 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         mock_verify_token.assert_called_once_with(
             "valid_jwt_token", token_type="access"
         )
-        mock_hash_token.assert_called_once_with("valid_jwt_token")
-        mock_session_repo.get_session_by_access_token.assert_called_once_with(
-            self.mock_session, "hashed_token"
-        )
-        mock_user_repo.get_user_by_username.assert_called_once_with(
-            self.mock_session, "nonexistent_user"
+        mock_session_repo.get_user_by_access_token.assert_called_once_with(
+            self.mock_session, "valid_jwt_token"
         )
+        mock_user_repo.get_user_by_username.assert_not_called()
 
     @patch("usecase.login.SessionRepositoryIf")
     @patch("usecase.login.verify_token")
-    @patch("usecase.login.hash_token")
     async def test_auth_session_revoked_session(
-        self, mock_hash_token, mock_verify_token, mock_session_repository_class
+        self, mock_verify_token, mock_session_repository_class
     ):
         """
         Given: 有効なJWTだが、セッションが無効化されているリクエスト
@@ -646,24 +606,15 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         """
 
         # Given
-        from datetime import datetime, timezone
-
-        revoked_session = Session(
-            id=1,
-            user_id=1,
-            access_token="valid_jwt_token",
-            refresh_token="test_refresh_token",
-            revoked_at=datetime.now(timezone.utc),  # 無効化済み
-        )
-
         request = self.create_mock_request(cookies={"session_token": "valid_jwt_token"})
 
         # モックの設定
-        mock_hash_token.return_value = "hashed_token"
         mock_verify_token.return_value = {"sub": "testuser", "exp": 1635782400}
 
         mock_session_repo = AsyncMock()
-        mock_session_repo.get_session_by_access_token.return_value = revoked_session
+        mock_session_repo.get_user_by_access_token.return_value = (
+            None  # 無効化済みのセッションは存在しない扱い
+        )
         mock_session_repository_class.return_value = mock_session_repo
 
         self.use_case.session_repo = mock_session_repo
@@ -676,16 +627,14 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         mock_verify_token.assert_called_once_with(
             "valid_jwt_token", token_type="access"
         )
-        mock_hash_token.assert_called_once_with("valid_jwt_token")
-        mock_session_repo.get_session_by_access_token.assert_called_once_with(
-            self.mock_session, "hashed_token"
+        mock_session_repo.get_user_by_access_token.assert_called_once_with(
+            self.mock_session, "valid_jwt_token"
         )
 
     @patch("usecase.login.SessionRepositoryIf")
     @patch("usecase.login.verify_token")
-    @patch("usecase.login.hash_token")
     async def test_auth_session_session_not_found(
-        self, mock_hash_token, mock_verify_token, mock_session_repository_class
+        self, mock_verify_token, mock_session_repository_class
     ):
         """
         Given: 有効なJWTだが、DBにセッションが存在しないリクエスト
@@ -697,11 +646,10 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         request = self.create_mock_request(cookies={"session_token": "valid_jwt_token"})
 
         # モックの設定
-        mock_hash_token.return_value = "hashed_token"
         mock_verify_token.return_value = {"sub": "testuser", "exp": 1635782400}
 
         mock_session_repo = AsyncMock()
-        mock_session_repo.get_session_by_access_token.return_value = (
+        mock_session_repo.get_user_by_access_token.return_value = (
             None  # セッションが見つからない
         )
         mock_session_repository_class.return_value = mock_session_repo
@@ -716,9 +664,8 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         mock_verify_token.assert_called_once_with(
             "valid_jwt_token", token_type="access"
         )
-        mock_hash_token.assert_called_once_with("valid_jwt_token")
-        mock_session_repo.get_session_by_access_token.assert_called_once_with(
-            self.mock_session, "hashed_token"
+        mock_session_repo.get_user_by_access_token.assert_called_once_with(
+            self.mock_session, "valid_jwt_token"
         )
 
     @patch("usecase.login.UserRepositoryIf")
@@ -757,7 +704,7 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
         result = await self.use_case.auth_jwt_only(self.mock_session, request)
 
         # Then
-        self.assertEqual(result, expected_user)
+        self.assertEqual(result, AuthUser.from_user(expected_user))
         mock_verify_token.assert_called_once_with(
             "valid_jwt_token", token_type="access"
         )
@@ -846,6 +793,46 @@ class TestLoginUseCaseImpl(unittest.IsolatedAsyncioTestCase):
             self.mock_session, "nonexistent_user"
         )
 
+    @patch("usecase.login.verify_token")
+    async def test_auth_jwt_only_uses_user_cache(self, mock_verify_token):
+        """
+        Given: 直前の認証でユーザー情報を取得済み
+        When: 同じユーザーのトークンでauth_jwt_onlyメソッドを再度呼び出す
+        Then: ユーザー情報はキャッシュから返され、リポジトリは再度呼ばれないこと
+        """
+
+        # Given
+        expected_user = User(
+            id=1,
+            username="testuser",
+            email="test@example.com",
+            password_hash="hashed_password",
+        )
+
+        request = self.create_mock_request(cookies={"session_token": "valid_jwt_token"})
+
+        # モックの設定
+        mock_verify_token.return_value = {"sub": "testuser", "exp": 1635782400}
+
+        mock_user_repo = AsyncMock()
+        mock_user_repo.get_user_by_username.return_value = expected_user
+
+        self.use_case.user_repo = mock_user_repo
+
+        await self.use_case.auth_jwt_only(self.mock_session, request)
+
+        # When
+        result = await self.use_case.auth_jwt_only(self.mock_session, request)
+
+        # Then
+        # キャッシュされるのはパスワードハッシュを含まないイミュータブルなスナップショット
+        self.assertEqual(result, AuthUser.from_user(expected_user))
+        self.assertIsNot(result, expected_user)
+        self.assertFalse(hasattr(result, "password_hash"))
+        mock_user_repo.get_user_by_username.assert_called_once_with(
+            self.mock_session, "testuser"
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
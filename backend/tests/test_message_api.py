@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 import unittest
@@ -20,37 +21,24 @@ from main import app
 
 
 class TestMessageAPI(unittest.IsolatedAsyncioTestCase):
-    async def asyncSetUp(self):
-        # テスト環境であることを示す環境変数を設定
-        os.environ["TESTING"] = "true"
-
+    @classmethod
+    def setUpClass(cls):
         load_dotenv()
         DATABASE_URL = os.environ["DATABASE_URL_TEST"]
-        self.engine = create_async_engine(DATABASE_URL, echo=True, future=True)
-        self.AsyncSessionLocal = async_sessionmaker(
-            bind=self.engine,
+        # エンジンはクラス内で共有する（SQLのログ出力は行わない）
+        cls.engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+        cls.AsyncSessionLocal = async_sessionmaker(
+            bind=cls.engine,
             expire_on_commit=False,
             autoflush=False,
         )
 
-        # テーブル作成
-        async with self.engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-
-        # テーブルクリーンアップ処理を実行
-        async with self.engine.begin() as conn:
-            # 外部キー制約のため、子テーブルから削除
-            await conn.execute(text("DELETE FROM channels"))
-            await conn.execute(text("DELETE FROM messages"))
-            await conn.execute(text("DELETE FROM guild_members"))
-            await conn.execute(text("DELETE FROM guilds"))
-            await conn.execute(text("DELETE FROM friends"))
-            await conn.execute(text("DELETE FROM sessions"))
-            await conn.execute(text("DELETE FROM users"))
+        # テーブル作成はクラスで1回のみ行う
+        asyncio.run(cls._create_tables())
 
         # テスト用のデータベースセッション依存関数をオーバーライド
         async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
-            async with self.AsyncSessionLocal() as session:
+            async with cls.AsyncSessionLocal() as session:
                 yield session
 
         # テスト用のチャンネルアクセスチェック関数をオーバーライド（認証をスキップ）
@@ -59,13 +47,45 @@ class TestMessageAPI(unittest.IsolatedAsyncioTestCase):
             pass
 
         app.dependency_overrides[get_session] = override_get_session
+        # チャンネルアクセスチェックをモック
         app.dependency_overrides[check_channel_access] = override_check_channel_access
 
-        # 非同期でAsyncClientを初期化
-        self.client = AsyncClient(
+        # AsyncClient もクラス内で共有する
+        # （ASGITransport は接続を保持しないため、テストごとのイベントループをまたいで使用できる）
+        cls.client = AsyncClient(
             transport=ASGITransport(app=app), base_url="http://testserver"
         )
 
+    @classmethod
+    def tearDownClass(cls):
+        # 依存関数のオーバーライドを削除
+        app.dependency_overrides.clear()
+        # クライアントを破棄
+        asyncio.run(cls.client.aclose())
+
+    @classmethod
+    async def _create_tables(cls):
+        async with cls.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        # 別のイベントループで作成した接続を各テストで使わないよう破棄する
+        await cls.engine.dispose()
+
+    async def asyncSetUp(self):
+        # テスト環境であることを示す環境変数を設定
+        os.environ["TESTING"] = "true"
+
+        # テーブルクリーンアップ処理を実行（1回の TRUNCATE で全テーブルを空にする）
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "TRUNCATE messages, channels, guild_members, guilds, friends,"
+                    " sessions, users CASCADE"
+                )
+            )
+
+        # 前のテストでログイン時に設定された Cookie を引き継がないよう破棄
+        self.client.cookies.clear()
+
         # テスト用データを作成
         await self._create_test_data()
 
@@ -81,9 +101,6 @@ class TestMessageAPI(unittest.IsolatedAsyncioTestCase):
                 email="test@example.com",
                 password_hash="testpassword",
             )
-            session.add(test_user)
-            # ユーザーを先にコミットして、外部キー制約を満たす
-            await session.commit()
 
             # テスト用ギルド作成
             self.test_guild_id = uuid.uuid4()
@@ -92,17 +109,12 @@ class TestMessageAPI(unittest.IsolatedAsyncioTestCase):
                 name="Test Guild",
                 owner_user_id=self.test_user_id,
             )
-            session.add(test_guild)
-            # ギルドをコミット
-            await session.commit()
 
             # テスト用ギルドメンバー作成（アクセス権限のため）
             test_guild_member = GuildMember(
                 guild_id=self.test_guild_id,
                 user_id=self.test_user_id,
             )
-            session.add(test_guild_member)
-            await session.commit()
 
             # テスト用チャネル作成
             self.test_channel_id = uuid.uuid4()
@@ -113,9 +125,6 @@ class TestMessageAPI(unittest.IsolatedAsyncioTestCase):
                 name="general",
                 owner_user_id=self.test_user_id,
             )
-            session.add(test_channel)
-            # チャネルをコミット
-            await session.commit()
 
             # 返信元となるメッセージ作成
             self.test_original_message_id = uuid.uuid4()
@@ -126,8 +135,20 @@ class TestMessageAPI(unittest.IsolatedAsyncioTestCase):
                 type="default",
                 content="Original message for reply test",
             )
-            session.add(test_original_message)
-            # 最終コミット
+
+            # 関連（relationship）のないテーブル間の挿入順は保証されないため、
+            # 外部キーの参照先から順に flush し、コミットは1回にまとめる
+            session.add(test_user)
+            await session.flush()
+            session.add(test_guild)
+            await session.flush()
+            session.add_all(
+                [
+                    test_guild_member,
+                    test_channel,
+                    test_original_message,
+                ]
+            )
             await session.commit()
 
     async def asyncTearDown(self):
@@ -135,11 +156,7 @@ class TestMessageAPI(unittest.IsolatedAsyncioTestCase):
         if "TESTING" in os.environ:
             del os.environ["TESTING"]
 
-        # 依存関数のオーバーライドを削除
-        app.dependency_overrides.clear()
-        # クライアントを非同期に破棄
-        await self.client.aclose()
-        # エンジンを非同期に破棄
+        # テストごとのイベントループに紐づく接続を破棄（エンジン自体はクラスで共有）
         await self.engine.dispose()
 
     async def test_post_message_to_channel_success_normal_message(self):
@@ -202,7 +219,7 @@ class TestMessageAPI(unittest.IsolatedAsyncioTestCase):
         """
         Given: 存在しないユーザーIDを含むメッセージデータ
         When: POST /api/messages にリクエスト
-        Then: 404でチャンネルが見つからないエラーレスポンスが返る
+        Then: チャンネル不在（404）ではなく500のエラーレスポンスが返る
         """
 
         # Given: 存在しないユーザーIDを含むメッセージデータ
@@ -217,10 +234,36 @@ class TestMessageAPI(unittest.IsolatedAsyncioTestCase):
         # When: POST /api/messages にリクエスト
         response = await self.client.post("/api/messages", json=message_data)
 
-        # Then: 404でチャンネルが見つからないエラーレスポンスが返る
-        self.assertEqual(response.status_code, 404)
+        # Then: チャンネル不在（404）ではなく500のエラーレスポンスが返る
+        self.assertEqual(response.status_code, 500)
         res_json = response.json()
-        self.assertEqual(res_json["detail"], "指定されたチャンネルが見つかりません")
+        self.assertEqual(res_json["detail"], "メッセージの作成中にエラーが発生しました")
+
+    async def test_post_message_to_channel_failure_nonexistent_referenced_message(
+        self,
+    ):
+        """
+        Given: 存在するチャネルと、存在しない参照メッセージIDを含むメッセージデータ
+        When: POST /api/messages にリクエスト
+        Then: チャンネル不在（404）ではなく500のエラーレスポンスが返る
+        """
+
+        # Given: 存在しない参照メッセージIDを含むメッセージデータ
+        message_data = {
+            "channel_id": str(self.test_channel_id),
+            "user_id": str(self.test_user_id),
+            "type": "reply",
+            "content": "Reply to missing message",
+            "referenced_message_id": str(uuid.uuid4()),  # 存在しないメッセージID
+        }
+
+        # When: POST /api/messages にリクエスト
+        response = await self.client.post("/api/messages", json=message_data)
+
+        # Then: チャンネル不在（404）ではなく500のエラーレスポンスが返る
+        self.assertEqual(response.status_code, 500)
+        res_json = response.json()
+        self.assertNotEqual(res_json["detail"], "指定されたチャンネルが見つかりません")
 
     async def test_post_message_to_channel_failure_missing_required_field(self):
         """
@@ -2,6 +2,7 @@ import os
 import sys
 import unittest
 import uuid
+from datetime import datetime, timedelta, timezone
 
 from dotenv import load_dotenv
 from injector import Injector
@@ -22,7 +23,7 @@ class TestMessageRepository(unittest.IsolatedAsyncioTestCase):
     def setUpClass(cls):
         load_dotenv()
         DATABASE_URL = os.environ["DATABASE_URL_TEST"]
-        cls.engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+        cls.engine = create_async_engine(DATABASE_URL, echo=False, future=True)
         cls.AsyncSessionLocal = async_sessionmaker(
             bind=cls.engine,
             expire_on_commit=False,
@@ -34,16 +35,14 @@ class TestMessageRepository(unittest.IsolatedAsyncioTestCase):
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
-        # テーブルクリーンアップ処理を実行
+        # テーブルクリーンアップ処理を実行（1回の TRUNCATE で全テーブルを空にする）
         async with self.engine.begin() as conn:
-            # 外部キー制約のため、子テーブルから削除
-            await conn.execute(text("DELETE FROM channels"))
-            await conn.execute(text("DELETE FROM messages"))
-            await conn.execute(text("DELETE FROM guild_members"))
-            await conn.execute(text("DELETE FROM guilds"))
-            await conn.execute(text("DELETE FROM friends"))
-            await conn.execute(text("DELETE FROM sessions"))
-            await conn.execute(text("DELETE FROM users"))
+            await conn.execute(
+                text(
+                    "TRUNCATE messages, channels, guild_members, guilds, friends,"
+                    " sessions, users CASCADE"
+                )
+            )
 
         # テスト用DIコンテナからリポジトリを取得
         injector = Injector([configure])
@@ -178,6 +177,70 @@ class TestMessageRepository(unittest.IsolatedAsyncioTestCase):
         # 元の例外が保持されていることを確認
         self.assertIsNotNone(context.exception.original_error)
 
+    async def test_create_message_with_channel_update_success(self):
+        """
+        Given: 有効なメッセージ情報
+        When: create_message_with_channel_updateメソッドを呼び出す
+        Then: メッセージが作成され、チャネルの最終メッセージIDが更新されること
+        """
+
+        # Given: テスト用ユーザーとチャネルを作成
+        user = await self.create_test_user()
+        channel = await self.create_test_channel(uuid.UUID(str(user.id)))
+
+        message = Message(
+            channel_id=channel.id,
+            user_id=user.id,
+            type="default",
+            content="Hello, World!",
+        )
+
+        # When: メッセージを作成
+        async with self.AsyncSessionLocal() as session:
+            result = await self.repository.create_message_with_channel_update(
+                session, message
+            )
+            await session.commit()  # テスト用に明示的にcommit
+
+        # Then: メッセージが作成され、チャネルの最終メッセージIDが更新される
+        self.assertIsNotNone(result.id)
+        self.assertEqual(result.channel_id, channel.id)
+        self.assertEqual(result.content, "Hello, World!")
+        self.assertIsNotNone(result.created_at)
+
+        async with self.AsyncSessionLocal() as session:
+            last_message_id = await session.scalar(
+                text("SELECT last_message_id FROM channels WHERE id = :id"),
+                {"id": channel.id},
+            )
+        self.assertEqual(last_message_id, result.id)
+
+    async def test_create_message_with_channel_update_invalid_channel_id(self):
+        """
+        Given: 存在しないチャネルIDを持つメッセージ情報
+        When: create_message_with_channel_updateメソッドを呼び出す
+        Then: MessageCreateErrorが発生すること
+        """
+
+        # Given: テスト用ユーザーを作成（チャネルは作成しない）
+        user = await self.create_test_user()
+
+        message = Message(
+            channel_id=uuid.uuid4(),  # 存在しないチャネルID
+            user_id=user.id,
+            type="default",
+            content="Test message",
+        )
+
+        # When/Then: MessageCreateErrorが発生する
+        with self.assertRaises(MessageCreateError) as context:
+            async with self.AsyncSessionLocal() as session:
+                await self.repository.create_message_with_channel_update(
+                    session, message
+                )
+
+        self.assertIn("データベース制約違反", str(context.exception))
+
     async def test_get_message_by_channel_id_success(self):
         """
         Given: チャネルに複数のメッセージが存在する
@@ -190,24 +253,29 @@ class TestMessageRepository(unittest.IsolatedAsyncioTestCase):
         channel = await self.create_test_channel(uuid.UUID(str(user.id)))
 
         # 複数のメッセージを作成
+        # （同一トランザクション内では now() が同じ値になるため、作成日時を明示して順序を固定する）
+        base_time = datetime.now(timezone.utc)
         messages = [
             Message(
                 channel_id=channel.id,
                 user_id=user.id,
                 type="default",
                 content="First message",
+                created_at=base_time,
             ),
             Message(
                 channel_id=channel.id,
                 user_id=user.id,
                 type="default",
                 content="Second message",
+                created_at=base_time + timedelta(seconds=1),
             ),
             Message(
                 channel_id=channel.id,
                 user_id=user.id,
                 type="default",
                 content="Third message",
+                created_at=base_time + timedelta(seconds=2),
             ),
         ]
 
@@ -14,7 +14,11 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
 from dependencies import configure
 from domains import Base, Session, User
-from repository.session_repository import SessionCreateError, SessionRepositoryIf
+from repository.session_repository import (
+    SessionCreateError,
+    SessionRepositoryIf,
+)
+from utils.utils import hash_token
 
 
 class TestSessionRepository(unittest.IsolatedAsyncioTestCase):
@@ -22,7 +26,7 @@ class TestSessionRepository(unittest.IsolatedAsyncioTestCase):
     def setUpClass(cls):
         load_dotenv()
         DATABASE_URL = os.environ["DATABASE_URL_TEST"]
-        cls.engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+        cls.engine = create_async_engine(DATABASE_URL, echo=False, future=True)
         cls.AsyncSessionLocal = async_sessionmaker(
             bind=cls.engine,
             expire_on_commit=False,
@@ -34,16 +38,14 @@ class TestSessionRepository(unittest.IsolatedAsyncioTestCase):
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
-        # テーブルクリーンアップ処理を実行
+        # テーブルクリーンアップ処理を実行（1回の TRUNCATE で全テーブルを空にする）
         async with self.engine.begin() as conn:
-            # 外部キー制約のため、子テーブルから削除
-            await conn.execute(text("DELETE FROM channels"))
-            await conn.execute(text("DELETE FROM messages"))
-            await conn.execute(text("DELETE FROM guild_members"))
-            await conn.execute(text("DELETE FROM guilds"))
-            await conn.execute(text("DELETE FROM friends"))
-            await conn.execute(text("DELETE FROM sessions"))
-            await conn.execute(text("DELETE FROM users"))
+            await conn.execute(
+                text(
+                    "TRUNCATE messages, channels, guild_members, guilds, friends,"
+                    " sessions, users CASCADE"
+                )
+            )
 
         # テスト用DIコンテナからリポジトリを取得
         injector = Injector([configure])
@@ -96,8 +98,9 @@ class TestSessionRepository(unittest.IsolatedAsyncioTestCase):
 
         # Then
         self.assertEqual(result.user_id, session_data.user_id)
-        self.assertEqual(result.access_token, session_data.access_token)
-        self.assertEqual(result.refresh_token, session_data.refresh_token)
+        # トークンはSHA-256ダイジェストとして保存されること
+        self.assertEqual(result.access_token, hash_token("access_token_hash"))
+        self.assertEqual(result.refresh_token, hash_token("refresh_token_hash"))
         self.assertEqual(result.user_agent, session_data.user_agent)
         self.assertEqual(result.ip_address, session_data.ip_address)
         self.assertEqual(result.revoked_at, session_data.revoked_at)
@@ -166,6 +169,7 @@ class TestSessionRepository(unittest.IsolatedAsyncioTestCase):
         # 最初のセッション作成
         async with self.AsyncSessionLocal() as session:
             _ = await self.repository.create_session(session, session_data1)
+            await session.commit()  # テスト用に明示的にcommit
 
         # When / Then - 2回目のセッション作成（重複）
         # 重要: 新しいSessionオブジェクトインスタンスを作成
@@ -211,6 +215,7 @@ class TestSessionRepository(unittest.IsolatedAsyncioTestCase):
             created_session = await self.repository.create_session(
                 session, expected_session
             )
+            await session.commit()  # テスト用に明示的にcommit
 
         # When
         async with self.AsyncSessionLocal() as session:
@@ -294,11 +299,13 @@ class TestSessionRepository(unittest.IsolatedAsyncioTestCase):
 
         async with self.AsyncSessionLocal() as session:
             _ = await self.repository.create_session(session, session_data_1)
+            await session.commit()  # テスト用に明示的にcommit
 
         async with self.AsyncSessionLocal() as session:
             created_session_2 = await self.repository.create_session(
                 session, session_data_2
             )
+            await session.commit()  # テスト用に明示的にcommit
 
         # When
         async with self.AsyncSessionLocal() as session:
@@ -309,11 +316,65 @@ class TestSessionRepository(unittest.IsolatedAsyncioTestCase):
         # Then
         self.assertIsNotNone(result)
         self.assertEqual(result.id, created_session_2.id)  # type: ignore
-        self.assertEqual(result.access_token, "access_token_hash_2")  # type: ignore
-        self.assertEqual(result.refresh_token, "refresh_token_hash_2")  # type: ignore
+        self.assertEqual(result.access_token, hash_token("access_token_hash_2"))  # type: ignore
+        self.assertEqual(result.refresh_token, hash_token("refresh_token_hash_2"))  # type: ignore
         self.assertEqual(result.user_agent, "Browser 2")  # type: ignore
         self.assertEqual(result.ip_address, "192.168.1.2")  # type: ignore
 
+    async def test_get_user_by_access_token(self):
+        """
+        Given: 有効なセッションと無効化済みのセッションが登録済み
+        When: get_user_by_access_tokenメソッドを呼び出す
+        Then: 有効なセッションのみユーザーが返されること
+        """
+
+        # Given
+        now = datetime.now(timezone.utc)
+        access_expires = now + timedelta(hours=1)
+        refresh_expires = now + timedelta(days=30)
+
+        active_session = Session(
+            user_id=self.test_user.id,
+            access_token="access_token_active",
+            refresh_token="refresh_token_active",
+            revoked_at=None,
+            access_token_expires_at=access_expires,
+            refresh_token_expires_at=refresh_expires,
+        )
+        revoked_session = Session(
+            user_id=self.test_user.id,
+            access_token="access_token_revoked",
+            refresh_token="refresh_token_revoked",
+            revoked_at=now,
+            access_token_expires_at=access_expires,
+            refresh_token_expires_at=refresh_expires,
+        )
+
+        async with self.AsyncSessionLocal() as session:
+            await self.repository.create_session(session, active_session)
+            await self.repository.create_session(session, revoked_session)
+            await session.commit()  # テスト用に明示的にcommit
+
+        # When
+        async with self.AsyncSessionLocal() as session:
+            active = await self.repository.get_user_by_access_token(
+                session, "access_token_active"
+            )
+            revoked = await self.repository.get_user_by_access_token(
+                session, "access_token_revoked"
+            )
+            missing = await self.repository.get_user_by_access_token(
+                session, "access_token_missing"
+            )
+
+        # Then
+        self.assertIsNotNone(active)
+        if active is not None:
+            self.assertEqual(active.id, self.test_user.id)
+            self.assertEqual(active.username, self.test_user.username)
+        self.assertIsNone(revoked)
+        self.assertIsNone(missing)
+
     async def test_create_session_invalid_user_id(self):
         """
         Given: 存在しないuser_idでのセッション作成
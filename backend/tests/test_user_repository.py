@@ -1,19 +1,24 @@
 import os
 import sys
 import unittest
+import uuid
 from unittest.mock import AsyncMock
 
 from dotenv import load_dotenv
 from injector import Injector
-from sqlalchemy import text
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 # テストファイルのルートディレクトリからの相対パスでsrcフォルダを指定
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
 
 from dependencies import configure
-from domains import Base, User
-from repository.user_repository import UserCreateError, UserRepositoryIf
+from domains import Base, Guild, GuildMember, User
+from repository.user_repository import (
+    BULK_COPY_THRESHOLD,
+    UserCreateError,
+    UserRepositoryIf,
+)
 
 
 class TestUserRepository(unittest.IsolatedAsyncioTestCase):
@@ -21,7 +26,7 @@ class TestUserRepository(unittest.IsolatedAsyncioTestCase):
     def setUpClass(cls):
         load_dotenv()
         DATABASE_URL = os.environ["DATABASE_URL_TEST"]
-        cls.engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+        cls.engine = create_async_engine(DATABASE_URL, echo=False, future=True)
         cls.AsyncSessionLocal = async_sessionmaker(
             bind=cls.engine,
             expire_on_commit=False,
@@ -33,16 +38,14 @@ class TestUserRepository(unittest.IsolatedAsyncioTestCase):
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
-        # テーブルクリーンアップ処理を実行
+        # テーブルクリーンアップ処理を実行（1回の TRUNCATE で全テーブルを空にする）
         async with self.engine.begin() as conn:
-            # 外部キー制約のため、子テーブルから削除
-            await conn.execute(text("DELETE FROM channels"))
-            await conn.execute(text("DELETE FROM messages"))
-            await conn.execute(text("DELETE FROM guild_members"))
-            await conn.execute(text("DELETE FROM guilds"))
-            await conn.execute(text("DELETE FROM friends"))
-            await conn.execute(text("DELETE FROM sessions"))
-            await conn.execute(text("DELETE FROM users"))
+            await conn.execute(
+                text(
+                    "TRUNCATE messages, channels, guild_members, guilds, friends,"
+                    " sessions, users CASCADE"
+                )
+            )
 
         # テスト用DIコンテナからユースケースを取得
         injector = Injector([configure])
@@ -73,6 +76,9 @@ class TestUserRepository(unittest.IsolatedAsyncioTestCase):
             result = await self.repository.create_user(session, user_data)
 
         # Then
+        self.assertIsNotNone(result.id)
+        self.assertIsNotNone(result.created_at)
+        self.assertIsNotNone(result.updated_at)
         self.assertEqual(result.name, user_data.name)
         self.assertEqual(result.username, user_data.username)
         self.assertEqual(result.email, user_data.email)
@@ -113,6 +119,159 @@ class TestUserRepository(unittest.IsolatedAsyncioTestCase):
             async with self.AsyncSessionLocal() as session:
                 _ = await self.repository.create_user(session, user_data2)
 
+    async def test_create_user_with_guild(self):
+        """
+        Given: 有効なユーザー作成リクエスト
+        When: create_user_with_guildメソッドを呼び出す
+        Then: ユーザーと @me ギルド、そのギルドメンバーが同時に作成されること
+        """
+
+        # Given
+        user_data = User(
+            name="Test User",
+            username="testuser",
+            email="test@example.com",
+            password_hash="hashed_password",
+            description="Test description",
+        )
+
+        # When
+        async with self.AsyncSessionLocal() as session:
+            result, guild_id = await self.repository.create_user_with_guild(
+                session, user_data
+            )
+            await session.commit()  # テスト用に明示的にcommit
+
+        # Then
+        self.assertIsNotNone(result.id)
+        self.assertIsNotNone(result.created_at)
+        self.assertIsNotNone(result.updated_at)
+        self.assertEqual(result.username, user_data.username)
+        self.assertEqual(result.password_hash, user_data.password_hash)
+
+        async with self.AsyncSessionLocal() as session:
+            guild = await session.get(Guild, guild_id)
+            members = (
+                await session.scalars(
+                    select(GuildMember).where(GuildMember.guild_id == guild_id)
+                )
+            ).all()
+
+        self.assertEqual(guild.name, "@me")
+        self.assertEqual(guild.owner_user_id, result.id)
+        self.assertEqual(len(members), 1)
+        self.assertEqual(members[0].user_id, result.id)
+        self.assertEqual(members[0].role, "member")
+
+    async def test_create_user_with_guild_duplicate(self):
+        """
+        Given: 既存のユーザーと重複するユーザー情報
+        When: create_user_with_guildメソッドを呼び出す
+        Then: 例外が発生し、ギルドも作成されないこと
+        """
+
+        # Given
+        async with self.AsyncSessionLocal() as session:
+            _ = await self.repository.create_user_with_guild(
+                session,
+                User(
+                    name="Test User",
+                    username="testuser",
+                    email="test@example.com",
+                    password_hash="hashed_password",
+                ),
+            )
+            await session.commit()  # テスト用に明示的にcommit
+
+        # When / Then
+        with self.assertRaises(UserCreateError):
+            async with self.AsyncSessionLocal() as session:
+                _ = await self.repository.create_user_with_guild(
+                    session,
+                    User(
+                        name="Test User",
+                        username="testuser",
+                        email="test@example.com",
+                        password_hash="hashed_password",
+                    ),
+                )
+
+        async with self.AsyncSessionLocal() as session:
+            guilds = (await session.scalars(select(Guild))).all()
+
+        self.assertEqual(len(guilds), 1)
+
+    async def test_create_users_bulk(self):
+        """
+        Given: 閾値未満と閾値以上の件数のユーザー情報
+        When: create_users_bulkメソッドを呼び出す
+        Then: すべてのユーザーが作成されること
+        """
+
+        # Given
+        small_batch = [
+            User(
+                name=f"Small User {i}",
+                username=f"small{i}",
+                email=f"small{i}@example.com",
+                password_hash="hashed_password",
+            )
+            for i in range(3)
+        ]
+        large_batch = [
+            User(
+                name=f"Large User {i}",
+                username=f"large{i}",
+                email=f"large{i}@example.com",
+                password_hash="hashed_password",
+            )
+            for i in range(BULK_COPY_THRESHOLD)
+        ]
+
+        # When
+        async with self.AsyncSessionLocal() as session:
+            await self.repository.create_users_bulk(session, small_batch)
+            await self.repository.create_users_bulk(session, large_batch)
+            await session.commit()  # テスト用に明示的にcommit
+
+        # Then
+        async with self.AsyncSessionLocal() as session:
+            count = await session.scalar(text("SELECT count(*) FROM users"))
+            copied = await self.repository.get_user_by_username(session, "large0")
+
+        self.assertEqual(count, len(small_batch) + len(large_batch))
+        self.assertIsNotNone(copied)
+        self.assertIsNotNone(copied.created_at)  # type: ignore
+
+    async def test_create_users_bulk_copy_rollback(self):
+        """
+        Given: 閾値以上の件数のユーザー情報と、まだ文を実行していないセッション
+        When: create_users_bulkメソッドを呼び出した後にロールバックする
+        Then: COPY で書き込んだユーザーも取り消されること
+        """
+
+        # Given
+        users = [
+            User(
+                name=f"Large User {i}",
+                username=f"large{i}",
+                email=f"large{i}@example.com",
+                password_hash="hashed_password",
+            )
+            for i in range(BULK_COPY_THRESHOLD)
+        ]
+
+        # When
+        async with self.AsyncSessionLocal() as session:
+            await self.repository.create_users_bulk(session, users)
+            await session.rollback()
+
+        # Then
+        async with self.AsyncSessionLocal() as session:
+            count = await session.scalar(text("SELECT count(*) FROM users"))
+
+        self.assertEqual(count, 0)
+
     async def test_get_user_found(self):
         """
         Given: 既存のユーザー情報が登録済み
@@ -164,6 +323,107 @@ class TestUserRepository(unittest.IsolatedAsyncioTestCase):
         # Then
         self.assertIsNone(result)
 
+    async def test_get_users_by_id(self):
+        """
+        Given: 複数のユーザーが登録済み
+        When: get_users_by_idメソッドでIDリストを指定
+        Then: 指定したIDのユーザーのみが返されること
+        """
+
+        # Given
+        async with self.AsyncSessionLocal() as session:
+            created_users = [
+                await self.repository.create_user(
+                    session,
+                    User(
+                        name=f"Test User {i}",
+                        username=f"testuser{i}",
+                        email=f"test{i}@example.com",
+                        password_hash="hashed_password",
+                    ),
+                )
+                for i in range(3)
+            ]
+            await session.commit()  # テスト用に明示的にcommit
+
+        target_ids = [str(created_users[0].id), str(created_users[2].id)]
+
+        # When
+        async with self.AsyncSessionLocal() as session:
+            result = await self.repository.get_users_by_id(session, target_ids)
+
+        # Then
+        self.assertEqual({str(user["id"]) for user in result}, set(target_ids))
+        self.assertNotIn("password_hash", result[0])
+
+    async def test_get_users_by_usernames(self):
+        """
+        Given: 2人のユーザーが登録済み
+        When: get_users_by_usernamesメソッドで登録済みと未登録のユーザー名を指定
+        Then: 登録済みのユーザーのみがユーザー名をキーとして返されること
+        """
+
+        # Given
+        async with self.AsyncSessionLocal() as session:
+            for username in ("testuser1", "testuser2"):
+                _ = await self.repository.create_user(
+                    session,
+                    User(
+                        name="Test User",
+                        username=username,
+                        email=f"{username}@example.com",
+                        password_hash="hashed_password",
+                    ),
+                )
+            await session.commit()  # テスト用に明示的にcommit
+
+        # When
+        async with self.AsyncSessionLocal() as session:
+            result = await self.repository.get_users_by_usernames(
+                session, ["testuser1", "testuser2", "nonexistuser"]
+            )
+
+        # Then
+        self.assertEqual(set(result), {"testuser1", "testuser2"})
+        self.assertEqual(result["testuser1"].email, "testuser1@example.com")
+        self.assertEqual(result["testuser2"].email, "testuser2@example.com")
+
+    async def test_get_users_by_id_single(self):
+        """
+        Given: 既存のユーザーが登録済み
+        When: get_users_by_idメソッドでIDを1件だけ指定
+        Then: 該当するユーザー1件が返され、存在しないIDでは空リストが返されること
+        """
+
+        # Given
+        async with self.AsyncSessionLocal() as session:
+            created_user = await self.repository.create_user(
+                session,
+                User(
+                    name="Test User",
+                    username="testuser",
+                    email="test@example.com",
+                    password_hash="hashed_password",
+                ),
+            )
+            await session.commit()  # テスト用に明示的にcommit
+
+        # When
+        async with self.AsyncSessionLocal() as session:
+            found = await self.repository.get_users_by_id(
+                session, [str(created_user.id)]
+            )
+            missing = await self.repository.get_users_by_id(
+                session, [str(uuid.uuid4())]
+            )
+
+        # Then
+        self.assertEqual(len(found), 1)
+        self.assertEqual(found[0]["id"], created_user.id)
+        self.assertEqual(found[0]["username"], "testuser")
+        self.assertNotIn("password_hash", found[0])
+        self.assertEqual(missing, [])
+
 
 if __name__ == "__main__":
     unittest.main()
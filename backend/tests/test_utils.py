@@ -0,0 +1,126 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import jwt
+
+# テストファイルのルートディレクトリからの相対パスでsrcフォルダを指定
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from utils.utils import _verified_token_cache, create_token, verify_token
+
+
+class TestVerifyToken(unittest.TestCase):
+    def setUp(self):
+        # テスト間でキャッシュを共有しないようにクリア
+        _verified_token_cache.clear()
+
+    def tearDown(self):
+        _verified_token_cache.clear()
+
+    def test_verify_token_cache_hit_skips_decode(self):
+        """
+        Given: 一度検証されたアクセストークン
+        When: 同じトークンを再度verify_tokenで検証する
+        Then: jwt.decodeが呼ばれず、同じペイロードが返されること
+        """
+
+        # Given
+        token = create_token({"sub": "testuser"}, token_type="access")
+        first = verify_token(token, "access")
+
+        # When
+        with patch("utils.utils.jwt.decode") as mock_decode:
+            second = verify_token(token, "access")
+
+        # Then
+        mock_decode.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual(second["sub"], "testuser")
+
+    def test_verify_token_returns_copy(self):
+        """
+        Given: キャッシュ済みのアクセストークン
+        When: 返されたペイロードを呼び出し側で書き換える
+        Then: 次回の検証結果に書き換えが反映されないこと
+        """
+
+        # Given
+        token = create_token({"sub": "testuser"}, token_type="access")
+        payload = verify_token(token, "access")
+
+        # When
+        payload["sub"] = "attacker"
+        payload["type"] = "refresh"
+
+        # Then
+        cached = verify_token(token, "access")
+        self.assertEqual(cached["sub"], "testuser")
+        self.assertEqual(cached["type"], "access")
+
+    def test_verify_token_expired_exp_evicted_before_ttl(self):
+        """
+        Given: キャッシュのTTL内だが、ペイロードのexpを過ぎたトークン
+        When: verify_tokenで検証する
+        Then: キャッシュから削除されて再検証され、Noneが返されること
+        """
+
+        # Given
+        token = create_token({"sub": "testuser"}, token_type="access")
+        payload = verify_token(token, "access")
+
+        # When
+        with (
+            patch("utils.utils.time") as mock_time,
+            patch(
+                "utils.utils.jwt.decode", side_effect=jwt.ExpiredSignatureError
+            ) as mock_decode,
+        ):
+            mock_time.time.return_value = payload["exp"] + 1
+            result = verify_token(token, "access")
+
+        # Then
+        self.assertIsNone(result)
+        mock_decode.assert_called_once()
+        self.assertIsNone(_verified_token_cache.get(token))
+
+    def test_verify_token_type_mismatch_on_cached_payload(self):
+        """
+        Given: アクセストークンとしてキャッシュ済みのトークン
+        When: リフレッシュトークンとしてverify_tokenで検証する
+        Then: jwt.decodeを呼ばずにNoneが返されること
+        """
+
+        # Given
+        token = create_token({"sub": "testuser"}, token_type="access")
+        self.assertIsNotNone(verify_token(token, "access"))
+
+        # When
+        with patch("utils.utils.jwt.decode") as mock_decode:
+            result = verify_token(token, "refresh")
+
+        # Then
+        self.assertIsNone(result)
+        mock_decode.assert_not_called()
+
+    def test_verify_token_invalid_token(self):
+        """
+        Given: 署名が不正なトークン
+        When: verify_tokenで検証する
+        Then: Noneが返され、キャッシュされないこと
+        """
+
+        # Given
+        token = "invalid.token.value"
+
+        # When
+        result = verify_token(token, "access")
+
+        # Then
+        self.assertIsNone(result)
+        self.assertIsNone(_verified_token_cache.get(token))
+
+
+if __name__ == "__main__":
+    unittest.main()